@@ -0,0 +1,103 @@
+"""
+AI tick 전송 방식 벤치마크: 어르신별 /ai/tick vs 묶음 /ai/tick/batch
+
+실행 (BackEnd 디렉토리에서):
+    python -m benchmarks.ai_tick_bench
+
+기본으로 스텁 AI 서버(sample/dummy_ai/ai_stub_serv.py)를 같은 프로세스에서 ASGI로 호출합니다.
+실제 네트워크 비용을 포함하려면 스텁 서버를 띄우고 AI_BENCH_URL을 지정합니다.
+    uvicorn sample.dummy_ai.ai_stub_serv:app --port 9000
+    AI_BENCH_URL=http://localhost:9000 python -m benchmarks.ai_tick_bench
+
+Redis 조회 비용을 빼기 위해 센서 상태는 메모리에 미리 만들어 둔 값을 사용합니다.
+"""
+import asyncio
+import datetime
+import os
+import time
+from typing import Dict, List, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+# web.services 모듈은 import 시점에 .env의 DB/Redis 설정을 읽습니다. (접속은 하지 않습니다)
+load_dotenv(dotenv_path=".env")
+
+from common.models.enums import SensorTypeEnum
+from sample.dummy_ai.ai_stub_serv import app as stub_app
+from web.schemas.monitoring_schema import FrontendSensorItem, FrontendSensorStatusPayload
+from web.services.ai_tick import AiTickDispatcher
+
+SENIOR_COUNTS = [100, 1_000, 10_000]
+CONCURRENCY = 50
+BATCH_SIZE = 1_000
+AI_BENCH_URL = os.getenv("AI_BENCH_URL")
+
+
+class InMemorySensorStatusManager:
+    """미리 만들어 둔 센서 상태를 반환하는 SensorStatusManager 대용"""
+
+    def __init__(self, count: int):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        sensor_types = list(SensorTypeEnum)
+        self.snapshots: Dict[int, FrontendSensorStatusPayload] = {
+            senior_id: FrontendSensorStatusPayload(
+                senior_id=senior_id,
+                sensors=[
+                    FrontendSensorItem(
+                        sensor_id=sensor_type.value,
+                        sensor_type=sensor_type.value.split("_", 1)[0],
+                        location=sensor_type.value.split("_", 1)[1],
+                        value=(senior_id + index) % 3 == 0,
+                        last_updated=now,
+                    )
+                    for index, sensor_type in enumerate(sensor_types)
+                ],
+            )
+            for senior_id in range(count)
+        }
+
+    async def get_all_sensor_statuses(self, senior_id: int) -> Optional[FrontendSensorStatusPayload]:
+        return self.snapshots.get(senior_id)
+
+    async def get_many_sensor_statuses(self, senior_ids: List[int]) -> Dict[int, Optional[FrontendSensorStatusPayload]]:
+        return {senior_id: self.snapshots.get(senior_id) for senior_id in senior_ids}
+
+
+async def time_cycle(sens_man: InMemorySensorStatusManager, count: int, batch_size: int) -> float:
+    dispatcher = AiTickDispatcher(
+        AI_BENCH_URL or "http://ai-stub",
+        sens_man,
+        concurrency=CONCURRENCY,
+        request_timeout=60,
+        cycle_deadline=600,
+        http2=False,
+        batch_size=batch_size,
+    )
+    if AI_BENCH_URL is None:
+        dispatcher._client = httpx.AsyncClient(
+            base_url="http://ai-stub", transport=httpx.ASGITransport(app=stub_app)
+        )
+    try:
+        started = time.perf_counter()
+        await dispatcher.run_cycle(list(range(count)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await dispatcher.close()
+    assert dispatcher.sent == count, dispatcher.stats()
+    return elapsed
+
+
+async def main():
+    target = AI_BENCH_URL or "in-process ASGI stub"
+    print(f"target: {target}, concurrency: {CONCURRENCY}, batch size: {BATCH_SIZE}")
+    print(f"{'seniors':>8} | {'per-senior (ms)':>15} | {'batched (ms)':>12} | speedup")
+    for count in SENIOR_COUNTS:
+        sens_man = InMemorySensorStatusManager(count)
+        single_s = await time_cycle(sens_man, count, batch_size=0)
+        batch_s = await time_cycle(sens_man, count, batch_size=BATCH_SIZE)
+        print(f"{count:>8} | {single_s * 1000:>15.1f} | {batch_s * 1000:>12.1f} | {single_s / batch_s:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+"""
+센서 로그 수신 본문 디코딩 벤치마크: JSON + Pydantic vs msgpack + msgspec
+
+실행 (BackEnd 디렉토리에서, DB/Redis 없이 실행됩니다):
+    python -m benchmarks.ingest_decode_bench
+
+센서 이벤트 1,000건당 디코딩 시간(마이크로초)과 본문 크기를 출력합니다.
+"""
+import datetime
+import time
+
+from common.models.enums import SensorTypeEnum
+from web.schemas.iot_schema import SensorDataItem, SensorLogPayload
+from web.services.ingest_codec import decode_sensor_log_msgpack, encode_sensor_log_msgpack
+
+EVENT_COUNTS = [10, 1_000, 10_000]
+REPEAT = 50
+
+
+def make_payload(count: int) -> SensorLogPayload:
+    sensor_types = list(SensorTypeEnum)
+    start = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    return SensorLogPayload(
+        api_key="bench-api-key",
+        sensor_data=[
+            SensorDataItem(
+                sensor_type=sensor_types[i % len(sensor_types)],
+                sensor_value=i % 2 == 0,
+                timestamp=start - datetime.timedelta(milliseconds=i),
+            )
+            for i in range(count)
+        ],
+    )
+
+
+def time_decode(decode, body: bytes) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        decode(body)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    print(f"{'events':>8} | {'json bytes':>10} | {'msgpack bytes':>13} | {'json us/1k':>10} | {'msgpack us/1k':>13} | speedup")
+    for count in EVENT_COUNTS:
+        payload = make_payload(count)
+        json_body = payload.model_dump_json().encode()
+        msgpack_body = encode_sensor_log_msgpack(payload)
+
+        json_time = time_decode(SensorLogPayload.model_validate_json, json_body)
+        msgpack_time = time_decode(decode_sensor_log_msgpack, msgpack_body)
+
+        per_1k = 1_000_000 * 1_000 / count
+        print(
+            f"{count:>8} | {len(json_body):>10} | {len(msgpack_body):>13} | "
+            f"{json_time * per_1k:>10.1f} | {msgpack_time * per_1k:>13.1f} | {json_time / msgpack_time:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+센서 로그 적재 경로 벤치마크: multi-row INSERT vs COPY
+
+실행 (BackEnd 디렉토리에서, .env 의 TEST_DB_NAME DB를 사용합니다):
+    python -m benchmarks.sensor_log_insert_bench
+
+각 경로는 별도 트랜잭션에서 실행한 뒤 롤백하므로 테스트 DB에 데이터가 남지 않습니다.
+"""
+import asyncio
+import datetime
+import os
+import time
+from typing import List
+
+from dotenv import load_dotenv
+
+from common.models.enums import SensorTypeEnum
+from common.modules.db_manager import PostgressqlSessionManager
+from common.modules.sensor_log_manager import SensorLogManager
+from common.modules.user_manager import SeniorCreate, UserManager
+
+ROW_COUNTS = [10, 1_000, 100_000]
+REPEAT = 3
+
+
+def make_rows(senior_id: int, count: int) -> List[dict]:
+    sensor_types = list(SensorTypeEnum)
+    start = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        {
+            "senior_id": senior_id,
+            "timestamp": start - datetime.timedelta(milliseconds=i),
+            "sensor_type": sensor_types[i % len(sensor_types)].value,
+            "sensor_value": i % 2 == 0,
+            "event_description": None,
+        }
+        for i in range(count)
+    ]
+
+
+async def time_path(manager: PostgressqlSessionManager, senior_id: int, rows: List[dict], use_copy: bool) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        async with manager.AsyncSessionMaker() as session:
+            async with session.begin() as transaction:
+                started = time.perf_counter()
+                await SensorLogManager(session).add_log_rows(rows, use_copy=use_copy)
+                await session.flush()
+                best = min(best, time.perf_counter() - started)
+                await transaction.rollback()
+    return best
+
+
+async def main():
+    load_dotenv(dotenv_path=".env")
+    manager = PostgressqlSessionManager(
+        db_user=os.getenv("DB_ROOT_USER"),
+        db_password=os.getenv("DB_ROOT_PW"),
+        db_host=os.getenv("DB_HOST"),
+        db_port=os.getenv("POSTGRES_PORT"),
+        db_name=os.getenv("TEST_DB_NAME"),
+    )
+    await manager.create_db_and_tables()
+    await manager.convert_to_hypertable("sensor_logs", "timestamp")
+
+    async with manager.AsyncSessionMaker() as session:
+        senior = await UserManager(session).create_senior(
+            SeniorCreate(full_name="bench", address="bench", birth_date=datetime.date(1940, 1, 1))
+        )
+        await session.commit()
+
+    print(f"{'rows':>8} | {'INSERT (ms)':>12} | {'COPY (ms)':>10} | {'speedup':>7}")
+    for count in ROW_COUNTS:
+        rows = make_rows(senior.senior_id, count)
+        insert_s = await time_path(manager, senior.senior_id, rows, use_copy=False)
+        copy_s = await time_path(manager, senior.senior_id, rows, use_copy=True)
+        print(f"{count:>8} | {insert_s * 1000:>12.1f} | {copy_s * 1000:>10.1f} | {insert_s / copy_s:>6.2f}x")
+
+    await manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""
+센서 상태 조회 벤치마크: 센서별 키 + SCAN (이전 형식) vs 어르신별 Hash 하나 (현재 형식)
+
+실행 (BackEnd 디렉토리에서, .env 의 REDIS_* 설정을 사용합니다):
+    python -m benchmarks.sensor_status_read_bench
+
+- SENIOR_COUNT(기본 10,000)명의 어르신 x 전체 센서 상태를 두 형식으로 모두 기록한 뒤,
+  tick 한 주기처럼 모든 어르신의 센서 상태를 읽는 시간을 잽니다.
+- 이전 형식은 어르신마다 키 공간 전체를 SCAN 하므로 한 주기를 모두 돌리면 너무 오래 걸립니다.
+  LEGACY_SAMPLE명만 읽고 한 주기 시간으로 환산합니다.
+- 실제 데이터와 겹치지 않도록 큰 senior_id(SENIOR_ID_BASE부터)를 사용하고, 끝나면 모두 삭제합니다.
+"""
+import asyncio
+import datetime
+import os
+import time
+from typing import List
+
+from dotenv import load_dotenv
+
+# web.services 모듈은 import 시점에 .env 설정을 읽습니다. (접속은 하지 않습니다)
+load_dotenv(dotenv_path=".env")
+
+from common.models.enums import SensorTypeEnum
+from common.modules.db_manager import RedisSessionManager
+from web.services.senior_status_manager import SensorStatusManager
+
+SENIOR_COUNT = int(os.getenv("BENCH_SENIOR_COUNT", "10000"))
+LEGACY_SAMPLE = int(os.getenv("BENCH_LEGACY_SAMPLE", "20"))
+SENIOR_ID_BASE = 900_000_000
+LEGACY_KEY_PREFIX = "sensor:status"
+
+
+async def seed(redis_client, sens_man: SensorStatusManager, senior_ids: List[int]) -> None:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    sensor_types = list(SensorTypeEnum)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for senior_id in senior_ids:
+            state = {}
+            for i, sensor_type in enumerate(sensor_types):
+                value = (senior_id + i) % 2 == 0
+                sensor_id = sensor_type.value
+                kind, _, location = sensor_id.partition("_")
+                await pipe.hset(
+                    f"{LEGACY_KEY_PREFIX}:{senior_id}:{sensor_id}",
+                    mapping={
+                        "sensor_type": kind,
+                        "location": location,
+                        "value": "1" if value else "0",
+                        "last_updated": now.isoformat(),
+                    },
+                )
+                state[sensor_id] = SensorStatusManager.pack_state(value, now)
+            await pipe.hset(sens_man._get_key(senior_id), mapping=state)
+        await pipe.execute()
+
+
+async def read_legacy(redis_client, senior_id: int) -> int:
+    """이전 get_all_sensor_statuses와 같은 방식: SCAN으로 키를 찾고 pipeline으로 HGETALL"""
+    keys = [key async for key in redis_client.scan_iter(match=f"{LEGACY_KEY_PREFIX}:{senior_id}:*")]
+    async with redis_client.pipeline() as pipe:
+        for key in keys:
+            await pipe.hgetall(key)
+        results = await pipe.execute()
+    return len(results)
+
+
+async def cleanup(redis_client, sens_man: SensorStatusManager, senior_ids: List[int]) -> None:
+    sensor_ids = [sensor_type.value for sensor_type in SensorTypeEnum]
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for senior_id in senior_ids:
+            await pipe.unlink(
+                sens_man._get_key(senior_id),
+                *(f"{LEGACY_KEY_PREFIX}:{senior_id}:{sensor_id}" for sensor_id in sensor_ids),
+            )
+        await pipe.execute()
+
+
+async def main():
+    red = RedisSessionManager(
+        host=os.getenv("REDIS_HOST"),
+        port=os.getenv("REDIS_PORT"),
+        password=os.getenv("REDIS_PASSWORD"),
+    )
+    redis_client = await red.get_client()
+    sens_man = SensorStatusManager(red)
+    senior_ids = [SENIOR_ID_BASE + i for i in range(SENIOR_COUNT)]
+
+    print(f"seniors: {SENIOR_COUNT}, sensors per senior: {len(SensorTypeEnum)}")
+    await seed(redis_client, sens_man, senior_ids)
+    try:
+        print(f"keys in Redis: {await redis_client.dbsize()}")
+
+        sample = senior_ids[:LEGACY_SAMPLE]
+        started = time.perf_counter()
+        for senior_id in sample:
+            await read_legacy(redis_client, senior_id)
+        legacy_per_senior = (time.perf_counter() - started) / len(sample)
+
+        started = time.perf_counter()
+        for senior_id in sample:
+            await sens_man.get_all_sensor_statuses(senior_id)
+        hash_per_senior = (time.perf_counter() - started) / len(sample)
+
+        started = time.perf_counter()
+        statuses = await sens_man.get_many_sensor_statuses(senior_ids)
+        hash_cycle = time.perf_counter() - started
+        assert all(statuses.values())
+
+        legacy_cycle = legacy_per_senior * SENIOR_COUNT
+        print(f"{'layout':<28} | {'per senior (ms)':>15} | {'full cycle (s)':>14}")
+        print(f"{'SCAN + per-sensor keys':<28} | {legacy_per_senior * 1000:>15.2f} | {legacy_cycle:>14.1f} (estimated)")
+        print(f"{'HGETALL, one hash/senior':<28} | {hash_per_senior * 1000:>15.2f} | {hash_cycle:>14.2f} (pipelined)")
+        print(f"speedup per cycle: {legacy_cycle / hash_cycle:.0f}x")
+    finally:
+        await cleanup(redis_client, sens_man, senior_ids)
+        await redis_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,167 @@
+"""
+다중 노드 Socket.IO 벤치마크: Redis 매니저를 통한 노드 간 emit 지연과 노드별 연결 수
+
+실행 (BackEnd 디렉토리에서, .env 의 REDIS_* 설정을 사용합니다):
+    python -m benchmarks.socketio_cluster_bench
+
+- BENCH_NODES(기본 2)개의 Socket.IO 노드를 서로 다른 포트의 별도 프로세스로 띄웁니다.
+  각 노드는 web.services.websocket 과 같은 방식(AsyncRedisManager)으로 Redis pub/sub에 연결됩니다.
+  실제 서버와 채널이 겹치지 않도록 별도 채널(socketio-bench)을 사용합니다.
+- 연결: 노드마다 BENCH_CLIENTS_PER_NODE개의 클라이언트를 동시에 연결하고,
+  연결에 걸린 시간과 각 노드가 보고하는 연결 수/메모리(RSS)를 출력합니다.
+- 지연: 노드 0에 연결한 클라이언트가 relay 이벤트를 보내면 노드 0이 대상 sid로 emit 합니다.
+  대상이 같은 노드(로컬)일 때와 다른 노드(Redis 경유)일 때 왕복 시간을 BENCH_EMITS번 잽니다.
+  클라이언트는 모두 이 프로세스에 있으므로 같은 시계로 잽니다.
+
+클라이언트에는 aiohttp가 필요합니다. (pip install aiohttp)
+"""
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=".env")
+
+import socketio
+
+from web.services.websocket import redis_manager_url
+
+NODE_COUNT = int(os.getenv("BENCH_NODES", "2"))
+CLIENTS_PER_NODE = int(os.getenv("BENCH_CLIENTS_PER_NODE", "200"))
+EMIT_COUNT = int(os.getenv("BENCH_EMITS", "500"))
+BASE_PORT = int(os.getenv("BENCH_BASE_PORT", "8100"))
+BENCH_CHANNEL = "socketio-bench"
+
+
+# --- 노드 프로세스 ---
+
+
+def _rss_kb() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def run_node(port: int) -> None:
+    import uvicorn
+
+    sio = socketio.AsyncServer(
+        async_mode="asgi",
+        client_manager=socketio.AsyncRedisManager(redis_manager_url(), channel=BENCH_CHANNEL),
+    )
+
+    @sio.on("relay")
+    async def relay(sid, data):
+        await sio.emit("relayed", data, to=data["to"])
+
+    @sio.on("node_stats")
+    async def node_stats(sid):
+        connections = sum(1 for _ in sio.manager.get_participants("/", None))
+        return {"port": port, "connections": connections, "rss_kb": _rss_kb()}
+
+    uvicorn.run(socketio.ASGIApp(sio), host="127.0.0.1", port=port, log_level="warning")
+
+
+# --- 벤치마크 실행 프로세스 ---
+
+
+async def wait_for_node(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def connect_clients(port: int, count: int) -> List[socketio.AsyncClient]:
+    clients = [socketio.AsyncClient() for _ in range(count)]
+    await asyncio.gather(
+        *(client.connect(f"http://127.0.0.1:{port}", transports=["websocket"]) for client in clients)
+    )
+    return clients
+
+
+async def measure_latency(sender: socketio.AsyncClient, receiver: socketio.AsyncClient) -> List[float]:
+    """sender -> 노드 -> (Redis) -> receiver 왕복 시간 목록 (ms)"""
+    pending: Dict[int, asyncio.Future] = {}
+
+    async def on_relayed(data):
+        future = pending.pop(data["seq"], None)
+        if future is not None:
+            future.set_result(time.perf_counter())
+
+    receiver.on("relayed", on_relayed)
+    loop = asyncio.get_running_loop()
+    latencies = []
+    for seq in range(EMIT_COUNT):
+        pending[seq] = loop.create_future()
+        started = time.perf_counter()
+        await sender.emit("relay", {"to": receiver.get_sid(), "seq": seq})
+        received = await asyncio.wait_for(pending[seq], timeout=5)
+        latencies.append((received - started) * 1000)
+    return latencies
+
+
+def summarize(latencies: List[float]) -> str:
+    quantiles = statistics.quantiles(latencies, n=100)
+    return f"p50 {quantiles[49]:>6.2f} | p95 {quantiles[94]:>6.2f} | p99 {quantiles[98]:>6.2f}"
+
+
+async def main():
+    ports = [BASE_PORT + i for i in range(NODE_COUNT)]
+    nodes = [
+        subprocess.Popen([sys.executable, "-m", "benchmarks.socketio_cluster_bench", "--node", str(port)])
+        for port in ports
+    ]
+    clients_by_port: Dict[int, List[socketio.AsyncClient]] = {}
+    try:
+        await asyncio.gather(*(wait_for_node(port) for port in ports))
+        print(f"nodes: {NODE_COUNT}, clients per node: {CLIENTS_PER_NODE}, redis: {redis_manager_url().split('@')[-1]}")
+
+        print(f"{'node':<6} | {'connect (s)':>11} | {'conn/s':>8} | {'connections':>11} | {'rss (MB)':>8}")
+        for port in ports:
+            started = time.perf_counter()
+            clients_by_port[port] = await connect_clients(port, CLIENTS_PER_NODE)
+            elapsed = time.perf_counter() - started
+            stats = await clients_by_port[port][0].call("node_stats")
+            print(
+                f"{port:<6} | {elapsed:>11.2f} | {CLIENTS_PER_NODE / elapsed:>8.0f} | "
+                f"{stats['connections']:>11} | {stats['rss_kb'] / 1024:>8.1f}"
+            )
+
+        sender = clients_by_port[ports[0]][0]
+        print(f"emit latency over {EMIT_COUNT} emits (ms)")
+        local = await measure_latency(sender, clients_by_port[ports[0]][1])
+        print(f"{'same node':<12} | {summarize(local)}")
+        if NODE_COUNT > 1:
+            remote = await measure_latency(sender, clients_by_port[ports[1]][0])
+            print(f"{'cross node':<12} | {summarize(remote)}")
+    finally:
+        for clients in clients_by_port.values():
+            await asyncio.gather(*(client.disconnect() for client in clients), return_exceptions=True)
+        for node in nodes:
+            node.terminate()
+        for node in nodes:
+            node.wait()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--node":
+        run_node(int(sys.argv[2]))
+    else:
+        asyncio.run(main())
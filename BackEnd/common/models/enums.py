@@ -12,4 +12,8 @@ class SensorTypeEnum(str, enum.Enum):
     LIGHT_LIVINGROOM = "light_livingroom"
     LIGHT_BATHROOM = "light_bathroom"
     POWER_TV = "power_tv"
-    
\ No newline at end of file
+
+
+# 바이너리(msgpack) 수신 형식에서 사용하는 센서 정수 코드 (코드 = 이 목록의 인덱스)
+# 허브 펌웨어와 공유하는 값이므로 새 센서는 반드시 SensorTypeEnum의 맨 뒤에 추가해야 합니다.
+SENSOR_TYPE_CODES = list(SensorTypeEnum)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import TIMESTAMP
+from sqlalchemy import TIMESTAMP, Index, PrimaryKeyConstraint, text
 from sqlmodel import Field, Relationship, SQLModel, Column
 from .enums import SensorTypeEnum
 
@@ -28,16 +28,24 @@ class SensorLog(SQLModel, table=True):
     
     참고: 이 테이블은 생성 후 TimescaleDB의 'create_hypertable' 함수를 사용하여
     하이퍼테이블로 전환해야 합니다.
-    ex) SELECT create_hypertable('sensorlog', 'timestamp');
+    ex) SELECT create_hypertable('sensor_logs', 'timestamp');
+
+    기본 키는 (senior_id, sensor_type, timestamp)입니다. 서로 다른 어르신/센서의 이벤트가
+    같은 시각에 들어와도 충돌하지 않고, 같은 센서의 중복 재전송만 ON CONFLICT로 걸러집니다.
+    어르신별 시간순 조회는 (senior_id, timestamp DESC) 인덱스를 사용합니다.
+    기존 DB는 migrations/sensor_logs_composite_pk.py로 전환합니다.
     """
     __tablename__ = "sensor_logs"
+    __table_args__ = (
+        PrimaryKeyConstraint("senior_id", "sensor_type", "timestamp", name="sensor_logs_pkey"),
+        Index("ix_sensor_logs_senior_id_timestamp", "senior_id", text("timestamp DESC")),
+    )
 
     timestamp: datetime = Field(
-        sa_column=Column(TIMESTAMP(timezone=True), primary_key=True)
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=False)
     )
     
     sensor_type: SensorTypeEnum = Field(
-        index=True, 
         description="센서 위치 또는 고유 ID"
     )
     
@@ -52,6 +60,5 @@ class SensorLog(SQLModel, table=True):
 
     senior_id: int = Field(
         foreign_key="seniors.senior_id", 
-        index=True,
         description="로그를 남긴 어르신 ID"
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,32 @@
+from typing import Dict
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class AiWeightManager:
+    """
+    AI 모델 가중치(AIWeight) 관련 데이터베이스 작업을 처리하는 클래스
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.session = db_session
+
+    async def get_active_weight_paths(self) -> Dict[int, str]:
+        """
+        어르신별로 현재 사용 중인(is_active) 가중치 파일 경로를 조회합니다. (Raw SQL 사용)
+        활성 가중치가 여러 개면 가장 높은 버전을 사용합니다.
+
+        Returns:
+            Dict[int, str]: senior_id -> storage_path
+        """
+        query = text(
+            """
+            SELECT DISTINCT ON (senior_id) senior_id, storage_path
+            FROM ai_weights
+            WHERE is_active
+            ORDER BY senior_id, version DESC
+            """
+        )
+        result = await self.session.execute(query)
+        return {row.senior_id: row.storage_path for row in result.all()}
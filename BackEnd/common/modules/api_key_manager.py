@@ -6,6 +6,7 @@ import secrets
 from sqlmodel import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .hub_cache import HubCache, hub_cache
 from .iot_hub_manager import HubUpdate, IotHubManager, HubBasicInfo
 
 load_dotenv(dotenv_path=".env")
@@ -42,9 +43,10 @@ class ApiKeyManager:
 
 
 class ApiKeyRepository:
-    def __init__(self, session: AsyncSession):  # DB 세션을 주입받음
+    def __init__(self, session: AsyncSession, cache: HubCache = hub_cache):  # DB 세션을 주입받음
         self.session = session
         self.iot_hub_manager = IotHubManager(session)
+        self.cache = cache
 
     async def check_key_duplicated(self, hashed_key: str) -> bool:
         """key 중복을 확인하는 메서드"""
@@ -65,11 +67,22 @@ class ApiKeyRepository:
         await self.iot_hub_manager.edit_hub_info(
             hub_id=hub_id, update_data=HubUpdate(api_key_hash=hashed_key)
         )
+        # 기존 키(허브 ID 기준)와 새 키 모두 캐시에서 제거합니다.
+        await self.cache.invalidate_hub(hub_id)
+        await self.cache.invalidate(hashed_key)
 
     async def get_hub_by_api_key(self, api_key: str) -> HubBasicInfo | None:
-        """api 키를 통해 hub정보를 가져옵니다."""
+        """api 키를 통해 hub정보를 가져옵니다. 캐시에 있으면 DB를 조회하지 않습니다."""
         hashed_key = ApiKeyManager.hash_api_key(api_key)
-        return await self.iot_hub_manager.get_hub_by_api_key_hash(hashed_key)
+
+        hub_info = await self.cache.get(hashed_key)
+        if hub_info is not None:
+            return hub_info
+
+        hub_info = await self.iot_hub_manager.get_hub_by_api_key_hash(hashed_key)
+        if hub_info is not None:
+            await self.cache.set(hashed_key, hub_info)
+        return hub_info
 
     async def is_correct_key(self, api_key: str, hub_id: int) -> bool:
         """제공된 API 키가 저장된 해시와 일치하는지 확인합니다."""
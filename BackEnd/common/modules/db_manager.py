@@ -13,6 +13,29 @@ from sqlmodel import SQLModel
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
 import redis.asyncio as redis
+from redis.asyncio.connection import BlockingConnectionPool
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+from common.modules.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+# Redis 연결 풀 최대 연결 수 (pub/sub 구독도 연결을 하나씩 계속 사용합니다)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+# 연결이 모두 사용 중일 때 빈 연결을 기다리는 최대 시간 (초)
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+# 명령 응답을 기다리는 최대 시간 (초). XREADGROUP BLOCK 등 블로킹 명령의 대기 시간보다 길어야 합니다.
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "2"))
+# 이 시간(초) 넘게 쓰지 않은 연결은 사용 전에 PING으로 확인합니다. (0이면 확인하지 않음)
+REDIS_HEALTH_CHECK_INTERVAL = float(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+# 연결 오류/타임아웃 시 재시도 횟수와 지수 백오프 (base * 2^n 초, 최대 cap 초)
+REDIS_RETRY_ATTEMPTS = int(os.getenv("REDIS_RETRY_ATTEMPTS", "3"))
+REDIS_RETRY_BACKOFF_BASE = float(os.getenv("REDIS_RETRY_BACKOFF_BASE", "0.05"))
+REDIS_RETRY_BACKOFF_CAP = float(os.getenv("REDIS_RETRY_BACKOFF_CAP", "1"))
+# 2: RESP2 (기본값), 3: RESP3 (Redis 6 이상, 클라이언트 측 캐싱 등 RESP3 전용 기능용)
+REDIS_PROTOCOL = int(os.getenv("REDIS_PROTOCOL", "2"))
 
 
 class PostgressqlSessionManager:
@@ -30,20 +53,20 @@ class PostgressqlSessionManager:
         )
 
     async def create_db_and_tables(self):
-        print("데이터베이스 테이블 생성을 시도합니다...")
+        logger.info("데이터베이스 테이블 생성을 시도합니다...")
         try:
             async with self.engine.begin() as conn:
                 await conn.run_sync(SQLModel.metadata.create_all)
                 await conn.commit()
-                print("--- Database tables created successfully. ---")
+                logger.info("Database tables created successfully.")
 
         except OperationalError as e:
-            print(f"데이터베이스 연결에 실패했습니다: {e}")
+            logger.error("데이터베이스 연결에 실패했습니다: %s", e)
         except Exception as e:
-            print(f"테이블 생성 중 예상치 못한 오류가 발생했습니다: {e}")
+            logger.exception("테이블 생성 중 예상치 못한 오류가 발생했습니다: %s", e)
 
     async def convert_to_hypertable(self, table_name: str, time_column_name: str):
-        print(f"'{table_name}' 테이블을 하이퍼테이블로 전환합니다...")
+        logger.info("'%s' 테이블을 하이퍼테이블로 전환합니다...", table_name)
         try:
             async with self.engine.connect() as connection:
                 command = text(
@@ -51,20 +74,18 @@ class PostgressqlSessionManager:
                 )
                 await connection.execute(command)
                 await connection.commit()
-                print(
-                    f"'{table_name}' 테이블이 하이퍼테이블로 성공적으로 전환되었습니다."
-                )
+                logger.info("'%s' 테이블이 하이퍼테이블로 성공적으로 전환되었습니다.", table_name)
         except Exception as e:
             if "already a hypertable" in str(e).lower():
-                print(f"'{table_name}' 테이블은 이미 하이퍼테이블입니다.")
+                logger.info("'%s' 테이블은 이미 하이퍼테이블입니다.", table_name)
             else:
-                print(f"하이퍼테이블 전환 중 오류 발생: {e}")
+                logger.error("하이퍼테이블 전환 중 오류 발생: %s", e)
 
     async def clear_all_tables(self, force: bool = False):
         if not force:
             return
 
-        print("\n데이터베이스의 모든 테이블 삭제를 시작합니다...")
+        logger.warning("데이터베이스의 모든 테이블 삭제를 시작합니다...")
         try:
             async with self.engine.connect() as connection:
                 async with self.engine.connect() as connection:
@@ -83,7 +104,7 @@ class PostgressqlSessionManager:
                     await connection.commit()
 
         except Exception as e:
-            print(f"데이터베이스 작업 중 오류가 발생했습니다: {e}")
+            logger.error("데이터베이스 작업 중 오류가 발생했습니다: %s", e)
 
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.AsyncSessionMaker() as session:
@@ -93,11 +114,95 @@ class PostgressqlSessionManager:
         return self.AsyncSessionMaker()
 
 
+class MeteredConnectionPool(BlockingConnectionPool):
+    """
+    연결이 모두 사용 중이면 timeout 동안 기다리는 Redis 연결 풀 + 사용량 지표
+
+    기본 ConnectionPool은 사실상 제한 없이 새 연결을 만들지만, 이 풀은 max_connections를 넘지 않고
+    빈 연결을 기다립니다. 연결을 얻으려고 기다리는 요청 수(waiting, 새 연결을 맺는 중인 요청 포함)로
+    풀이 부족한지 확인할 수 있습니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self.max_waiting = 0
+        self.acquired = 0
+        self.wait_timeouts = 0
+
+    async def get_connection(self, *args, **kwargs):
+        # 빈 연결이 있으면 await 중에 양보하지 않으므로, 지표를 조회하는 시점의 waiting은 실제로 기다리는 요청 수입니다.
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except RedisConnectionError as e:
+            if "No connection available" in str(e):
+                self.wait_timeouts += 1
+            raise
+        finally:
+            self.waiting -= 1
+        self.acquired += 1
+        return connection
+
+    def stats(self) -> dict:
+        in_use = len(self._in_use_connections)
+        idle = len(self._available_connections)
+        return {
+            "max_connections": self.max_connections,
+            "created": in_use + idle,
+            "in_use": in_use,
+            "idle": idle,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "acquired": self.acquired,
+            "wait_timeouts": self.wait_timeouts,
+        }
+
+
 class RedisSessionManager:
-    def __init__(self, host, port, password):
-        self.redis_client = redis.Redis(
-            host=host, port=port, password=password, decode_responses=True
+    """
+    Redis 클라이언트와 연결 풀을 관리하는 클래스
+
+    연결 풀 크기, 소켓 타임아웃, health check, 재시도(지수 백오프)를 REDIS_* 환경 변수로 설정합니다.
+    Redis가 잠시 멈춰도 명령이 socket_timeout 안에 실패하거나 재시도되므로 핸들러가 무한정 멈추지 않습니다.
+    """
+
+    def __init__(
+        self,
+        host,
+        port,
+        password,
+        db: int = 0,
+        max_connections: int = REDIS_MAX_CONNECTIONS,
+        pool_timeout: float = REDIS_POOL_TIMEOUT,
+        socket_timeout: float = REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout: float = REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval: float = REDIS_HEALTH_CHECK_INTERVAL,
+        retry_attempts: int = REDIS_RETRY_ATTEMPTS,
+        retry_backoff_base: float = REDIS_RETRY_BACKOFF_BASE,
+        retry_backoff_cap: float = REDIS_RETRY_BACKOFF_CAP,
+        protocol: int = REDIS_PROTOCOL,
+    ):
+        self.protocol = protocol
+        retry = Retry(ExponentialBackoff(cap=retry_backoff_cap, base=retry_backoff_base), retry_attempts)
+        retry_on_error = [RedisConnectionError, RedisTimeoutError]
+        self.pool = MeteredConnectionPool(
+            host=host,
+            port=port,
+            password=password,
+            db=db,
+            decode_responses=True,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+            health_check_interval=health_check_interval,
+            retry=retry,
+            retry_on_error=retry_on_error,
+            protocol=protocol,
         )
+        self.redis_client = redis.Redis(connection_pool=self.pool, retry=retry, retry_on_error=retry_on_error)
 
     async def get_client(self):
         return self.redis_client
@@ -105,8 +210,11 @@ class RedisSessionManager:
     async def ping(self):
         try:
             await self.redis_client.ping()
-            print("Redis에 성공적으로 연결되었습니다.")
+            logger.info("Redis에 성공적으로 연결되었습니다.")
             return True
-        except redis.exceptions.ConnectionError as e:
-            print(f"Redis 연결 실패: {e}")
-            return False
\ No newline at end of file
+        except RedisConnectionError as e:
+            logger.error("Redis 연결 실패: %s", e)
+            return False
+
+    def stats(self) -> dict:
+        return {"protocol": self.protocol, **self.pool.stats()}
@@ -0,0 +1,148 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from common.modules.db_manager import RedisSessionManager
+from common.schemas.hub_schema import HubBasicInfo
+
+HUB_CACHE_TTL_SECONDS = int(os.getenv("HUB_CACHE_TTL", "30"))
+HUB_CACHE_MAX_SIZE = int(os.getenv("HUB_CACHE_MAX_SIZE", "10000"))
+
+
+class HubCache:
+    """
+    API 키 해시 -> 허브 정보(HubBasicInfo) 조회 결과를 보관하는 TTL/LRU 캐시
+
+    프로세스 내부 캐시를 1차로 사용하고, Redis가 연결되어 있으면 2차 캐시로 함께 사용합니다.
+    허브 정보가 바뀌는 경로(edit_hub_info, update_hash_for_hub)에서 명시적으로 무효화해야 합니다.
+    커밋 전에 무효화하면 그 사이 다른 요청이 커밋 전(이전) 정보를 다시 캐시할 수 있으므로, 커밋 후에도 한 번 더 무효화합니다.
+    다른 워커 프로세스의 내부 캐시는 TTL이 지나야 갱신되므로 TTL은 짧게 유지합니다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = HUB_CACHE_TTL_SECONDS,
+        max_size: int = HUB_CACHE_MAX_SIZE,
+        redis_session_manager: Optional[RedisSessionManager] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.red_sess = redis_session_manager
+
+        # api_key_hash -> (만료 시각, 허브 정보), 최근 사용한 항목이 뒤쪽에 위치합니다.
+        self._entries: "OrderedDict[str, Tuple[float, HubBasicInfo]]" = OrderedDict()
+        # hub_id -> api_key_hash (허브 ID 기준 무효화용 역색인)
+        self._hash_by_hub: Dict[int, str] = {}
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def use_redis(self, redis_session_manager: RedisSessionManager) -> None:
+        """Redis를 2차 캐시로 사용하도록 설정합니다."""
+        self.red_sess = redis_session_manager
+
+    def _get_key(self, key_type: str, value) -> str:
+        return f"hubcache:{key_type}:{value}"
+
+    def _put_local(self, api_key_hash: str, hub: HubBasicInfo) -> None:
+        self._entries[api_key_hash] = (time.monotonic() + self.ttl_seconds, hub)
+        self._entries.move_to_end(api_key_hash)
+        self._hash_by_hub[hub.hub_id] = api_key_hash
+
+        while len(self._entries) > self.max_size:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._hash_by_hub.pop(evicted.hub_id, None)
+
+    def _pop_local(self, api_key_hash: str) -> None:
+        entry = self._entries.pop(api_key_hash, None)
+        if entry:
+            self._hash_by_hub.pop(entry[1].hub_id, None)
+
+    async def get(self, api_key_hash: str) -> Optional[HubBasicInfo]:
+        """캐시에서 허브 정보를 조회합니다. 없거나 만료되었으면 None을 반환합니다."""
+        entry = self._entries.get(api_key_hash)
+        if entry:
+            expires_at, hub = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(api_key_hash)
+                self.hits += 1
+                return hub
+            self._pop_local(api_key_hash)
+
+        if self.red_sess is not None:
+            redis_client = await self.red_sess.get_client()
+            hub_json = await redis_client.get(self._get_key("key", api_key_hash))
+            if hub_json:
+                hub = HubBasicInfo.model_validate(json.loads(hub_json))
+                self._put_local(api_key_hash, hub)
+                self.redis_hits += 1
+                return hub
+
+        self.misses += 1
+        return None
+
+    async def set(self, api_key_hash: str, hub: HubBasicInfo) -> None:
+        """조회한 허브 정보를 캐시에 저장합니다."""
+        self._put_local(api_key_hash, hub)
+
+        if self.red_sess is not None:
+            redis_client = await self.red_sess.get_client()
+            async with redis_client.pipeline() as pipe:
+                await pipe.set(
+                    self._get_key("key", api_key_hash),
+                    hub.model_dump_json(),
+                    ex=self.ttl_seconds,
+                )
+                await pipe.set(
+                    self._get_key("hub", hub.hub_id), api_key_hash, ex=self.ttl_seconds
+                )
+                await pipe.execute()
+
+    async def invalidate(self, api_key_hash: str) -> None:
+        """API 키 해시에 해당하는 캐시 항목을 삭제합니다."""
+        self.invalidations += 1
+        self._pop_local(api_key_hash)
+
+        if self.red_sess is not None:
+            redis_client = await self.red_sess.get_client()
+            await redis_client.delete(self._get_key("key", api_key_hash))
+
+    async def invalidate_hub(self, hub_id: int) -> None:
+        """허브 ID에 연결된 캐시 항목을 삭제합니다."""
+        self.invalidations += 1
+        api_key_hash = self._hash_by_hub.pop(hub_id, None)
+        if api_key_hash:
+            self._entries.pop(api_key_hash, None)
+
+        if self.red_sess is not None:
+            redis_client = await self.red_sess.get_client()
+            hub_key = self._get_key("hub", hub_id)
+            cached_hash = await redis_client.getdel(hub_key)
+            if cached_hash:
+                await redis_client.delete(self._get_key("key", cached_hash))
+
+    def clear(self) -> None:
+        """프로세스 내부 캐시와 카운터를 초기화합니다."""
+        self._entries.clear()
+        self._hash_by_hub.clear()
+        self.hits = self.redis_hits = self.misses = self.invalidations = 0
+
+    def stats(self) -> dict:
+        """캐시 적중/실패 카운터를 반환합니다."""
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+        }
+
+
+# 모든 ApiKeyRepository/IotHubManager 인스턴스가 공유하는 캐시
+hub_cache = HubCache()
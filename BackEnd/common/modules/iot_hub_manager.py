@@ -5,6 +5,7 @@ from sqlmodel import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.models.iot_models import IoTHub
+from common.modules.hub_cache import hub_cache
 from common.schemas.hub_schema import *
 
 
@@ -86,6 +87,10 @@ class IotHubManager:
                 f"edit_hub_info - Hub with hub_id:{hub_id} not found or no changes made."
             )
 
+        # 허브 정보가 바뀌었으므로 API 키 조회 캐시를 무효화합니다.
+        # 커밋 전이라 그 사이 다른 요청이 이전 정보를 다시 캐시할 수 있으므로, 호출하는 쪽에서 커밋 후 한 번 더 무효화해야 합니다.
+        await hub_cache.invalidate_hub(hub_id)
+
     async def get_hub_status(self, hub_id: int) -> Optional[HubStatus]:
         """허브 ID로 허브의 현재 상태를 조회하여 _HubStatus 객체로 반환합니다."""
         query = text("SELECT status FROM iot_hubs WHERE hub_id = :hub_id")
@@ -98,10 +103,12 @@ class IotHubManager:
         return HubStatus(status=status_str)
 
     async def set_hub_status(self, hub_id: int, status: str) -> None:
-        """허브 ID에 해당하는 허브의 상태를 변경합니다."""
+        """허브 ID에 해당하는 허브의 상태를 변경합니다. (커밋 후 hub_cache.invalidate_hub를 한 번 더 호출해야 합니다)"""
 
         query = text("UPDATE iot_hubs SET status = :status WHERE hub_id = :hub_id")
         result = await self.session.execute(query, {"hub_id": hub_id, "status": status})
 
         if result.rowcount == 0:
             raise ValueError("set_hub_status- invalid hub_id:{hub_id}")
+
+        await hub_cache.invalidate_hub(hub_id)
@@ -0,0 +1,143 @@
+"""
+백엔드 공통 로깅 설정
+
+- 모듈마다 get_logger(__name__)로 로거를 만들고, LOG_LEVEL 미만의 로그는 호출 시점에 바로 버려집니다.
+- 로그 레코드는 큐에만 넣고, 포맷팅과 stdout 쓰기는 QueueListener 스레드에서 합니다.
+  이벤트 루프는 출력 I/O를 기다리지 않습니다.
+- LOG_FORMAT=json 이면 한 줄에 JSON 객체 하나로 출력합니다. (logger.info(..., extra={"senior_id": 1})의
+  추가 필드도 함께 출력합니다.) 기본값 text는 사람이 읽기 쉬운 한 줄 형식입니다.
+- 요청/이벤트마다 찍히는 로그는 extra=sampled()를 넘기면 LOG_SAMPLE_EVERY개 중 한 개만 남깁니다.
+"""
+import atexit
+import itertools
+import json
+import logging
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# text: 사람이 읽는 한 줄 형식, json: 한 줄에 JSON 하나 (로그 수집기용)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+# sampled() 로그를 몇 개 중 한 개만 남길지 (1이면 모두 남김)
+LOG_SAMPLE_EVERY = int(os.getenv("LOG_SAMPLE_EVERY", "100"))
+
+# LogRecord 기본 속성 (이 외의 속성은 extra로 넘긴 구조화 필드로 봅니다)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName", "sample_every"}
+
+_listener: Optional[QueueListener] = None
+
+
+def sampled(every: int = LOG_SAMPLE_EVERY) -> dict:
+    """빈도가 높은 로그에 extra로 넘겨 every개 중 한 개만 남깁니다."""
+    return {"sample_every": every}
+
+
+def _extra_fields(record: logging.LogRecord) -> dict:
+    return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRS}
+
+
+class SamplingFilter(logging.Filter):
+    """sample_every가 지정된 레코드를 (로거, 메시지 형식)별로 every개 중 한 개만 통과시킵니다."""
+
+    def __init__(self):
+        super().__init__()
+        self._counters: Dict[tuple, itertools.count] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        every = getattr(record, "sample_every", 1)
+        if every <= 1:
+            return True
+        counter = self._counters.setdefault((record.name, record.msg), itertools.count())
+        return next(counter) % every == 0
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            **_extra_fields(record),
+        }
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = _extra_fields(record)
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """포맷팅을 QueueListener 스레드로 미루기 위해 레코드를 그대로 큐에 넣습니다."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(level: str = LOG_LEVEL, log_format: str = LOG_FORMAT) -> None:
+    """
+    루트 로거를 큐 기반 핸들러로 설정합니다. 여러 번 호출해도 한 번만 설정됩니다.
+    uvicorn 등 다른 라이브러리 로그도 같은 형식과 큐를 거쳐 출력됩니다.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter() if log_format == "json" else TextFormatter())
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        logging.getLogger(name).handlers = []
+        logging.getLogger(name).propagate = True
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def setup_child_logging(level: str = LOG_LEVEL, log_format: str = LOG_FORMAT) -> None:
+    """
+    자식 프로세스(ProcessPoolExecutor 워커 등)의 로깅을 설정합니다. (initializer로 사용)
+    fork로 복사된 큐 핸들러는 부모의 리스너 스레드가 없어 출력되지 않으므로 stdout에 바로 씁니다.
+    """
+    global _listener
+    _listener = None
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter() if log_format == "json" else TextFormatter())
+    stream_handler.addFilter(SamplingFilter())
+    root = logging.getLogger()
+    root.handlers = [stream_handler]
+    root.setLevel(level)
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 리스너 스레드를 종료합니다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(name)
@@ -0,0 +1,146 @@
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional
+
+from common.modules.db_manager import PostgressqlSessionManager, RedisSessionManager
+from common.modules.log_manager import get_logger
+from common.modules.user_manager import UserManager
+from common.schemas.user import SeniorRosterEntry
+
+logger = get_logger(__name__)
+
+# 놓친 pub/sub 메시지를 보완하기 위해 새 어르신을 DB에서 증분 조회하는 간격 (초)
+SENIOR_ROSTER_REFRESH_INTERVAL = float(os.getenv("SENIOR_ROSTER_REFRESH_INTERVAL", "60"))
+SENIOR_ROSTER_CHANNEL = "roster:seniors"
+
+
+class SeniorRoster:
+    """
+    백그라운드 작업(AI tick 등)이 사용하는 어르신 목록 캐시 (senior_id -> ID/이름)
+
+    처음 한 번만 seniors 테이블을 읽고, 이후에는
+    - create_senior/edit_senior 커밋 후 publish()가 보낸 Redis pub/sub 메시지로 즉시 갱신하고,
+    - 메시지를 놓친 경우에 대비해 주기적으로 마지막 senior_id 이후의 새 어르신만 증분 조회합니다.
+    백그라운드 작업의 반복문에서는 DB를 읽지 않고 senior_ids()만 사용합니다.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = SENIOR_ROSTER_REFRESH_INTERVAL,
+        channel: str = SENIOR_ROSTER_CHANNEL,
+    ):
+        self.refresh_interval = refresh_interval
+        self.channel = channel
+        self._entries: Dict[int, SeniorRosterEntry] = {}
+        self._max_senior_id = 0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._stopped = False
+
+        self.full_loads = 0
+        self.incremental_loads = 0
+        self.messages = 0
+        self.last_refresh_at: Optional[float] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def apply(self, entry: SeniorRosterEntry) -> None:
+        """어르신 한 명을 추가하거나 갱신합니다."""
+        self._entries[entry.senior_id] = entry
+        self._max_senior_id = max(self._max_senior_id, entry.senior_id)
+
+    def apply_message(self, data: str) -> None:
+        """pub/sub 메시지(SeniorRosterEntry JSON)를 반영합니다."""
+        self.apply(SeniorRosterEntry.model_validate_json(data))
+        self.messages += 1
+
+    async def refresh(self, db_session_manager: PostgressqlSessionManager) -> int:
+        """
+        아직 적재하지 않은 어르신(senior_id > 마지막으로 본 ID)만 DB에서 읽어 반영합니다.
+        처음 호출하면 전체 목록을 읽습니다.
+
+        Returns:
+            int: 새로 반영한 어르신 수
+        """
+        async with self._lock:
+            async for session in db_session_manager.get_session():
+                entries = await UserManager(session).get_senior_roster(self._max_senior_id)
+            for entry in entries:
+                self.apply(entry)
+
+            if self._loaded:
+                self.incremental_loads += 1
+            else:
+                self.full_loads += 1
+                self._loaded = True
+            self.last_refresh_at = time.time()
+            return len(entries)
+
+    async def ensure_loaded(self, db_session_manager: PostgressqlSessionManager) -> None:
+        """아직 한 번도 적재하지 않았으면 전체 목록을 읽습니다."""
+        if not self._loaded:
+            await self.refresh(db_session_manager)
+
+    def senior_ids(self) -> List[int]:
+        """캐시된 어르신 ID 목록 (senior_id 오름차순)"""
+        return sorted(self._entries)
+
+    def get(self, senior_id: int) -> Optional[SeniorRosterEntry]:
+        return self._entries.get(senior_id)
+
+    async def publish(self, redis_session_manager: RedisSessionManager, entry: SeniorRosterEntry) -> None:
+        """
+        어르신 생성/수정을 모든 워커의 목록 캐시에 알립니다. DB 커밋 이후에 호출해야 합니다.
+        현재 프로세스의 캐시에는 바로 반영합니다.
+        """
+        self.apply(entry)
+        redis_client = await redis_session_manager.get_client()
+        await redis_client.publish(self.channel, entry.model_dump_json())
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    async def run(
+        self, db_session_manager: PostgressqlSessionManager, redis_session_manager: RedisSessionManager
+    ) -> None:
+        """pub/sub 메시지를 반영하고, refresh_interval마다 새 어르신을 증분 조회합니다."""
+        redis_client = await redis_session_manager.get_client()
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        logger.info("Senior roster started. channel: %s", self.channel)
+
+        next_refresh = 0.0
+        try:
+            while not self._stopped:
+                try:
+                    # 구독을 먼저 시작한 뒤 적재해야 그 사이의 변경을 놓치지 않습니다.
+                    if time.monotonic() >= next_refresh:
+                        await self.refresh(db_session_manager)
+                        next_refresh = time.monotonic() + self.refresh_interval
+
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        self.apply_message(message["data"])
+                except Exception as e:
+                    # ❗ 예외가 나도 갱신 작업이 멈추지 않도록 함
+                    logger.exception("An error occurred in senior roster: %s", e)
+                    await asyncio.sleep(1)
+        finally:
+            await pubsub.unsubscribe(self.channel)
+            await pubsub.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "full_loads": self.full_loads,
+            "incremental_loads": self.incremental_loads,
+            "messages": self.messages,
+            "last_refresh_at": self.last_refresh_at,
+        }
+
+
+# 모든 백그라운드 작업이 공유하는 어르신 목록
+senior_roster = SeniorRoster()
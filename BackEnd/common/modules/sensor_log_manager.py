@@ -1,28 +1,63 @@
-from typing import List
+import os
+from typing import TYPE_CHECKING, List, Optional
 from sqlmodel import text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.models.enums import SensorTypeEnum
 from common.models.iot_models import SensorLog
 from common.modules.user_manager import UserManager
 from common.schemas.sensor_log import SensorLogInfo, SensorLogList
 
+if TYPE_CHECKING:
+    from common.modules.sensor_log_queue import SensorLogQueue
+
+# asyncpg의 쿼리 파라미터 한도(32767)를 넘지 않도록 한 INSERT 문에 담는 최대 행 수
+MAX_ROWS_PER_INSERT = 5000
+# 이 행 수 이상이면 multi-row INSERT 대신 COPY 경로를 사용합니다.
+COPY_THRESHOLD_ROWS = int(os.getenv("SENSOR_LOG_COPY_THRESHOLD", "2000"))
+
+_COPY_COLUMNS = ["timestamp", "sensor_type", "sensor_value", "event_description", "senior_id"]
+_STAGING_TABLE = "sensor_logs_staging"
+
 
 class SensorLogManager:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, write_queue: Optional["SensorLogQueue"] = None):
+        """
+        write_queue를 넘기면 write-behind 모드로 동작합니다.
+        add_logs는 로그를 Redis Stream에 적재만 하고, 실제 INSERT는 SensorLogFlusher가 모아서 수행합니다.
+        """
         self.session = session
         self.user_man = UserManager(session)
+        self.write_queue = write_queue
 
-    async def add_logs(self, senior_id: int, logs_data: List[SensorLogInfo]) -> None:
+    async def add_logs(
+        self,
+        senior_id: int,
+        logs_data: List[SensorLogInfo],
+        senior_verified: bool = False,
+    ) -> None:
         """
         여러 개의 센서 로그를 데이터베이스에 한 번의 쿼리로 효율적으로 추가합니다.
         TimescaleDB의 대량 삽입(bulk insert) 성능을 활용합니다.
+
+        senior_verified가 True이면 호출자가 이미 어르신 존재를 확인한 것으로 보고 조회를 생략합니다.
         """
-        is_id_exit =  await self.user_man.get_senior_info_by_id(senior_id)
-        if not logs_data or not is_id_exit:
+        if not logs_data:
+            raise ValueError(f"add_logs - Empty logs for senior_id: {senior_id}")
+        if not senior_verified and not await self.user_man.senior_exists(senior_id):
             raise ValueError(f"add_logs - Invalid senior_id: {senior_id}")
 
-        values_to_insert = [
+        if self.write_queue is not None:
+            await self.write_queue.enqueue(senior_id, logs_data)
+            return
+
+        await self.add_log_rows(self.to_rows(senior_id, logs_data))
+
+    @staticmethod
+    def to_rows(senior_id: int, logs_data: List[SensorLogInfo]) -> List[dict]:
+        """센서 로그 목록을 add_log_rows에 넘길 행(dict) 목록으로 변환합니다."""
+        return [
             {
                 "senior_id": senior_id,
                 "timestamp": log.timestamp,
@@ -33,9 +68,73 @@ class SensorLogManager:
             for log in logs_data
         ]
 
-        stmt = pg_insert(SensorLog).values(values_to_insert).on_conflict_do_nothing()
+    async def add_log_rows(self, rows: List[dict], use_copy: Optional[bool] = None) -> None:
+        """
+        여러 어르신의 로그 행(dict)을 추가합니다.
+
+        행 수가 COPY_THRESHOLD_ROWS 이상이면 COPY 경로(copy_log_rows)를, 그보다 적으면
+        multi-row INSERT를 MAX_ROWS_PER_INSERT 단위로 나누어 실행합니다.
+        use_copy로 경로를 강제할 수 있습니다. (벤치마크용)
+        """
+        if use_copy is None:
+            use_copy = len(rows) >= COPY_THRESHOLD_ROWS
+        if use_copy:
+            await self.copy_log_rows(rows)
+            return
+
+        for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+            chunk = rows[start:start + MAX_ROWS_PER_INSERT]
+            stmt = pg_insert(SensorLog).values(chunk).on_conflict_do_nothing()
+            await self.session.execute(stmt)
+
+    async def copy_log_rows(self, rows: List[dict]) -> None:
+        """
+        asyncpg의 binary COPY로 임시 스테이징 테이블에 행을 적재한 뒤 sensor_logs에 병합합니다.
+        파라미터 바인딩 없이 스트리밍하므로 대량 백로그(허브 장애 후 일괄 재전송 등)에 적합합니다.
+        세션의 현재 트랜잭션 안에서 실행되므로 커밋/롤백은 호출자가 담당합니다.
+        """
+        if not rows:
+            return
+
+        await self.session.execute(
+            text(
+                f"""
+                CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE}
+                (LIKE sensor_logs INCLUDING DEFAULTS) ON COMMIT DELETE ROWS
+                """
+            )
+        )
+
+        # sensor_type 컬럼은 PostgreSQL enum 이며, 레이블은 Enum 멤버의 '이름'입니다.
+        records = [
+            (
+                row["timestamp"],
+                SensorTypeEnum(row["sensor_type"]).name,
+                row["sensor_value"],
+                row.get("event_description"),
+                row["senior_id"],
+            )
+            for row in rows
+        ]
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            _STAGING_TABLE, records=records, columns=_COPY_COLUMNS
+        )
 
-        await self.session.execute(stmt)
+        column_list = ", ".join(_COPY_COLUMNS)
+        await self.session.execute(
+            text(
+                f"""
+                INSERT INTO sensor_logs ({column_list})
+                SELECT {column_list} FROM {_STAGING_TABLE}
+                ON CONFLICT DO NOTHING
+                """
+            )
+        )
+        # 같은 트랜잭션에서 다시 호출될 때 중복 병합되지 않도록 비웁니다.
+        await self.session.execute(text(f"TRUNCATE {_STAGING_TABLE}"))
 
     async def get_logs_by_senior_id(self, senior_id: int) -> SensorLogList:
         """
@@ -0,0 +1,356 @@
+import asyncio
+import json
+import os
+import socket
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from common.modules.db_manager import PostgressqlSessionManager, RedisSessionManager
+from common.modules.log_manager import get_logger
+from common.modules.sensor_log_manager import SensorLogManager
+from common.schemas.sensor_log import SensorLogInfo
+
+logger = get_logger(__name__)
+
+SENSOR_LOG_STREAM = os.getenv("SENSOR_LOG_STREAM", "sensor_logs:stream")
+SENSOR_LOG_GROUP = os.getenv("SENSOR_LOG_GROUP", "sensor_log_flusher")
+
+# 적재 가능한 최대 엔트리 수 (허브 요청 1건 = 엔트리 1개). 넘으면 적재를 거절합니다.
+SENSOR_LOG_QUEUE_MAX = int(os.getenv("SENSOR_LOG_QUEUE_MAX", "100000"))
+# 한 번에 INSERT 할 최대 행 수와 최대 대기 시간
+SENSOR_LOG_FLUSH_ROWS = int(os.getenv("SENSOR_LOG_FLUSH_ROWS", "5000"))
+SENSOR_LOG_FLUSH_MAX_AGE_MS = int(os.getenv("SENSOR_LOG_FLUSH_MAX_AGE_MS", "1000"))
+# 죽은 워커가 가져간 뒤 확인(ack)하지 못한 엔트리를 회수하기까지의 유휴 시간
+SENSOR_LOG_CLAIM_IDLE_MS = int(os.getenv("SENSOR_LOG_CLAIM_IDLE_MS", "60000"))
+
+# XLEN 확인과 XADD를 원자적으로 수행하여 큐 길이 상한을 지킵니다.
+_ENQUEUE_SCRIPT = """
+if redis.call('XLEN', KEYS[1]) >= tonumber(ARGV[1]) then
+    return false
+end
+return redis.call('XADD', KEYS[1], '*', 'senior_id', ARGV[2], 'rows', ARGV[3])
+"""
+
+
+class SensorLogQueueFullError(Exception):
+    """write-behind 큐가 가득 차 로그를 적재할 수 없을 때 발생하는 예외"""
+
+
+def encode_log_rows(logs_data: List[SensorLogInfo]) -> str:
+    """센서 로그 목록을 Stream 엔트리에 담을 JSON 문자열로 변환합니다."""
+    return json.dumps(
+        [
+            [
+                log.timestamp.isoformat(),
+                log.sensor_type.value,
+                1 if log.sensor_value else 0,
+                log.event_description,
+            ]
+            for log in logs_data
+        ]
+    )
+
+
+def decode_log_rows(senior_id: int, rows_json: str) -> List[Dict[str, Any]]:
+    """Stream 엔트리의 JSON 문자열을 add_log_rows에 넘길 행 목록으로 변환합니다."""
+    return [
+        {
+            "senior_id": senior_id,
+            "timestamp": datetime.fromisoformat(timestamp),
+            "sensor_type": sensor_type,
+            "sensor_value": bool(sensor_value),
+            "event_description": event_description,
+        }
+        for timestamp, sensor_type, sensor_value, event_description in json.loads(rows_json)
+    ]
+
+
+class SensorLogQueue:
+    """센서 로그를 Redis Stream에 적재하는 write-behind 큐 (생산자)"""
+
+    def __init__(
+        self,
+        redis_session_manager: RedisSessionManager,
+        stream: str = SENSOR_LOG_STREAM,
+        max_entries: int = SENSOR_LOG_QUEUE_MAX,
+    ):
+        self.red_sess = redis_session_manager
+        self.stream = stream
+        self.max_entries = max_entries
+        self._enqueue_script = None
+
+        self.enqueued = 0
+        self.rejected = 0
+
+    async def enqueue(self, senior_id: int, logs_data: List[SensorLogInfo]) -> str:
+        """
+        어르신 한 명의 로그 묶음을 Stream 엔트리 하나로 적재합니다.
+
+        Raises:
+            SensorLogQueueFullError: 큐 길이가 상한에 도달했을 때 발생합니다.
+
+        Returns:
+            str: 적재된 Stream 엔트리 ID
+        """
+        redis_client = await self.red_sess.get_client()
+        if self._enqueue_script is None:
+            self._enqueue_script = redis_client.register_script(_ENQUEUE_SCRIPT)
+
+        entry_id = await self._enqueue_script(
+            keys=[self.stream],
+            args=[self.max_entries, senior_id, encode_log_rows(logs_data)],
+        )
+        if entry_id is None:
+            self.rejected += 1
+            raise SensorLogQueueFullError(
+                f"enqueue - sensor log queue is full (max_entries:{self.max_entries})"
+            )
+
+        self.enqueued += 1
+        return entry_id
+
+    async def depth(self) -> int:
+        """아직 DB에 반영되지 않은 엔트리 수를 반환합니다."""
+        redis_client = await self.red_sess.get_client()
+        return await redis_client.xlen(self.stream)
+
+    def stats(self) -> dict:
+        return {"enqueued": self.enqueued, "rejected": self.rejected}
+
+
+class SensorLogFlusher:
+    """
+    Redis Stream에 쌓인 센서 로그를 모아 multi-row INSERT로 반영하는 백그라운드 작업 (소비자)
+
+    - 행 수가 flush_rows 이상이거나 가장 오래된 엔트리가 max_age_ms를 넘으면 반영합니다.
+    - 버퍼는 최대 flush_rows 행 근처로 유지되며, DB 장애 시에는 새 엔트리를 읽지 않고 재시도합니다.
+    - INSERT 커밋 후에 XACK/XDEL 하므로 최소 한 번 반영되며, 중복은 ON CONFLICT DO NOTHING으로 흡수됩니다.
+    """
+
+    def __init__(
+        self,
+        db_session_manager: PostgressqlSessionManager,
+        redis_session_manager: RedisSessionManager,
+        stream: str = SENSOR_LOG_STREAM,
+        group: str = SENSOR_LOG_GROUP,
+        consumer: Optional[str] = None,
+        flush_rows: int = SENSOR_LOG_FLUSH_ROWS,
+        max_age_ms: int = SENSOR_LOG_FLUSH_MAX_AGE_MS,
+        claim_idle_ms: int = SENSOR_LOG_CLAIM_IDLE_MS,
+    ):
+        self.db_sess = db_session_manager
+        self.red_sess = redis_session_manager
+        self.stream = stream
+        self.group = group
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self.flush_rows = flush_rows
+        self.max_age_ms = max_age_ms
+        self.claim_idle_ms = claim_idle_ms
+
+        # (엔트리 ID, 행 목록)
+        self._buffer: List[Tuple[str, List[Dict[str, Any]]]] = []
+        self._buffered_ids = set()
+        self._buffered_rows = 0
+        self._oldest_at: Optional[float] = None
+        self._running = False
+
+        self.flushes = 0
+        self.rows_flushed = 0
+        self.entries_dropped = 0
+        self.flush_errors = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    async def _ensure_group(self) -> None:
+        redis_client = await self.red_sess.get_client()
+        try:
+            await redis_client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def _add_entries(self, entries) -> List[str]:
+        """
+        엔트리를 버퍼에 추가합니다. 이미 버퍼에 있는 엔트리는 건너뜁니다.
+
+        Returns:
+            List[str]: 대기(pending) 목록에는 남아 있지만 Stream에서 이미 삭제(XDEL/XTRIM)되어
+                내용이 없는 엔트리 ID 목록. 반영할 내용이 없으므로 XACK만 하면 됩니다.
+        """
+        deleted = []
+        for entry_id, fields in entries:
+            if not fields:
+                deleted.append(entry_id)
+                continue
+            if entry_id in self._buffered_ids:
+                continue
+            rows = decode_log_rows(int(fields["senior_id"]), fields["rows"])
+            self._buffer.append((entry_id, rows))
+            self._buffered_ids.add(entry_id)
+            self._buffered_rows += len(rows)
+            if self._oldest_at is None:
+                self._oldest_at = time.monotonic()
+        return deleted
+
+    async def _ack_deleted(self, entry_ids: List[str]) -> None:
+        """내용이 없는(삭제된) 엔트리를 확인 처리해 대기 목록에서 뺍니다."""
+        if not entry_ids:
+            return
+        redis_client = await self.red_sess.get_client()
+        await redis_client.xack(self.stream, self.group, *entry_ids)
+        logger.warning("[write-behind] 삭제된 대기 엔트리 %d개를 확인 처리했습니다.", len(entry_ids))
+
+    def _flush_due(self) -> bool:
+        if not self._buffer:
+            return False
+        if self._buffered_rows >= self.flush_rows:
+            return True
+        return (time.monotonic() - self._oldest_at) * 1000 >= self.max_age_ms
+
+    def _block_ms(self) -> int:
+        if self._oldest_at is None:
+            return self.max_age_ms
+        elapsed_ms = (time.monotonic() - self._oldest_at) * 1000
+        return max(1, int(self.max_age_ms - elapsed_ms))
+
+    async def _insert(self, rows: List[Dict[str, Any]]) -> None:
+        async with self.db_sess.AsyncSessionMaker() as session:
+            await SensorLogManager(session).add_log_rows(rows)
+            await session.commit()
+
+    async def flush(self) -> None:
+        """버퍼에 모인 엔트리를 한 번에 INSERT 하고 Stream에서 제거합니다."""
+        if not self._buffer:
+            return
+
+        started = time.perf_counter()
+        rows = [row for _, entry_rows in self._buffer for row in entry_rows]
+        try:
+            await self._insert(rows)
+        except IntegrityError:
+            # 삭제된 어르신 등 일부 엔트리 때문에 전체가 실패하면 엔트리 단위로 나누어 반영합니다.
+            for entry_id, entry_rows in self._buffer:
+                try:
+                    await self._insert(entry_rows)
+                except IntegrityError as e:
+                    self.entries_dropped += 1
+                    logger.warning("[write-behind] 반영 불가 엔트리 폐기 %s: %s", entry_id, e)
+
+        entry_ids = [entry_id for entry_id, _ in self._buffer]
+        redis_client = await self.red_sess.get_client()
+        async with redis_client.pipeline() as pipe:
+            await pipe.xack(self.stream, self.group, *entry_ids)
+            await pipe.xdel(self.stream, *entry_ids)
+            await pipe.execute()
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.flushes += 1
+        self.rows_flushed += len(rows)
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self._total_flush_ms += elapsed_ms
+
+        self._buffer = []
+        self._buffered_ids.clear()
+        self._buffered_rows = 0
+        self._oldest_at = None
+
+    @staticmethod
+    def _stream_entries(response) -> list:
+        """XREADGROUP 응답(스트림 하나)에서 엔트리 목록을 꺼냅니다. RESP2는 [[stream, entries]], RESP3는 {stream: [entries]}"""
+        if not response:
+            return []
+        if isinstance(response, dict):
+            return next(iter(response.values()))[0]
+        return response[0][1]
+
+    async def _recover_pending(self) -> None:
+        """이 consumer가 이전에 읽고 확인하지 못한 엔트리를 먼저 반영합니다."""
+        redis_client = await self.red_sess.get_client()
+        start_id = "0"
+        while True:
+            response = await redis_client.xreadgroup(
+                self.group, self.consumer, {self.stream: start_id}, count=self.flush_rows
+            )
+            entries = self._stream_entries(response)
+            if not entries:
+                return
+            await self._ack_deleted(self._add_entries(entries))
+            await self.flush()
+            # 다음에는 이번에 읽은 마지막 엔트리 이후부터 읽습니다. (확인 처리가 빠진 엔트리를 다시 읽지 않도록)
+            start_id = entries[-1][0]
+
+    async def _claim_stale(self) -> None:
+        """오래 확인되지 않은(죽은 워커의) 엔트리를 이 consumer로 가져옵니다."""
+        redis_client = await self.red_sess.get_client()
+        result = await redis_client.xautoclaim(
+            self.stream, self.group, self.consumer,
+            min_idle_time=self.claim_idle_ms, count=self.flush_rows,
+        )
+        await self._ack_deleted(self._add_entries(result[1]))
+
+    async def run(self) -> None:
+        """stop()이 호출될 때까지 Stream을 읽어 주기적으로 반영합니다."""
+        await self._ensure_group()
+        self._running = True
+        logger.info("Sensor log flusher started. consumer: %s", self.consumer)
+
+        recovered = False
+        next_claim_at = 0.0
+
+        redis_client = await self.red_sess.get_client()
+        while self._running:
+            try:
+                if not recovered:
+                    await self._recover_pending()
+                    recovered = True
+
+                if time.monotonic() >= next_claim_at:
+                    await self._claim_stale()
+                    next_claim_at = time.monotonic() + self.claim_idle_ms / 1000
+
+                # 버퍼가 가득 차 있으면(DB 장애로 반영 실패 중) 더 읽지 않습니다.
+                if self._buffered_rows < self.flush_rows:
+                    response = await redis_client.xreadgroup(
+                        self.group, self.consumer, {self.stream: ">"},
+                        count=self.flush_rows, block=self._block_ms(),
+                    )
+                    entries = self._stream_entries(response)
+                    if entries:
+                        await self._ack_deleted(self._add_entries(entries))
+
+                if self._flush_due():
+                    await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.flush_errors += 1
+                logger.exception("[write-behind] 반영 중 오류 발생: %s", e)
+                await asyncio.sleep(1)
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error("[write-behind] 종료 전 반영 실패, 다음 기동 시 재처리됩니다: %s", e)
+        logger.info("Sensor log flusher stopped.")
+
+    def stop(self) -> None:
+        """루프를 종료합니다. 남은 버퍼는 run()이 종료 직전에 반영합니다."""
+        self._running = False
+
+    def stats(self) -> dict:
+        return {
+            "buffered_entries": len(self._buffer),
+            "buffered_rows": self._buffered_rows,
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+            "entries_dropped": self.entries_dropped,
+            "flush_errors": self.flush_errors,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "max_flush_ms": round(self.max_flush_ms, 2),
+            "avg_flush_ms": round(self._total_flush_ms / self.flushes, 2) if self.flushes else 0.0,
+        }
@@ -1,98 +1,295 @@
 import json
-from typing import Optional, Union
+import os
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Iterable, List, Optional, Tuple, Union
 
 from common.schemas.session import ConnectionInfo
 from common.modules.db_manager import RedisSessionManager
+from common.modules.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+SESSION_CACHE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL", "5"))
+SESSION_CACHE_MAX_SIZE = int(os.getenv("SESSION_CACHE_MAX_SIZE", "10000"))
+# 세션 키 만료 시간 (초). 연결이 살아 있는 동안 SessionKeeper heartbeat가 연장합니다. 0이면 만료하지 않습니다.
+SESSION_TTL = int(os.getenv("SESSION_TTL", "75"))
+
+# 세션(sid 키)에 딸린 인덱스 키 중, 지금도 이 세션(sid)을 가리키는 키 목록을 구합니다.
+# (같은 직원/허브가 다시 연결해 인덱스가 새 세션으로 바뀐 경우 새 세션의 키는 건드리지 않도록)
+# 이전 형식(인덱스 값이 sid 문자열)도 함께 처리합니다.
+# KEYS[1]: session:sid:{sid} / ARGV[1]: sid, ARGV[2]: 키 접두사("session:")
+_OWNED_INDEX_KEYS_LUA = """
+local function owned_index_keys(session)
+    local owned = {}
+    for _, key_type in ipairs({'hub_id', 'staff_id'}) do
+        local value = session[key_type]
+        if value then
+            local index_key = ARGV[2] .. key_type .. ':' .. string.format('%d', value)
+            local indexed = redis.call('GET', index_key)
+            if indexed and (indexed == ARGV[1] or (string.sub(indexed, 1, 1) == '{' and cjson.decode(indexed)['sid'] == ARGV[1])) then
+                table.insert(owned, index_key)
+            end
+        end
+    end
+    return owned
+end
+"""
+
+# 세션과 인덱스를 한 번에 삭제하고, 삭제한 세션 JSON을 반환합니다.
+_DELETE_SESSION_SCRIPT = _OWNED_INDEX_KEYS_LUA + """
+local data = redis.call('GET', KEYS[1])
+if not data then
+    return nil
+end
+redis.call('DEL', KEYS[1], unpack(owned_index_keys(cjson.decode(data))))
+return data
+"""
+
+# 세션과 인덱스의 만료 시간을 한 번에 연장합니다. ARGV[3]: TTL (초)
+_REFRESH_SESSION_SCRIPT = _OWNED_INDEX_KEYS_LUA + """
+local data = redis.call('GET', KEYS[1])
+if not data then
+    return 0
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+for _, index_key in ipairs(owned_index_keys(cjson.decode(data))) do
+    redis.call('EXPIRE', index_key, ARGV[3])
+end
+return 1
+"""
+
+# 만료 시간이 없는(이전 형식) 세션과 인덱스에만 만료 시간을 설정합니다. ARGV[3]: TTL (초)
+_EXPIRE_PERSISTENT_SESSION_SCRIPT = _OWNED_INDEX_KEYS_LUA + """
+local data = redis.call('GET', KEYS[1])
+if not data then
+    return 0
+end
+local keys = owned_index_keys(cjson.decode(data))
+table.insert(keys, KEYS[1])
+local expired = 0
+for _, key in ipairs(keys) do
+    if redis.call('TTL', key) == -1 then
+        redis.call('EXPIRE', key, ARGV[3])
+        expired = 1
+    end
+end
+return expired
+"""
+
+
+class SessionCache:
+    """
+    세션 조회 결과(키 -> ConnectionInfo)를 프로세스 안에 잠시 보관하는 TTL/LRU 캐시
+
+    delete_session/create_session에서 이 프로세스의 항목은 바로 무효화됩니다.
+    다른 워커 프로세스에서 바뀐 세션은 TTL이 지나야 반영되므로 TTL은 짧게 유지합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = SESSION_CACHE_TTL_SECONDS, max_size: int = SESSION_CACHE_MAX_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, ConnectionInfo]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[ConnectionInfo]:
+        entry = self._entries.get(key)
+        if entry:
+            expires_at, session_info = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return session_info
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: str, session_info: ConnectionInfo) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, session_info)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# 모든 SessionManager 인스턴스가 공유하는 캐시
+session_cache = SessionCache()
+
 
 class SessionManager:
-    def __init__(self, r: RedisSessionManager):
+    """
+    Socket.IO 연결 세션을 Redis에 저장하고 sid / hub_id / staff_id로 조회하는 클래스
+
+    세션 JSON을 sid 키뿐 아니라 hub_id, staff_id 인덱스 키에도 그대로 저장하므로
+    어떤 키로 조회하든 GET 한 번으로 끝납니다. 앞단에는 프로세스 내부 캐시(session_cache)를 둡니다.
+    모든 키는 ttl 후 만료되므로, 연결이 끊긴 이벤트를 놓쳐도(서버 비정상 종료 등) 키가 쌓이지 않습니다.
+    """
+
+    def __init__(self, r: RedisSessionManager, cache: SessionCache = session_cache, ttl: int = SESSION_TTL):
         self.red_sess = r
+        self.cache = cache
+        self.ttl = ttl
+        self.key_prefix = "session:"
+        self._delete_script = None
+        self._refresh_script = None
+        self._expire_persistent_script = None
 
     def _get_key(self, key_type: str, value: Union[str, int]) -> str:
-        return f"session:{key_type}:{value}"
+        return f"{self.key_prefix}{key_type}:{value}"
+
+    def _index_keys(self, session_info: ConnectionInfo) -> list:
+        keys = [self._get_key("sid", session_info.sid)]
+        if session_info.hub_id is not None:
+            keys.append(self._get_key("hub_id", session_info.hub_id))
+        if session_info.staff_id is not None:
+            keys.append(self._get_key("staff_id", session_info.staff_id))
+        return keys
 
     async def create_session(self, session_info: ConnectionInfo) -> None:
         redis_client = await self.red_sess.get_client()
-        
-        async with redis_client.pipeline() as pipe:
-            sid_key = self._get_key("sid", session_info.sid)
-            session_data_json = session_info.to_json()
-            
-            await pipe.set(sid_key, session_data_json)
-            print(f"[SET] {sid_key}")
-
-            if session_info.hub_id is not None:
-                hub_id_key = self._get_key("hub_id", session_info.hub_id)
-                await pipe.set(hub_id_key, session_info.sid)
-                print(f"[SET-INDEX] {hub_id_key} -> {session_info.sid}")
-
-            if session_info.staff_id is not None:
-                staff_id_key = self._get_key("staff_id", session_info.staff_id)
-                await pipe.set(staff_id_key, session_info.sid)
-                print(f"[SET-INDEX] {staff_id_key} -> {session_info.sid}")
+        session_data_json = session_info.to_json()
+        keys = self._index_keys(session_info)
 
+        async with redis_client.pipeline() as pipe:
+            for key in keys:
+                await pipe.set(key, session_data_json, ex=self.ttl or None)
             await pipe.execute()
-        print("--- 세션 생성이 완료되었습니다. ---")
 
-    async def get_session_by_sid(self, sid: str) -> Optional[ConnectionInfo]:
+        # 같은 허브/직원의 이전 세션이 캐시에 남아 있지 않도록 합니다.
+        self.cache.invalidate(*keys)
+        logger.debug("세션 생성이 완료되었습니다. keys: %s", keys)
+
+    async def _get_session(self, key: str) -> Optional[ConnectionInfo]:
+        session_info = self.cache.get(key)
+        if session_info is not None:
+            return session_info
+
         redis_client = await self.red_sess.get_client()
-        sid_key = self._get_key("sid", sid)
-        session_data_json = await redis_client.get(sid_key)
-
-        if session_data_json:
-            print(f"(sid: {sid}) -> 세션을 찾았습니다.")
-            return ConnectionInfo.from_dict(json.loads(session_data_json))
-        
-        print(f"(sid: {sid}) -> 세션을 찾을 수 없습니다.")
-        return None
+        session_data_json = await redis_client.get(key)
+        if not session_data_json:
+            logger.debug("(%s) -> 세션을 찾을 수 없습니다.", key)
+            return None
+
+        if not session_data_json.startswith("{"):
+            # 이전 형식의 인덱스(값이 sid)는 sid 키를 한 번 더 조회합니다.
+            session_info = await self._get_session(self._get_key("sid", session_data_json))
+        else:
+            session_info = ConnectionInfo.from_dict(json.loads(session_data_json))
+
+        if session_info is not None:
+            self.cache.set(key, session_info)
+        return session_info
+
+    async def get_session_by_sid(self, sid: str) -> Optional[ConnectionInfo]:
+        return await self._get_session(self._get_key("sid", sid))
 
     async def get_session_by_hub_id(self, hub_id: int) -> Optional[ConnectionInfo]:
-        redis_client = await self.red_sess.get_client()
-        hub_id_key = self._get_key("hub_id", hub_id)
-        sid = await redis_client.get(hub_id_key)
-
-        if sid:
-            print(f"(hub_id: {hub_id}) -> sid({sid})를 찾았습니다. 세부 정보를 조회합니다.")
-            return await self.get_session_by_sid(sid)
-        
-        print(f"(hub_id: {hub_id}) -> 해당 인덱스를 찾을 수 없습니다.")
-        return None
+        return await self._get_session(self._get_key("hub_id", hub_id))
 
     async def get_session_by_staff_id(self, staff_id: int) -> Optional[ConnectionInfo]:
+        return await self._get_session(self._get_key("staff_id", staff_id))
+
+    async def delete_session(self, sid: str) -> bool:
+        """세션과, 이 세션을 가리키는 인덱스를 스크립트 한 번으로 삭제합니다."""
         redis_client = await self.red_sess.get_client()
-        staff_id_key = self._get_key("staff_id", staff_id)
-        sid = await redis_client.get(staff_id_key)
+        if self._delete_script is None:
+            self._delete_script = redis_client.register_script(_DELETE_SESSION_SCRIPT)
 
-        if sid:
-            print(f"(staff_id: {staff_id}) -> sid({sid})를 찾았습니다. 세부 정보를 조회합니다.")
-            return await self.get_session_by_sid(sid)
+        session_data_json = await self._delete_script(
+            keys=[self._get_key("sid", sid)], args=[sid, self.key_prefix]
+        )
+        if not session_data_json:
+            self.cache.invalidate(self._get_key("sid", sid))
+            logger.debug("삭제할 세션(sid: %s)이 존재하지 않습니다.", sid)
+            return False
 
-        print(f"(staff_id: {staff_id}) -> 해당 인덱스를 찾을 수 없습니다.")
-        return None
+        session_info = ConnectionInfo.from_dict(json.loads(session_data_json))
+        self.cache.invalidate(*self._index_keys(session_info))
+        logger.debug("세션 삭제가 완료되었습니다. (sid: %s)", sid)
+        return True
 
-    async def delete_session(self, sid: str) -> bool:
-        session_info = await self.get_session_by_sid(sid)
-        if not session_info:
-            print(f"삭제할 세션(sid: {sid})이 존재하지 않습니다.")
-            return False
+    async def refresh_sessions(self, sids: Iterable[str]) -> int:
+        """
+        세션들의 만료 시간을 ttl로 연장합니다. (연결이 살아 있는 소켓의 heartbeat)
 
+        Returns:
+            int: 연장한 세션 수. Redis에 없는 세션(이미 만료/삭제)은 빠집니다.
+        """
+        sids = list(sids)
+        if not sids or not self.ttl:
+            return 0
         redis_client = await self.red_sess.get_client()
-        async with redis_client.pipeline() as pipe:
-            sid_key = self._get_key("sid", session_info.sid)
-            await pipe.delete(sid_key)
-            print(f"[DELETE] {sid_key}")
-
-            if session_info.hub_id is not None:
-                hub_id_key = self._get_key("hub_id", session_info.hub_id)
-                await pipe.delete(hub_id_key)
-                print(f"[DELETE-INDEX] {hub_id_key}")
-
-            if session_info.staff_id is not None:
-                staff_id_key = self._get_key("staff_id", session_info.staff_id)
-                await pipe.delete(staff_id_key)
-                print(f"[DELETE-INDEX] {staff_id_key}")
-            
+        if self._refresh_script is None:
+            self._refresh_script = redis_client.register_script(_REFRESH_SESSION_SCRIPT)
+
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for sid in sids:
+                await self._refresh_script(
+                    keys=[self._get_key("sid", sid)], args=[sid, self.key_prefix, self.ttl], client=pipe
+                )
+            results = await pipe.execute()
+        return sum(results)
+
+    async def expire_persistent_sessions(self, sids: Iterable[str], ttl: int) -> int:
+        """
+        만료 시간 없이 저장된 세션(이전 형식)에 ttl을 설정합니다. 이미 만료 시간이 있는 키는 그대로 둡니다.
+
+        Returns:
+            int: 만료 시간을 새로 설정한 세션 수
+        """
+        sids = list(sids)
+        if not sids:
+            return 0
+        redis_client = await self.red_sess.get_client()
+        if self._expire_persistent_script is None:
+            self._expire_persistent_script = redis_client.register_script(_EXPIRE_PERSISTENT_SESSION_SCRIPT)
+
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for sid in sids:
+                await self._expire_persistent_script(
+                    keys=[self._get_key("sid", sid)], args=[sid, self.key_prefix, ttl], client=pipe
+                )
             results = await pipe.execute()
+        return sum(results)
+
+    async def scan_sessions(self, batch_size: int = 500) -> AsyncIterator[ConnectionInfo]:
+        """Redis에 저장된 모든 세션을 순회합니다. (서버 시작 시 정리 작업용)"""
+        redis_client = await self.red_sess.get_client()
+        keys: List[str] = []
+        async for key in redis_client.scan_iter(match=self._get_key("sid", "*"), count=batch_size):
+            keys.append(key)
+            if len(keys) >= batch_size:
+                for session_info in await self._load_sessions(redis_client, keys):
+                    yield session_info
+                keys = []
+        if keys:
+            for session_info in await self._load_sessions(redis_client, keys):
+                yield session_info
 
-        print("--- 세션 삭제가 완료되었습니다. ---")
-        return sum(results) > 0
\ No newline at end of file
+    @staticmethod
+    async def _load_sessions(redis_client, keys: List[str]) -> List[ConnectionInfo]:
+        return [
+            ConnectionInfo.from_dict(json.loads(session_data_json))
+            for session_data_json in await redis_client.mget(keys)
+            if session_data_json
+        ]
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -107,6 +107,12 @@ class UserManager:
             return SeniorInfo.model_validate(senior_row)
         return None
 
+    async def senior_exists(self, senior_id: int) -> bool:
+        """어르신 존재 여부만 확인합니다. 프로필 이미지 등 큰 컬럼은 읽지 않습니다."""
+        query = text("SELECT 1 FROM seniors WHERE senior_id = :senior_id")
+        result = await self.session.execute(query, {"senior_id": senior_id})
+        return result.first() is not None
+
     async def get_all_seniors(self) -> List[SeniorInfo]:
         """데이터베이스에 등록된 모든 어르신 목록을 조회합니다. (Raw SQL 사용)"""
         query = text("SELECT * FROM seniors")
@@ -114,6 +120,17 @@ class UserManager:
         senior_rows = result.mappings().all()
         return [SeniorInfo.model_validate(row) for row in senior_rows]
 
+    async def get_senior_roster(self, after_senior_id: int = 0) -> List[SeniorRosterEntry]:
+        """
+        senior_id가 after_senior_id보다 큰 어르신의 ID와 이름만 조회합니다. (Raw SQL 사용)
+        어르신 목록 캐시(SeniorRoster)의 전체/증분 적재에 사용합니다.
+        """
+        query = text(
+            "SELECT senior_id, full_name FROM seniors WHERE senior_id > :after_senior_id ORDER BY senior_id"
+        )
+        result = await self.session.execute(query, {"after_senior_id": after_senior_id})
+        return [SeniorRosterEntry.model_validate(row) for row in result.mappings().all()]
+
     async def get_care_seniors(self, staff_id: int) -> List[SeniorInfo]:
         """데이터베이스에 등록된 어르신 목록 중 담당하고 있는 어르신 목록을 조회합니다. (Raw SQL 사용)"""
         query = text(
@@ -146,6 +163,32 @@ class UserManager:
         else:
             return None
 
+    async def get_senior_staff_id(self, senior_id: int) -> Optional[int]:
+        """어르신을 담당하는 직원의 ID만 조회합니다. (Raw SQL 사용)"""
+        query = text(
+            "SELECT staff_id FROM staff_senior_map WHERE senior_id = :senior_id LIMIT 1"
+        )
+        result = await self.session.execute(query, {"senior_id": senior_id})
+        return result.scalar_one_or_none()
+
+    async def get_staff_ids_by_senior_ids(self, senior_ids: List[int]) -> Dict[int, List[int]]:
+        """
+        여러 어르신의 담당 직원을 한 번에 조회합니다. (Raw SQL 사용)
+
+        Returns:
+            Dict[int, List[int]]: staff_id -> 그 직원이 담당하는 어르신 ID 목록 (senior_ids 중에서)
+        """
+        if not senior_ids:
+            return {}
+        query = text(
+            "SELECT staff_id, senior_id FROM staff_senior_map WHERE senior_id = ANY(:senior_ids)"
+        )
+        result = await self.session.execute(query, {"senior_ids": list(senior_ids)})
+        seniors_by_staff: Dict[int, List[int]] = {}
+        for staff_id, senior_id in result.all():
+            seniors_by_staff.setdefault(staff_id, []).append(senior_id)
+        return seniors_by_staff
+
     async def link_staff_to_senior(self, staff_id: int, senior_id: int) -> None:
         """직원과 어르신을 연결합니다."""
         if await self.get_staff_by_id(staff_id) is None:
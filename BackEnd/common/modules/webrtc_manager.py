@@ -2,6 +2,9 @@ import redis.asyncio as redis
 import json
 from typing import Any, Dict, Optional, Type, Union
 from common.modules.db_manager import RedisSessionManager
+from common.modules.log_manager import get_logger
+
+logger = get_logger(__name__)
 
 SDP_EXPIRATION_SECONDS = 300
 
@@ -24,16 +27,14 @@ class WebRTCManager:
             json.dumps(packet), 
             ex=SDP_EXPIRATION_SECONDS
         )
-        print(f"Registered {sdp_type} with key '{key}' (expires in {SDP_EXPIRATION_SECONDS}s)")
+        logger.debug("Registered %s with key '%s' (expires in %ss)", sdp_type, key, SDP_EXPIRATION_SECONDS)
 
     async def register_offer(self, senior_id: int, offer_packet: Dict[str, Any]):
         key = self._get_offer_key(senior_id)
-        print("register_offer")
         await self._register_sdp(key, offer_packet, "Offer")
 
     async def register_answer(self, senior_id: int, answer_packet: Dict[str, Any]):
         key = self._get_answer_key(senior_id)
-        print("register_answer")
         await self._register_sdp(key, answer_packet, "Answer")
 
     async def consume_sdp(self, key: str, sdp_type: str) -> Optional[Dict[str, Any]]:
@@ -45,19 +46,17 @@ class WebRTCManager:
         data_str = await redis_client.getdel(key)
         
         if data_str:
-            print(f"Consumed {sdp_type} from key '{key}'")
+            logger.debug("Consumed %s from key '%s'", sdp_type, key)
             # ❗ Redis에서 가져온 JSON 문자열을 파이썬 딕셔너리로 파싱합니다.
             return json.loads(data_str)
         
-        print(f"No {sdp_type} found for key '{key}'")
+        logger.info("No %s found for key '%s'", sdp_type, key)
         return None
 
     async def consume_offer(self, senior_id: int) -> Optional[Dict[str, Any]]:
         key = self._get_offer_key(senior_id)
-        print("consume_offer")
         return await self.consume_sdp(key, "Offer")
 
     async def consume_answer(self, senior_id: int) -> Optional[Dict[str, Any]]:
         key = self._get_answer_key(senior_id)
-        print("consume_answer")
         return await self.consume_sdp(key, "Answer")
\ No newline at end of file
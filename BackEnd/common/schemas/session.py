@@ -21,6 +21,7 @@ class ConnectionInfo:
         hub_id: Optional[int] = None,
         staff_id: Optional[int] = None,
         senior_id: Optional[int] = None,
+        worker_id: Optional[str] = None,
     ):
         """
         ConnectionInfo 객체를 초기화합니다.
@@ -30,6 +31,7 @@ class ConnectionInfo:
         :param hub_id: 허브 ID (선택 사항)
         :param staff_id: 스태프 ID (선택 사항)
         :param senior_id: 연관 어르신 ID (선택 사항)
+        :param worker_id: 소켓이 연결된 서버 워커 ID (선택 사항)
         """
         # Enum 타입 힌트로 인해 별도의 유효성 검사가 필요 없습니다.
         self.sid = sid
@@ -37,6 +39,7 @@ class ConnectionInfo:
         self.hub_id = hub_id
         self.staff_id = staff_id
         self.senior_id = senior_id
+        self.worker_id = worker_id
 
     def to_dict(self) -> Dict[str, Any]:
         """객체를 딕셔너리로 변환합니다."""
@@ -52,6 +55,8 @@ class ConnectionInfo:
             data["staff_id"] = self.staff_id
         if self.senior_id is not None:
             data["senior_id"] = self.senior_id
+        if self.worker_id is not None:
+            data["worker_id"] = self.worker_id
         return data
 
     def to_json(self) -> str:
@@ -68,4 +73,5 @@ class ConnectionInfo:
             hub_id=data.get("hub_id"),  # 키가 없을 경우 None을 반환
             staff_id=data.get("staff_id"),  # 키가 없을 경우 None을 반환
             senior_id=data.get("senior_id"),  # 키가 없을 경우 None을 반환
+            worker_id=data.get("worker_id"),  # 키가 없을 경우 None을 반환
         )
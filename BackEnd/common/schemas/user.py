@@ -47,6 +47,13 @@ class SeniorUpdate(BaseModel):
     health_info: Optional[str] = None
 
 
+class SeniorRosterEntry(BaseModel):
+    """백그라운드 작업용 어르신 목록 항목 (프로필 이미지 등 큰 컬럼 제외)"""
+
+    senior_id: int
+    full_name: str
+
+
 class SeniorInfo(BaseModel):
     """어르신 정보 응답을 위한 모델"""
 
@@ -0,0 +1,98 @@
+"""
+sensor_logs 기본 키/인덱스 전환 마이그레이션
+
+    PK (timestamp)                      -> PK (senior_id, sensor_type, timestamp)
+    ix_sensor_logs_sensor_type,
+    ix_sensor_logs_senior_id            -> ix_sensor_logs_senior_id_timestamp (senior_id, timestamp DESC)
+
+실행 (BackEnd 디렉토리에서, .env 의 DB_NAME DB를 사용합니다):
+    python -m migrations.sensor_logs_composite_pk
+
+- 여러 번 실행해도 안전합니다. 이미 전환된 단계는 건너뜁니다.
+- 기존 키(timestamp)가 새 키의 부분집합이므로 기존 데이터에 새 키 중복이 생기지 않습니다.
+- 하이퍼테이블에 대한 제약/인덱스 변경은 TimescaleDB가 기존 청크에도 전파합니다.
+  새 인덱스는 청크별 트랜잭션(timescaledb.transaction_per_chunk)으로 만들어 테이블 전체 잠금을 피합니다.
+- 압축된 청크가 있으면 PK 변경이 실패하므로 먼저 압축을 해제해야 합니다.
+"""
+import asyncio
+import os
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from common.modules.db_manager import PostgressqlSessionManager
+
+TABLE_NAME = "sensor_logs"
+PRIMARY_KEY_NAME = "sensor_logs_pkey"
+PRIMARY_KEY_COLUMNS = ["senior_id", "sensor_type", "timestamp"]
+TIMELINE_INDEX_NAME = "ix_sensor_logs_senior_id_timestamp"
+OBSOLETE_INDEXES = ["ix_sensor_logs_sensor_type", "ix_sensor_logs_senior_id"]
+
+
+async def get_primary_key_columns(engine: AsyncEngine) -> list:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                """
+                SELECT a.attname
+                FROM pg_index i
+                JOIN LATERAL unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord) ON true
+                JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+                WHERE i.indrelid = CAST(:table_name AS regclass) AND i.indisprimary
+                ORDER BY k.ord
+                """
+            ),
+            {"table_name": TABLE_NAME},
+        )
+        return [row[0] for row in result.all()]
+
+
+async def upgrade(engine: AsyncEngine) -> None:
+    pk_columns = await get_primary_key_columns(engine)
+    if pk_columns == PRIMARY_KEY_COLUMNS:
+        print(f"'{TABLE_NAME}' 기본 키가 이미 {PRIMARY_KEY_COLUMNS} 입니다.")
+    else:
+        print(f"'{TABLE_NAME}' 기본 키를 {pk_columns} -> {PRIMARY_KEY_COLUMNS} 로 변경합니다...")
+        async with engine.begin() as conn:
+            await conn.execute(text(f"ALTER TABLE {TABLE_NAME} DROP CONSTRAINT IF EXISTS {PRIMARY_KEY_NAME}"))
+            await conn.execute(
+                text(
+                    f"ALTER TABLE {TABLE_NAME} ADD CONSTRAINT {PRIMARY_KEY_NAME} "
+                    f"PRIMARY KEY ({', '.join(PRIMARY_KEY_COLUMNS)})"
+                )
+            )
+
+    # transaction_per_chunk 인덱스 생성은 트랜잭션 블록 밖에서 실행해야 합니다.
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        print(f"'{TIMELINE_INDEX_NAME}' 인덱스를 생성합니다...")
+        await conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS {TIMELINE_INDEX_NAME} "
+                f"ON {TABLE_NAME} (senior_id, timestamp DESC) "
+                "WITH (timescaledb.transaction_per_chunk)"
+            )
+        )
+        for index_name in OBSOLETE_INDEXES:
+            print(f"'{index_name}' 인덱스를 삭제합니다...")
+            await conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+    print(f"--- '{TABLE_NAME}' 마이그레이션이 완료되었습니다. ---")
+
+
+async def main():
+    load_dotenv(dotenv_path=".env")
+    manager = PostgressqlSessionManager(
+        db_user=os.getenv("DB_ROOT_USER"),
+        db_password=os.getenv("DB_ROOT_PW"),
+        db_host=os.getenv("DB_HOST"),
+        db_port=os.getenv("POSTGRES_PORT"),
+        db_name=os.getenv("DB_NAME"),
+    )
+    await upgrade(manager.engine)
+    await manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""
+센서 상태 Redis 키 형식 전환 마이그레이션
+
+    sensor:status:{senior_id}:{sensor_id}  (센서마다 Hash: sensor_type, location, value, last_updated)
+        -> sensor:state:{senior_id}          (어르신마다 Hash: sensor_id -> "값:epoch ms")
+
+실행 (BackEnd 디렉토리에서, .env 의 REDIS_* 설정을 사용합니다):
+    python -m migrations.sensor_status_single_hash
+
+- 여러 번 실행해도 안전합니다. 옮긴 이전 키는 삭제되므로 다시 실행하면 남은 키만 처리합니다.
+- 새 형식에 이미 있는 필드(새 코드가 먼저 기록한 최신 값)는 덮어쓰지 않습니다. (HSETNX)
+- 키 공간 전체를 한 번만 SCAN 합니다. 서버 배포 직후, 새 코드가 기록을 시작한 뒤에 실행하면 됩니다.
+"""
+import asyncio
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from dotenv import load_dotenv
+
+from common.modules.db_manager import RedisSessionManager
+from web.services.senior_status_manager import SensorStatusManager
+
+LEGACY_KEY_PATTERN = "sensor:status:*"
+SCAN_COUNT = 1000
+# 한 번에 읽고 옮기는 이전 키 수
+CHUNK_SIZE = 500
+
+
+def parse_legacy_key(key: str) -> Tuple[int, str]:
+    """sensor:status:{senior_id}:{sensor_id} -> (senior_id, sensor_id)"""
+    _, _, senior_id, sensor_id = key.split(":", 3)
+    return int(senior_id), sensor_id
+
+
+async def migrate_chunk(redis_client, keys: List[str], new_key_prefix: str) -> int:
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            await pipe.hgetall(key)
+        results = await pipe.execute()
+
+    fields_by_senior: Dict[int, Dict[str, str]] = defaultdict(dict)
+    for key, data in zip(keys, results):
+        if not data:
+            continue
+        try:
+            senior_id, sensor_id = parse_legacy_key(key)
+            fields_by_senior[senior_id][sensor_id] = SensorStatusManager.pack_state(
+                data.get("value") == "1", datetime.fromisoformat(data["last_updated"])
+            )
+        except (KeyError, ValueError) as e:
+            print(f"⚠️ 건너뜀 {key}: {e}")
+
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for senior_id, fields in fields_by_senior.items():
+            for sensor_id, packed in fields.items():
+                await pipe.hsetnx(f"{new_key_prefix}:{senior_id}", sensor_id, packed)
+        await pipe.unlink(*keys)
+        await pipe.execute()
+    return len(keys)
+
+
+async def upgrade(redis_session_manager: RedisSessionManager) -> None:
+    redis_client = await redis_session_manager.get_client()
+    new_key_prefix = SensorStatusManager(redis_session_manager).key_prefix
+
+    moved = 0
+    chunk: List[str] = []
+    async for key in redis_client.scan_iter(match=LEGACY_KEY_PATTERN, count=SCAN_COUNT):
+        chunk.append(key)
+        if len(chunk) >= CHUNK_SIZE:
+            moved += await migrate_chunk(redis_client, chunk, new_key_prefix)
+            chunk = []
+    if chunk:
+        moved += await migrate_chunk(redis_client, chunk, new_key_prefix)
+
+    print(f"--- 센서 상태 키 {moved}개를 '{new_key_prefix}:{{senior_id}}' 형식으로 옮겼습니다. ---")
+
+
+async def main():
+    load_dotenv(dotenv_path=".env")
+    manager = RedisSessionManager(
+        host=os.getenv("REDIS_HOST"),
+        port=os.getenv("REDIS_PORT"),
+        password=os.getenv("REDIS_PASSWORD"),
+    )
+    await upgrade(manager)
+    await manager.redis_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
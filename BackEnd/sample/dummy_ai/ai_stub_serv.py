@@ -0,0 +1,43 @@
+"""
+로컬 개발/벤치마크용 AI 실행 서버 스텁
+
+실행 (BackEnd 디렉토리에서):
+    uvicorn sample.dummy_ai.ai_stub_serv:app --port 9000
+
+- POST /ai/tick        : 어르신 한 명의 스냅샷 (기존 형식)
+- POST /ai/tick/batch  : 여러 어르신의 열 기반 스냅샷 (AiTickBatchRequest)
+
+실제 모델 대신 "활성 센서가 하나도 없으면 주의" 규칙만 적용합니다.
+"""
+from typing import Dict
+
+from fastapi import FastAPI
+
+from web.schemas.ai_schmas import AiTickBatchRequest, AiTickBatchResponse, AiTickResult, RiskLevelEnum
+
+app = FastAPI(title="AI stub server")
+
+
+def assess(active_sensor_count: int) -> RiskLevelEnum:
+    return RiskLevelEnum.SAFE if active_sensor_count else RiskLevelEnum.CAUTION
+
+
+@app.post("/ai/tick")
+async def tick(payload: Dict):
+    active = sum(1 for value in payload.get("data", {}).values() if value)
+    risk_level = assess(active)
+    return {"senior_id": payload.get("senior_id"), "risk_level": risk_level, "reason": f"active sensors: {active}"}
+
+
+@app.post("/ai/tick/batch", response_model=AiTickBatchResponse)
+async def tick_batch(payload: AiTickBatchRequest):
+    return AiTickBatchResponse(
+        results=[
+            AiTickResult(
+                senior_id=senior_id,
+                risk_level=assess(bin(bitmask).count("1")),
+                reason=f"active sensors: {bin(bitmask).count('1')}",
+            )
+            for senior_id, bitmask in zip(payload.senior_ids, payload.bitmasks)
+        ]
+    )
@@ -0,0 +1,337 @@
+import asyncio
+import json
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import httpx
+import msgspec
+import pytest
+
+from web.schemas.ai_schmas import AiTickBatchRequest, AiTickResult, RiskLevelEnum
+from web.schemas.monitoring_schema import FrontendSensorItem, FrontendSensorStatusPayload
+from web.services.ai_eval_marker import AiEvalMarker
+from web.services.ai_tick import (
+    AI_TICK_SENSOR_NAMES,
+    AiEvalScheduler,
+    AiTickDispatcher,
+    AiTickScheduler,
+    build_tick_batch,
+    build_tick_batch_from_bitmasks,
+)
+from web.services.sensor_state_matrix import SENSOR_COLUMNS, SensorStateMatrix
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_payload(senior_id: int, values: dict, at: datetime = NOW) -> FrontendSensorStatusPayload:
+    sensors = []
+    for sensor_id, value in values.items():
+        sensor_type, _, location = sensor_id.partition("_")
+        sensors.append(
+            FrontendSensorItem(
+                sensor_id=sensor_id, sensor_type=sensor_type, location=location, value=value, last_updated=at
+            )
+        )
+    return FrontendSensorStatusPayload(senior_id=senior_id, sensors=sensors)
+
+
+class FakeSensorStatusManager:
+    """SensorStatusManager의 조회 메서드만 흉내 내는 메모리 저장소 (Redis의 센서 상태 Hash 역할)"""
+
+    def __init__(self, statuses: Optional[Dict[int, FrontendSensorStatusPayload]] = None):
+        self.statuses = statuses or {}
+        self.reads: List[List[int]] = []
+
+    async def get_all_sensor_statuses(self, senior_id: int) -> Optional[FrontendSensorStatusPayload]:
+        self.reads.append([senior_id])
+        return self.statuses.get(senior_id)
+
+    async def get_many_sensor_statuses(self, senior_ids: List[int]) -> Dict[int, Optional[FrontendSensorStatusPayload]]:
+        self.reads.append(list(senior_ids))
+        return {senior_id: self.statuses.get(senior_id) for senior_id in senior_ids}
+
+
+async def test_state_matrix_recovers_dropped_message_from_redis():
+    """pub/sub 메시지가 유실돼 행렬 값이 낡아도, max_age가 지나면 Redis 값으로 다시 채워 보내야 합니다."""
+    sens_man = FakeSensorStatusManager({1: make_payload(1, {SENSOR_COLUMNS[0]: False, SENSOR_COLUMNS[1]: True})})
+    matrix = SensorStateMatrix(max_age=60)
+    dispatcher = AiTickDispatcher(None, sens_man, state_matrix=matrix)
+
+    assert (await dispatcher._build_batch([1]))["bitmasks"] == [0b10]
+
+    # 다른 워커가 Redis에 반영한 변경의 pub/sub 메시지를 이 워커가 놓침
+    sens_man.statuses[1] = make_payload(1, {SENSOR_COLUMNS[0]: True, SENSOR_COLUMNS[1]: True}, at=NOW.replace(second=5))
+    assert (await dispatcher._build_batch([1]))["bitmasks"] == [0b10]
+    assert len(sens_man.reads) == 1
+
+    matrix._complete[1] -= 61
+    assert (await dispatcher._build_batch([1]))["bitmasks"] == [0b11]
+    assert sens_man.reads == [[1], [1]]
+
+
+def make_dispatcher(handler, statuses=None, **kwargs) -> AiTickDispatcher:
+    """AI 서버 대신 httpx.MockTransport(handler)로 응답하는 전송기를 만듭니다."""
+    senior_ids = kwargs.pop("senior_ids", [])
+    sens_man = FakeSensorStatusManager(
+        statuses if statuses is not None else {
+            senior_id: make_payload(senior_id, {SENSOR_COLUMNS[0]: True}) for senior_id in senior_ids
+        }
+    )
+    dispatcher = AiTickDispatcher("http://ai", sens_man, **kwargs)
+    dispatcher._client = httpx.AsyncClient(base_url="http://ai", transport=httpx.MockTransport(handler))
+    return dispatcher
+
+
+async def test_dispatcher_counts_timeouts_and_slow_cycles_as_missed():
+    """요청 제한 시간 초과와 주기 제한 시간을 넘긴 요청은 missed로 집계되어야 합니다."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        senior_id = json.loads(request.content)["senior_id"]
+        if senior_id == 1:
+            raise httpx.ReadTimeout("timed out", request=request)
+        if senior_id == 2:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    dispatcher = make_dispatcher(handler, senior_ids=[1, 2, 3])
+    await dispatcher.run_cycle([1, 2, 3], deadline_seconds=0.1)
+
+    assert dispatcher.stats()["sent"] == 1
+    assert dispatcher.missed == 2
+    assert dispatcher.last_cycle_missed == 2
+    assert dispatcher.failed == 0
+    await dispatcher.close()
+
+
+async def test_dispatcher_counts_http_errors_as_failed():
+    """AI 서버의 오류 응답은 failed로 집계되고 주기는 계속되어야 합니다."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        senior_id = json.loads(request.content)["senior_id"]
+        return httpx.Response(500 if senior_id % 2 else 200, json={})
+
+    dispatcher = make_dispatcher(handler, senior_ids=[1, 2, 3, 4])
+    await dispatcher.run_cycle([1, 2, 3, 4, 5], deadline_seconds=1)
+
+    assert (dispatcher.sent, dispatcher.failed, dispatcher.missed) == (2, 2, 0)
+    # 센서 상태가 없는 어르신(5)은 보내지 않습니다.
+    assert dispatcher.skipped == 1
+    await dispatcher.close()
+
+
+async def test_dispatcher_keeps_in_flight_requests_within_concurrency():
+    """동시에 진행 중인 요청 수는 concurrency를 넘지 않아야 합니다."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    senior_ids = list(range(1, 21))
+    dispatcher = make_dispatcher(handler, senior_ids=senior_ids, concurrency=3)
+    await dispatcher.run_cycle(senior_ids, deadline_seconds=2)
+
+    assert dispatcher.sent == 20
+    assert max_in_flight == 3
+    await dispatcher.close()
+
+
+def test_tick_batch_round_trip():
+    """열 기반 batch 요청은 AiTickBatchRequest로 파싱되고, 비트마스크로 센서 값을 복원할 수 있어야 합니다."""
+    snapshots = [
+        make_payload(7, {"door_bedroom": True, "power_tv": True, "pir_bathroom": False}),
+        make_payload(9, {}),
+    ]
+
+    body = build_tick_batch(snapshots)
+    request = AiTickBatchRequest.model_validate_json(msgspec.json.encode(body))
+
+    assert request.senior_ids == [7, 9]
+    assert request.sensors == AI_TICK_SENSOR_NAMES
+    decoded = {
+        sensor: (request.bitmasks[0] >> bit) & 1 for bit, sensor in enumerate(request.sensors)
+    }
+    assert decoded["door_bedroom"] == 1
+    assert decoded["tv"] == 1
+    assert sum(decoded.values()) == 2
+    assert request.bitmasks[1] == 0
+    assert build_tick_batch_from_bitmasks([7, 9], request.bitmasks)["bitmasks"] == request.bitmasks
+
+
+async def test_send_batch_applies_results_with_risk_level():
+    """batch 응답의 결과 중 risk_level이 있는 것만 on_result로 반영해야 합니다."""
+    requests = []
+    applied: List[AiTickResult] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = AiTickBatchRequest.model_validate_json(request.content)
+        requests.append(body)
+        # 1번 어르신만 위험도가 바뀌었고, 나머지는 보고할 변화가 없음
+        return httpx.Response(200, json={"results": [
+            {"senior_id": 1, "risk_level": RiskLevelEnum.DANGER.value, "reason": "no motion"}
+            if senior_id == 1 else {"senior_id": senior_id}
+            for senior_id in body.senior_ids
+        ]})
+
+    async def on_result(result: AiTickResult) -> None:
+        applied.append(result)
+
+    dispatcher = make_dispatcher(handler, senior_ids=[1, 2, 3], batch_size=2, on_result=on_result)
+    await dispatcher.run_cycle([1, 2, 3], deadline_seconds=1)
+
+    assert sorted(body.senior_ids for body in requests) == [[1, 2], [3]]
+    assert dispatcher.sent == 3
+    assert sorted((result.senior_id, result.risk_level) for result in applied) == [(1, RiskLevelEnum.DANGER)]
+    assert applied[0].reason == "no motion"
+    await dispatcher.close()
+
+
+async def test_send_batch_counts_malformed_response_as_failed():
+    """형식이 맞지 않는 batch 응답은 묶음 전체를 failed로 집계하고 결과를 반영하지 않아야 합니다."""
+    applied = []
+
+    async def on_result(result: AiTickResult) -> None:
+        applied.append(result)
+
+    dispatcher = make_dispatcher(
+        lambda request: httpx.Response(200, json={"unexpected": []}),
+        senior_ids=[1, 2], batch_size=10, on_result=on_result,
+    )
+    await dispatcher.run_cycle([1, 2], deadline_seconds=1)
+
+    assert (dispatcher.sent, dispatcher.failed) == (0, 2)
+    assert applied == []
+    await dispatcher.close()
+
+
+def test_phase_slots_spread_consecutive_ids_evenly():
+    """연속된 senior_id도 곱셈 해시로 모든 구간에 고르게 배정되어야 합니다."""
+    slots = 10
+    counts = Counter(AiTickScheduler.phase_slot(senior_id, slots) for senior_id in range(1, 10001))
+
+    assert sorted(counts) == list(range(slots))
+    assert max(counts.values()) - min(counts.values()) <= 100
+    assert AiTickScheduler.phase_slot(1234, slots) == AiTickScheduler.phase_slot(1234, slots)
+
+
+class SlowDispatcher:
+    """주기 제한 시간을 무시하고 오래 걸리는 전송기 (구간 작업이 다음 구간을 넘기는 상황)"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.calls: List[List[int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run_cycle(self, senior_ids: List[int], deadline_seconds: Optional[float] = None) -> None:
+        self.calls.append(list(senior_ids))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.seconds)
+        self.in_flight -= 1
+
+
+async def test_overrunning_slot_is_skipped_not_stacked():
+    """구간 작업이 길어져 다음 구간을 통째로 놓치면, 몰아서 보내지 않고 skipped로 집계해야 합니다."""
+    async def load_senior_ids() -> List[int]:
+        return list(range(1, 101))
+
+    dispatcher = SlowDispatcher(seconds=0.25)
+    scheduler = AiTickScheduler(dispatcher, load_senior_ids, interval=0.4, slots=4, late_tolerance=0.01)
+
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.9)
+    scheduler.stop()
+    await task
+
+    stats = scheduler.stats()
+    assert dispatcher.max_in_flight == 1
+    assert stats["skipped_slots"] >= 2
+    assert stats["skipped_seniors"] > 0
+    assert stats["late_slots"] >= 1
+    assert stats["slots_run"] == len(dispatcher.calls)
+    assert stats["slots_run"] + stats["skipped_slots"] >= 4
+
+
+async def load_no_seniors() -> List[int]:
+    return []
+
+
+async def test_mark_changed_debounces_within_min_interval(redis_session_manager):
+    """방금 평가한 어르신은 최소 간격 뒤로 예약되고, 여러 번 바뀌어도 예약은 하나이며 뒤로 밀리지 않아야 합니다."""
+    marker = AiEvalMarker(redis_session_manager, min_interval=5)
+    redis_client = await redis_session_manager.get_client()
+
+    # 평가한 적 없는 어르신은 바로 평가 대상
+    before = time.time()
+    await marker.mark_changed(1)
+    assert before <= await redis_client.zscore(marker.due_key, "1") <= time.time()
+
+    # 방금 평가되어 다음 예약이 heartbeat(now + 300)로 밀린 어르신
+    evaluated_at = time.time()
+    await redis_client.hset(marker.last_key, "2", evaluated_at)
+    await redis_client.zadd(marker.due_key, {"2": evaluated_at + 300})
+
+    await marker.mark_changed(2)
+    due = await redis_client.zscore(marker.due_key, "2")
+    assert due == pytest.approx(evaluated_at + 5)
+
+    await marker.mark_changed(2)
+    assert await redis_client.zscore(marker.due_key, "2") == due
+    assert await redis_client.zcard(marker.due_key) == 2
+    assert marker.marked == 3
+
+
+async def test_claim_reschedules_to_max_staleness(redis_session_manager):
+    """가져간 어르신은 max_staleness 뒤로 다시 예약되어, 변화가 없어도 그 간격마다 평가되어야 합니다."""
+    scheduler = AiEvalScheduler(None, redis_session_manager, load_no_seniors, max_staleness=0.2, claim_limit=10)
+    redis_client = await redis_session_manager.get_client()
+    now = time.time()
+    await redis_client.zadd(scheduler.due_key, {"1": now - 1, "2": now - 1, "3": now + 100})
+
+    assert sorted(await scheduler.claim_due()) == [1, 2]
+    assert await redis_client.zscore(scheduler.due_key, "1") == pytest.approx(now + 0.2, abs=0.1)
+    assert await redis_client.hget(scheduler.last_key, "1") is not None
+    assert await scheduler.claim_due() == []
+
+    await asyncio.sleep(0.25)
+    assert sorted(await scheduler.claim_due()) == [1, 2]
+
+
+async def test_claim_is_atomic_across_workers(redis_session_manager):
+    """여러 워커가 동시에 가져가도 한 어르신은 한 워커에만 돌아가야 합니다."""
+    redis_client = await redis_session_manager.get_client()
+    workers = [
+        AiEvalScheduler(None, redis_session_manager, load_no_seniors, max_staleness=300, claim_limit=30)
+        for _ in range(4)
+    ]
+    now = time.time()
+    await redis_client.zadd(workers[0].due_key, {str(senior_id): now - 1 for senior_id in range(1, 101)})
+
+    claims = await asyncio.gather(*(worker.claim_due() for worker in workers))
+
+    claimed = [senior_id for claim in claims for senior_id in claim]
+    assert all(len(claim) <= 30 for claim in claims)
+    assert len(claimed) == len(set(claimed)) == 100
+
+
+async def test_sync_roster_schedules_new_and_drops_removed_seniors(redis_session_manager):
+    """어르신 목록과 맞출 때 새 어르신은 바로 예약하고, 삭제된 어르신의 예약은 지워야 합니다."""
+    async def load_senior_ids() -> List[int]:
+        return [1, 2]
+
+    scheduler = AiEvalScheduler(None, redis_session_manager, load_senior_ids)
+    redis_client = await redis_session_manager.get_client()
+    await redis_client.zadd(scheduler.due_key, {"2": time.time() + 100, "9": time.time() + 100})
+    await redis_client.hset(scheduler.last_key, "9", time.time())
+
+    await scheduler._sync_roster()
+
+    assert sorted(await redis_client.zrange(scheduler.due_key, 0, -1)) == ["1", "2"]
+    assert await redis_client.zscore(scheduler.due_key, "2") > time.time() + 50
+    assert await redis_client.hget(scheduler.last_key, "9") is None
@@ -103,4 +103,29 @@ async def test_verify_fails_with_wrong_api_key(get_session: AsyncSession):
     is_correct = await key_repo.is_correct_key(wrong_api_key, hub_id)
 
     # Assert (검증)
-    assert is_correct is False
\ No newline at end of file
+    assert is_correct is False
+
+@pytest.mark.asyncio
+async def test_rotated_key_is_not_served_from_cache(get_session: AsyncSession):
+    """
+    키를 재발급하면 캐시된 이전 키로는 더 이상 허브가 조회되지 않아야 합니다.
+    """
+    # Arrange (준비)
+    db_session: AsyncSession = get_session
+    key_manager = ApiKeyManager()
+    key_repo = ApiKeyRepository(db_session)
+
+    hub_manager = IotHubManager(db_session)
+    hub_id = (await hub_manager.add_hub(HubCreate(device_id="device1"))).hub_id
+
+    old_api_key, old_hashed_key = key_manager.generate_api_key()
+    await key_repo.update_hash_for_hub(old_hashed_key, hub_id)
+    assert (await key_repo.get_hub_by_api_key(old_api_key)).hub_id == hub_id
+
+    # Act (실행)
+    new_api_key, new_hashed_key = key_manager.generate_api_key()
+    await key_repo.update_hash_for_hub(new_hashed_key, hub_id)
+
+    # Assert (검증)
+    assert await key_repo.get_hub_by_api_key(old_api_key) is None
+    assert (await key_repo.get_hub_by_api_key(new_api_key)).hub_id == hub_id
@@ -7,7 +7,7 @@ from typing import AsyncGenerator
 
 # 프로젝트 구조에 맞게 db_manager.py의 경로를 수정해주세요.
 # 예: from src.database.db_manager import PostgressqlSessionManager
-from common.modules.db_manager import PostgressqlSessionManager 
+from common.modules.db_manager import PostgressqlSessionManager, RedisSessionManager
 
 # --- Fixture 설정 ---
 
@@ -44,3 +44,31 @@ async def get_session(db_manager: PostgressqlSessionManager) -> AsyncGenerator[A
     async with db_manager.AsyncSessionMaker() as async_session:
         async with async_session.begin() as transaction:
             yield async_session
+
+
+@pytest_asyncio.fixture(scope="function")
+async def redis_session_manager() -> AsyncGenerator[RedisSessionManager, None]:
+    """
+    테스트용 Redis(TEST_REDIS_DB번 DB)에 연결합니다. 테스트 전후로 해당 DB를 비웁니다.
+    Redis에 연결할 수 없으면 테스트를 건너뜁니다.
+    """
+    load_dotenv(dotenv_path=".env")
+
+    manager = RedisSessionManager(
+        host=os.getenv("TEST_REDIS_HOST", os.getenv("REDIS_HOST", "localhost")),
+        port=int(os.getenv("TEST_REDIS_PORT", os.getenv("REDIS_PORT", "6379"))),
+        password=os.getenv("REDIS_PASSWORD"),
+        db=int(os.getenv("TEST_REDIS_DB", "15")),
+        retry_attempts=0,
+    )
+    redis_client = await manager.get_client()
+    try:
+        await redis_client.ping()
+    except Exception as e:
+        await manager.pool.disconnect()
+        pytest.skip(f"Redis를 사용할 수 없습니다: {e}")
+
+    await redis_client.flushdb()
+    yield manager
+    await redis_client.flushdb()
+    await manager.pool.disconnect()
@@ -0,0 +1,165 @@
+from datetime import datetime, timezone
+
+import pytest
+
+import web.services.data_alarm as data_alarm
+from web.schemas.monitoring_schema import FrontendSensorItem, FrontendSensorStatusPayload, RiskLevel, SeniorStatus
+from web.schemas.socket_event import NotifyEvents
+
+NOW = datetime(2025, 9, 20, 11, 0, 10, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    """sio.emit 대신 (이벤트, 데이터, 대상)을 기록합니다."""
+    events = []
+
+    async def fake_emit(event, data, to=None):
+        events.append((event, data, to))
+
+    monkeypatch.setattr(data_alarm.sio, "emit", fake_emit)
+    return events
+
+
+def make_sensor_log(senior_id: int = 7) -> FrontendSensorStatusPayload:
+    return FrontendSensorStatusPayload(
+        senior_id=senior_id,
+        sensors=[
+            FrontendSensorItem(
+                sensor_id="door_bedroom", sensor_type="door", location="bedroom", value=True, last_updated=NOW
+            ),
+            FrontendSensorItem(sensor_id="tv", sensor_type="power", location="livingroom", value=False, last_updated=NOW),
+        ],
+    )
+
+
+def make_status(senior_id: int, status: RiskLevel = RiskLevel.DANGER) -> SeniorStatus:
+    return SeniorStatus(senior_id=senior_id, status=status, reason=f"reason {senior_id}", last_updated=NOW)
+
+
+@pytest.mark.parametrize(
+    "mode, events",
+    [
+        ("item", [NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_CHANGE] * 2),
+        ("batch", [NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_BATCH]),
+        ("both", [NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_BATCH] + [NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_CHANGE] * 2),
+    ],
+)
+async def test_sensor_notify_mode_events(monkeypatch, emitted, mode, events):
+    """SENSOR_NOTIFY_MODE에 따라 보내는 이벤트가 달라지고, 모두 어르신 room으로 보내야 합니다."""
+    monkeypatch.setattr(data_alarm, "SENSOR_NOTIFY_MODE", mode)
+
+    await data_alarm.notify_sensor_status_log_change(make_sensor_log(7))
+
+    assert [event for event, _, _ in emitted] == events
+    assert {to for _, _, to in emitted} == {"senior:7"}
+
+
+async def test_sensor_item_payload(monkeypatch, emitted):
+    """item 방식은 센서마다 어르신 ID가 채워진 센서 항목 하나를 보내야 합니다."""
+    monkeypatch.setattr(data_alarm, "SENSOR_NOTIFY_MODE", "item")
+
+    await data_alarm.notify_sensor_status_log_change(make_sensor_log(7))
+
+    assert emitted[0][1] == {
+        "senior_id": 7,
+        "sensor_id": "door_bedroom",
+        "sensor_type": "door",
+        "location": "bedroom",
+        "value": True,
+        "last_updated": "2025-09-20T11:00:10Z",
+        "status": "active",
+    }
+    assert emitted[1][1]["sensor_id"] == "tv"
+
+
+async def test_sensor_batch_payload(monkeypatch, emitted):
+    """batch 방식은 변경 센서 전체와 가장 최근 변경 시각을 이벤트 하나로 보내야 합니다."""
+    monkeypatch.setattr(data_alarm, "SENSOR_NOTIFY_MODE", "batch")
+
+    await data_alarm.notify_sensor_status_log_change(make_sensor_log(7))
+
+    _, payload, _ = emitted[0]
+    assert payload["senior_id"] == 7
+    assert payload["last_updated"] == "2025-09-20T11:00:10Z"
+    assert [(item["senior_id"], item["sensor_id"]) for item in payload["sensors"]] == [(7, "door_bedroom"), (7, "tv")]
+
+
+async def test_sensor_notify_to_socket_and_empty_log(monkeypatch, emitted):
+    """recv_sid를 넘기면 그 소켓에만 보내고, 변경 센서가 없으면 아무것도 보내지 않아야 합니다."""
+    monkeypatch.setattr(data_alarm, "SENSOR_NOTIFY_MODE", "both")
+
+    await data_alarm.notify_sensor_status_log_change(make_sensor_log(7), recv_sid="sid-1")
+    await data_alarm.notify_sensor_status_log_change(FrontendSensorStatusPayload(senior_id=7, sensors=[]))
+
+    assert len(emitted) == 3
+    assert {to for _, _, to in emitted} == {"sid-1"}
+
+
+@pytest.mark.parametrize(
+    "mode, expected",
+    [
+        (
+            "item",
+            [
+                (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, "senior:1"),
+                (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, "senior:2"),
+            ],
+        ),
+        (
+            "batch",
+            [
+                (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH, "staff:10"),
+                (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH, "staff:20"),
+            ],
+        ),
+        (
+            "both",
+            [
+                (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH, "staff:10"),
+                (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH, "staff:20"),
+                (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, "senior:1"),
+                (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, "senior:2"),
+            ],
+        ),
+    ],
+)
+async def test_senior_notify_mode_events(monkeypatch, emitted, mode, expected):
+    """SENIOR_NOTIFY_MODE에 따라 어르신 room 또는 직원 room으로 보내야 합니다."""
+    monkeypatch.setattr(data_alarm, "SENIOR_NOTIFY_MODE", mode)
+
+    await data_alarm.notify_senior_status_batch([make_status(1), make_status(2)], {10: [1, 2], 20: [2, 3]})
+
+    assert [(event, to) for event, _, to in emitted] == expected
+
+
+async def test_senior_payloads(monkeypatch, emitted):
+    """item은 어르신 상태 하나, batch는 직원이 담당하는 (변경된) 어르신 상태 목록을 보내야 합니다."""
+    monkeypatch.setattr(data_alarm, "SENIOR_NOTIFY_MODE", "both")
+
+    await data_alarm.notify_senior_status_batch(
+        [make_status(1), make_status(2, RiskLevel.NORMAL)], {10: [1, 2], 20: [2, 3], 30: [4]}
+    )
+
+    payloads = {(event, to): data for event, data, to in emitted}
+    status_1 = {
+        "senior_id": 1,
+        "status": RiskLevel.DANGER.value,
+        "reason": "reason 1",
+        "last_updated": "2025-09-20T11:00:10Z",
+    }
+    assert payloads[(NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, "senior:1")] == status_1
+    assert payloads[(NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH, "staff:10")] == [
+        status_1,
+        {**status_1, "senior_id": 2, "status": RiskLevel.NORMAL.value, "reason": "reason 2"},
+    ]
+    assert [item["senior_id"] for item in payloads[(NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH, "staff:20")]] == [2]
+    # 변경된 어르신이 없는 직원에게는 보내지 않습니다.
+    assert (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH, "staff:30") not in payloads
+
+
+async def test_senior_notify_without_statuses(emitted):
+    """변경된 어르신 상태가 없으면 아무것도 보내지 않아야 합니다."""
+    await data_alarm.notify_senior_status_batch([], {10: [1]})
+
+    assert emitted == []
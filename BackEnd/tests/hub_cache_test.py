@@ -0,0 +1,116 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+import web.routers.auth as auth_router
+from common.modules.api_key_manager import ApiKeyRepository
+from common.modules.hub_cache import HubCache
+from common.modules.iot_hub_manager import IotHubManager
+from common.schemas.hub_schema import HubBasicInfo
+from web.services.database import db
+
+
+def make_hub(hub_id: int, senior_id: int = 1) -> HubBasicInfo:
+    return HubBasicInfo(hub_id=hub_id, senior_id=senior_id, device_id=f"device{hub_id}")
+
+
+@pytest.mark.asyncio
+async def test_hit_and_miss_counters():
+    """저장된 키는 적중, 없는 키는 실패로 집계되는지 테스트합니다."""
+    cache = HubCache(ttl_seconds=60, max_size=10)
+
+    assert await cache.get("hash1") is None
+    await cache.set("hash1", make_hub(1))
+    cached = await cache.get("hash1")
+
+    assert cached.hub_id == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_miss():
+    """TTL이 지난 항목은 조회되지 않아야 합니다."""
+    cache = HubCache(ttl_seconds=0, max_size=10)
+
+    await cache.set("hash1", make_hub(1))
+
+    assert await cache.get("hash1") is None
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    """최대 크기를 넘으면 가장 오래 사용하지 않은 항목이 제거되어야 합니다."""
+    cache = HubCache(ttl_seconds=60, max_size=2)
+
+    await cache.set("hash1", make_hub(1))
+    await cache.set("hash2", make_hub(2))
+    await cache.get("hash1")  # hash1을 최근 사용으로 갱신
+    await cache.set("hash3", make_hub(3))
+
+    assert await cache.get("hash1") is not None
+    assert await cache.get("hash2") is None
+    assert await cache.get("hash3") is not None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_by_hash_and_hub_id():
+    """키 해시와 허브 ID 기준 무효화가 모두 동작하는지 테스트합니다."""
+    cache = HubCache(ttl_seconds=60, max_size=10)
+
+    await cache.set("hash1", make_hub(1))
+    await cache.set("hash2", make_hub(2))
+
+    await cache.invalidate("hash1")
+    await cache.invalidate_hub(2)
+
+    assert await cache.get("hash1") is None
+    assert await cache.get("hash2") is None
+    assert cache.stats()["invalidations"] == 2
+
+
+class FakeSession:
+    def __init__(self, events: list):
+        self.events = events
+
+    async def commit(self):
+        self.events.append("commit")
+
+
+async def test_register_hub_invalidates_cache_after_commit(monkeypatch):
+    """API 키를 다시 발급하면 커밋 후에 허브/새 키의 캐시를 무효화해야 합니다. (커밋 전 정보가 다시 캐시되지 않도록)"""
+    events = []
+
+    async def get_hub_by_device_id(self, device_id: str):
+        return HubBasicInfo(hub_id=3, senior_id=1, device_id=device_id)
+
+    async def check_key_duplicated(self, hashed_key: str) -> bool:
+        return False
+
+    async def update_hash_for_hub(self, hashed_key: str, hub_id: int) -> None:
+        events.append(("update", hub_id))
+
+    async def invalidate_hub(hub_id: int) -> None:
+        events.append(("invalidate_hub", hub_id))
+
+    async def invalidate(api_key_hash: str) -> None:
+        events.append(("invalidate", api_key_hash))
+
+    monkeypatch.setattr(IotHubManager, "get_hub_by_device_id", get_hub_by_device_id)
+    monkeypatch.setattr(ApiKeyRepository, "check_key_duplicated", check_key_duplicated)
+    monkeypatch.setattr(ApiKeyRepository, "update_hash_for_hub", update_hash_for_hub)
+    monkeypatch.setattr(auth_router.hub_cache, "invalidate_hub", invalidate_hub)
+    monkeypatch.setattr(auth_router.hub_cache, "invalidate", invalidate)
+
+    app = FastAPI()
+    app.include_router(auth_router.router)
+    app.dependency_overrides[db.get_session] = lambda: FakeSession(events)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/hubs", json={"device_id": "device3"})
+
+    assert response.status_code == 201
+    assert events[:3] == [("update", 3), "commit", ("invalidate_hub", 3)]
+    assert events[3][0] == "invalidate"
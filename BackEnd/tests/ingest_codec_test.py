@@ -0,0 +1,49 @@
+import datetime
+
+import msgspec
+import pytest
+
+from common.models.enums import SENSOR_TYPE_CODES, SensorTypeEnum
+from web.schemas.iot_schema import SensorDataItem, SensorLogPayload
+from web.services.ingest_codec import decode_sensor_log_msgpack, encode_sensor_log_msgpack
+
+
+def test_msgpack_round_trip():
+    """msgpack으로 인코딩한 페이로드가 JSON 경로와 같은 모델로 디코딩되는지 테스트합니다."""
+    timestamp = datetime.datetime(2025, 1, 1, 9, 30, 0, 123000, tzinfo=datetime.timezone.utc)
+    payload = SensorLogPayload(
+        api_key="test-api-key",
+        sensor_data=[
+            SensorDataItem(sensor_type=SensorTypeEnum.DOOR_ENTRANCE, sensor_value=True, timestamp=timestamp),
+            SensorDataItem(
+                sensor_type=SENSOR_TYPE_CODES[-1],
+                sensor_value=False,
+                event_description="test",
+                timestamp=timestamp,
+            ),
+        ],
+    )
+
+    decoded = decode_sensor_log_msgpack(encode_sensor_log_msgpack(payload))
+
+    assert decoded.api_key == payload.api_key
+    for decoded_item, item in zip(decoded.sensor_data, payload.sensor_data, strict=True):
+        assert decoded_item.sensor_type == item.sensor_type
+        assert decoded_item.sensor_value == item.sensor_value
+        assert decoded_item.event_description == item.event_description
+        assert decoded_item.timestamp == item.timestamp
+
+
+def test_unknown_sensor_code_rejected():
+    """정의되지 않은 센서 코드는 ValueError로 거부되어야 합니다."""
+    timestamp = datetime.datetime.now(datetime.timezone.utc)
+    body = msgspec.msgpack.encode({"api_key": "k", "sensor_data": [[len(SENSOR_TYPE_CODES), True, timestamp]]})
+
+    with pytest.raises(ValueError):
+        decode_sensor_log_msgpack(body)
+
+
+def test_malformed_body_rejected():
+    """형식이 잘못된 본문은 ValueError로 거부되어야 합니다."""
+    with pytest.raises(ValueError):
+        decode_sensor_log_msgpack(b"\x00not-msgpack")
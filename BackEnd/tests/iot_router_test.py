@@ -0,0 +1,284 @@
+import json
+from typing import List, Optional
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from starlette.requests import Request
+
+import web.routers.iot as iot_router
+import web.services.ingest_pipeline as ingest_pipeline
+from common.modules.api_key_manager import ApiKeyRepository
+from common.modules.sensor_log_queue import SensorLogQueue
+from common.schemas.hub_schema import HubBasicInfo
+from web.schemas.iot_schema import SensorLogPayload
+from web.services.database import db
+from web.services.ingest_pipeline import SensorIngestPipeline
+
+TIMESTAMP = "2025-01-01T09:00:00Z"
+
+
+def make_group(api_key: str, count: int = 1) -> dict:
+    return {
+        "api_key": api_key,
+        "sensor_data": [
+            {"sensor_type": "door_entrance", "sensor_value": i % 2 == 0, "timestamp": TIMESTAMP} for i in range(count)
+        ],
+    }
+
+
+def make_request(chunks: List[bytes]) -> Request:
+    """본문을 chunks 단위로 나눠 받는 Request를 만듭니다."""
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive():
+        return messages.pop(0)
+
+    return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+
+async def collect(groups) -> list:
+    return [group async for group in groups]
+
+
+# --- 그룹 파서 ---
+
+
+async def test_ndjson_groups_parse_lines_split_across_chunks():
+    """줄이 chunk 경계에서 잘려도 한 줄씩 파싱하고, 빈 줄은 건너뛰고, 잘못된 줄은 오류 메시지로 반환해야 합니다."""
+    body = (
+        json.dumps(make_group("key-1", 2)) + "\n\n"
+        + "{not json}\n"
+        + json.dumps({"sensor_data": []}) + "\n"
+        + json.dumps(make_group("key-2"))
+    ).encode()
+
+    groups = await collect(iot_router._iter_ndjson_groups(make_request([body[:10], body[10:37], body[37:]])))
+
+    assert len(groups) == 4
+    assert isinstance(groups[0], SensorLogPayload) and len(groups[0].sensor_data) == 2
+    assert isinstance(groups[1], str)
+    assert isinstance(groups[2], str) and "api_key" in groups[2]
+    # 마지막 줄바꿈이 없는 마지막 줄도 파싱합니다.
+    assert groups[3].api_key == "key-2"
+
+
+async def test_ndjson_groups_enforce_max_groups(monkeypatch):
+    """그룹 수가 MAX_BATCH_GROUPS를 넘으면 413을 반환해야 합니다. (줄바꿈 없는 마지막 줄 포함)"""
+    monkeypatch.setattr(iot_router, "MAX_BATCH_GROUPS", 2)
+    lines = [json.dumps(make_group(f"key-{i}")) for i in range(3)]
+
+    for body in ("\n".join(lines) + "\n", "\n".join(lines)):
+        with pytest.raises(HTTPException) as exc_info:
+            await collect(iot_router._iter_ndjson_groups(make_request([body.encode()])))
+        assert exc_info.value.status_code == 413
+
+    assert len(await collect(iot_router._iter_ndjson_groups(make_request(["\n".join(lines[:2]).encode()])))) == 2
+
+
+async def test_json_groups_validate_each_group(monkeypatch):
+    """JSON 본문은 그룹마다 검증하고, 형식이 틀린 본문은 422, 그룹 수 초과는 413을 반환해야 합니다."""
+    body = json.dumps({"groups": [make_group("key-1"), {"api_key": "key-2", "sensor_data": "oops"}]}).encode()
+    groups = await collect(iot_router._iter_json_groups(make_request([body])))
+    assert groups[0].api_key == "key-1"
+    assert isinstance(groups[1], str)
+
+    for bad_body in (b"{not json", b"[]", b'{"items": []}', b'{"groups": {}}'):
+        with pytest.raises(HTTPException) as exc_info:
+            await collect(iot_router._iter_json_groups(make_request([bad_body])))
+        assert exc_info.value.status_code == 422
+
+    monkeypatch.setattr(iot_router, "MAX_BATCH_GROUPS", 1)
+    with pytest.raises(HTTPException) as exc_info:
+        await collect(iot_router._iter_json_groups(make_request([body])))
+    assert exc_info.value.status_code == 413
+
+
+# --- POST /iot/logs/batch ---
+
+
+class FakeSession:
+    def __init__(self, events: list):
+        self.events = events
+
+    async def commit(self):
+        self.events.append("commit")
+
+
+@pytest.fixture
+def batch_app(monkeypatch):
+    """DB/Redis 대신 API 키 조회, 저장, 캐싱/알림을 기록만 하는 /iot 라우터 앱"""
+    events = []
+    hubs = {
+        "key-1": HubBasicInfo(hub_id=1, senior_id=7),
+        "key-2": HubBasicInfo(hub_id=2, senior_id=8),
+        "key-no-senior": HubBasicInfo(hub_id=3, senior_id=None),
+    }
+
+    async def get_hub_by_api_key(self, api_key: str) -> Optional[HubBasicInfo]:
+        events.append(("resolve", api_key))
+        return hubs.get(api_key)
+
+    async def persist(self, ctx, sensor_data):
+        events.append(("persist", [(ctx.senior_id, len(sensor_data))]))
+
+    async def persist_many(self, accepted):
+        events.append(("persist", [(ctx.senior_id, len(sensor_data)) for ctx, sensor_data in accepted]))
+
+    async def publish(self, accepted):
+        events.append(("publish", [ctx.senior_id for ctx, _ in accepted]))
+
+    async def get_session():
+        yield FakeSession(events)
+
+    monkeypatch.setattr(ApiKeyRepository, "get_hub_by_api_key", get_hub_by_api_key)
+    monkeypatch.setattr(SensorIngestPipeline, "persist", persist)
+    monkeypatch.setattr(SensorIngestPipeline, "persist_many", persist_many)
+    monkeypatch.setattr(SensorIngestPipeline, "publish", publish)
+
+    app = FastAPI()
+    app.include_router(iot_router.router)
+    app.dependency_overrides[db.get_session] = get_session
+    return app, events
+
+
+async def post_batch(app: FastAPI, **kwargs) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.post("/iot/logs/batch", **kwargs)
+
+
+async def test_batch_reports_each_group_and_commits_before_publish(batch_app):
+    """그룹별 결과를 요청 순서대로 반환하고, 키마다 한 번만 인증하며, 커밋 후에 캐싱/알림을 수행해야 합니다."""
+    app, events = batch_app
+    body = {"groups": [
+        make_group("key-1", 2),
+        make_group("unknown"),
+        make_group("key-no-senior"),
+        {"api_key": "key-2"},
+        make_group("key-1", 1),
+    ]}
+
+    response = await post_batch(app, json=body)
+
+    assert response.status_code == 201
+    results = response.json()["results"]
+    assert [(result["index"], result["status"], result["accepted"]) for result in results] == [
+        (0, "ok", 2), (1, "unauthorized", 0), (2, "no_senior", 0), (3, "invalid", 0), (4, "ok", 1),
+    ]
+    assert [event for event in events if event[0] == "resolve"] == [
+        ("resolve", "key-1"), ("resolve", "unknown"), ("resolve", "key-no-senior"),
+    ]
+    assert [event if isinstance(event, str) else event[0] for event in events][-3:] == ["persist", "commit", "publish"]
+    assert ("persist", [(7, 2), (7, 1)]) in events
+
+
+async def test_batch_streams_ndjson(batch_app):
+    """NDJSON 본문은 받는 대로 파싱하고, 잘못된 줄은 invalid로 보고해야 합니다."""
+    app, events = batch_app
+    lines = [json.dumps(make_group("key-1")), "{broken", json.dumps(make_group("key-2", 3))]
+
+    async def body():
+        for line in lines:
+            yield (line + "\n").encode()
+
+    response = await post_batch(app, content=body(), headers={"content-type": "application/x-ndjson"})
+
+    assert response.status_code == 201
+    assert [result["status"] for result in response.json()["results"]] == ["ok", "invalid", "ok"]
+    assert ("persist", [(7, 1), (8, 3)]) in events
+
+
+async def test_batch_rejects_too_many_groups_without_saving(monkeypatch, batch_app):
+    """그룹 수 초과 요청은 413을 반환하고 아무것도 저장/커밋하지 않아야 합니다."""
+    app, events = batch_app
+    monkeypatch.setattr(iot_router, "MAX_BATCH_GROUPS", 1)
+
+    response = await post_batch(app, json={"groups": [make_group("key-1"), make_group("key-2")]})
+
+    assert response.status_code == 413
+    assert events == []
+
+
+async def post_log(app: FastAPI, body: dict) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.post("/iot/logs", json=body)
+
+
+async def test_single_log_commits_before_publish(batch_app):
+    """단건 수신도 저장 -> 커밋 후에 캐싱/알림/평가 예약을 수행해야 합니다."""
+    app, events = batch_app
+
+    response = await post_log(app, make_group("key-1", 2))
+
+    assert response.status_code == 201
+    assert events == [("resolve", "key-1"), ("persist", [(7, 2)]), "commit", ("publish", [7])]
+
+
+async def test_single_log_failed_commit_skips_publish(monkeypatch, batch_app):
+    """커밋에 실패하면 저장되지 않은 센서 상태를 캐싱/알림하지 않아야 합니다."""
+    app, events = batch_app
+
+    async def failing_commit(self):
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(FakeSession, "commit", failing_commit)
+
+    with pytest.raises(RuntimeError):
+        await post_log(app, make_group("key-1", 2))
+    assert not [event for event in events if event[0] == "publish"]
+
+
+async def test_single_log_unknown_senior_is_404_but_other_errors_are_not(monkeypatch, batch_app):
+    """어르신이 없는 허브만 404로 응답하고, 파이프라인의 다른 ValueError는 404로 숨기지 않아야 합니다."""
+    app, events = batch_app
+
+    response = await post_log(app, make_group("key-no-senior"))
+    assert response.status_code == 404
+    assert "No senior assigned" in response.json()["detail"]
+
+    async def broken_persist(self, ctx, sensor_data):
+        raise ValueError("codec bug")
+
+    monkeypatch.setattr(SensorIngestPipeline, "persist", broken_persist)
+    with pytest.raises(ValueError, match="codec bug"):
+        await post_log(app, make_group("key-1"))
+    assert "commit" not in events
+
+
+@pytest.fixture
+def full_queue_app(monkeypatch, redis_session_manager):
+    """write-behind 큐가 가득 찬 상태의 /iot 라우터 앱 (API 키 조회만 대체)"""
+    events = []
+
+    async def get_hub_by_api_key(self, api_key: str) -> Optional[HubBasicInfo]:
+        return HubBasicInfo(hub_id=1, senior_id=7)
+
+    async def get_session():
+        yield FakeSession(events)
+
+    full_queue = SensorLogQueue(redis_session_manager, stream="test:stream", max_entries=0)
+    monkeypatch.setattr(ApiKeyRepository, "get_hub_by_api_key", get_hub_by_api_key)
+    monkeypatch.setattr(ingest_pipeline, "get_write_queue", lambda: full_queue)
+
+    app = FastAPI()
+    app.include_router(iot_router.router)
+    app.dependency_overrides[db.get_session] = get_session
+    return app, events
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/iot/logs", make_group("key-1", 2)),
+    ("/iot/logs/batch", {"groups": [make_group("key-1", 2)]}),
+])
+async def test_full_write_queue_returns_503_with_retry_after(full_queue_app, path, body):
+    """write-behind 큐가 가득 차면 503과 Retry-After를 반환하고 커밋하지 않아야 합니다."""
+    app, events = full_queue_app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(path, json=body)
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+    assert "full" in response.json()["detail"]
+    assert events == []
@@ -0,0 +1,41 @@
+import json
+import logging
+
+from common.modules.log_manager import JsonFormatter, SamplingFilter, sampled
+
+
+def _record(msg: str, **extra) -> logging.LogRecord:
+    record = logging.makeLogRecord({"name": "test", "levelname": "INFO", "msg": msg, "args": ()})
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_sampling_filter_passes_one_of_every_n():
+    """sampled() 로그는 같은 메시지 형식마다 every개 중 한 개만 통과해야 합니다."""
+    sampling = SamplingFilter()
+
+    passed = [sampling.filter(_record("hot %s", **sampled(10))) for _ in range(30)]
+    other = sampling.filter(_record("other %s", **sampled(10)))
+
+    assert sum(passed) == 3
+    assert passed[0] is True
+    assert other is True
+
+
+def test_sampling_filter_passes_unsampled_records():
+    """sample_every가 없는 로그는 모두 통과해야 합니다."""
+    sampling = SamplingFilter()
+
+    assert all(sampling.filter(_record("normal")) for _ in range(5))
+
+
+def test_json_formatter_includes_extra_fields():
+    """JSON 형식에는 메시지와 extra 필드가 포함되고 sample_every는 빠져야 합니다."""
+    line = JsonFormatter().format(_record("어르신 상태 갱신", senior_id=7, **sampled(10)))
+    data = json.loads(line)
+
+    assert data["msg"] == "어르신 상태 갱신"
+    assert data["senior_id"] == 7
+    assert data["logger"] == "test"
+    assert "sample_every" not in data
@@ -0,0 +1,34 @@
+import httpx
+from fastapi import FastAPI
+
+import web.routers.metrics as metrics_router
+from web.services.auth_service import auth_module
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(metrics_router.router)
+    return app
+
+
+async def get_metrics(app: FastAPI, **kwargs) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get("/metrics", **kwargs)
+
+
+async def test_metrics_requires_login():
+    """토큰 없이 내부 지표를 조회하면 401을 반환해야 합니다."""
+    response = await get_metrics(make_app())
+
+    assert response.status_code == 401
+
+
+async def test_metrics_for_logged_in_staff():
+    """로그인한 직원은 캐시 등 내부 지표를 조회할 수 있어야 합니다."""
+    app = make_app()
+    app.dependency_overrides[auth_module.get_current_user] = lambda: {"staff_id": 1}
+
+    response = await get_metrics(app, headers={"Authorization": "Bearer token"})
+
+    assert response.status_code == 200
+    assert "hub_cache" in response.json()
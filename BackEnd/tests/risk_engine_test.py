@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+import web.services.risk_engine as risk_engine
+from web.schemas.ai_schmas import RiskLevelEnum
+from web.services.risk_engine import EmbeddedRiskEngine, assess_score, evaluate_batch
+
+SENSOR_COUNT = 4
+
+
+class ActiveSensorModel:
+    """켜진 센서 수가 많을수록 이상 점수(-decision_function)가 커지는 테스트용 모델"""
+
+    def decision_function(self, features: np.ndarray) -> np.ndarray:
+        return -features.sum(axis=1) * 0.5
+
+
+class ElevenSensorModel(ActiveSensorModel):
+    """AI 서버 특징(11개)으로 학습한 모델처럼 입력 크기가 다른 모델"""
+
+    n_features_in_ = 11
+
+
+class BrokenModel:
+    def decision_function(self, features: np.ndarray) -> np.ndarray:
+        raise ValueError("X has 4 features, but model is expecting 11 features as input")
+
+
+def test_assess_score_thresholds():
+    """임계값과 같은 점수는 높은 위험도로 분류되어야 합니다."""
+    assert assess_score(0.59, warn=0.6, danger=1.0) == RiskLevelEnum.SAFE
+    assert assess_score(0.6, warn=0.6, danger=1.0) == RiskLevelEnum.CAUTION
+    assert assess_score(1.0, warn=0.6, danger=1.0) == RiskLevelEnum.DANGER
+
+
+def test_evaluate_batch_scores_each_senior_and_skips_failing_path(monkeypatch):
+    """가중치 경로마다 한 번에 추론하고, 읽기/추론에 실패한 경로의 어르신만 결과에서 빠져야 합니다."""
+    models = {"ok.joblib": [ActiveSensorModel()], "broken.joblib": [BrokenModel()]}
+
+    def fake_load_models(path: str) -> list:
+        if path not in models:
+            raise OSError(f"No such file: {path}")
+        return models[path]
+
+    monkeypatch.setattr(risk_engine, "_load_models", fake_load_models)
+
+    results = evaluate_batch(
+        [
+            (1, 0b0000, "ok.joblib"),
+            (2, 0b0011, "ok.joblib"),
+            (3, 0b1111, "ok.joblib"),
+            (4, 0b1111, "broken.joblib"),
+            (5, 0b1111, "missing.joblib"),
+        ],
+        SENSOR_COUNT,
+        warn=0.6,
+        danger=1.5,
+    )
+
+    levels = {senior_id: level for senior_id, level, _ in results}
+    assert levels == {
+        1: RiskLevelEnum.SAFE.value,
+        2: RiskLevelEnum.CAUTION.value,
+        3: RiskLevelEnum.DANGER.value,
+    }
+    assert results[2][2] == "embedded anomaly score: 2.000"
+
+
+def test_evaluate_batch_with_isolation_forest(tmp_path):
+    """joblib으로 저장한 IsolationForest를 읽어, 학습 데이터와 다른 패턴을 더 높은 위험도로 평가해야 합니다."""
+    joblib = pytest.importorskip("joblib")
+    ensemble = pytest.importorskip("sklearn.ensemble")
+
+    # 대부분 0번 또는 1번 센서 하나만 켜지는 어르신
+    normal = np.array(
+        [[1, 0, 0, 0]] * 60 + [[0, 1, 0, 0]] * 30 + [[1, 0, 1, 0]] * 5 + [[0, 0, 0, 1]] * 5, dtype=np.float64
+    )
+    model = ensemble.IsolationForest(n_estimators=50, random_state=0).fit(normal)
+    path = tmp_path / "senior.joblib"
+    joblib.dump({"iforest": model}, path)
+
+    results = evaluate_batch([(1, 0b0001, str(path)), (2, 0b1111, str(path))], SENSOR_COUNT, warn=0.1, danger=10.0)
+
+    scores = {senior_id: float(reason.rsplit(" ", 1)[1]) for senior_id, _, reason in results}
+    assert scores[2] > scores[1]
+    levels = {senior_id: level for senior_id, level, _ in results}
+    assert levels == {1: RiskLevelEnum.SAFE.value, 2: RiskLevelEnum.CAUTION.value}
+
+
+def test_evaluate_batch_skips_models_with_other_feature_count(monkeypatch):
+    """입력 크기가 센서 수와 다른 모델을 쓰는 어르신은 결과(위험도 반영)를 내지 않아야 합니다."""
+    models = {"ok.joblib": [ActiveSensorModel()], "eleven.joblib": [ActiveSensorModel(), ElevenSensorModel()]}
+    monkeypatch.setattr(risk_engine, "_load_models", models.__getitem__)
+
+    results = evaluate_batch(
+        [(1, 0b1111, "ok.joblib"), (2, 0b1111, "eleven.joblib")], SENSOR_COUNT, warn=0.6, danger=1.5
+    )
+
+    assert [senior_id for senior_id, _, _ in results] == [1]
+
+
+def test_embedded_engine_refuses_to_start_without_bitmask_models():
+    """비트마스크로 학습한 가중치임을 설정하지 않으면 내장 엔진이 시작되지 않아야 합니다."""
+
+    async def load_weight_paths():
+        return {}
+
+    engine = EmbeddedRiskEngine(load_weight_paths, SENSOR_COUNT, bitmask_models=False)
+
+    with pytest.raises(RuntimeError, match="RISK_ENGINE_BITMASK_MODELS"):
+        engine.start()
+    assert engine._pool is None
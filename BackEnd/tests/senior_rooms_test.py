@@ -0,0 +1,145 @@
+import asyncio
+import socket
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+import socketio
+import uvicorn
+
+import web.event.connection_event as connection_event
+import web.services.senior_rooms as senior_rooms
+from common.modules.session_manager import SessionCache, SessionManager
+from common.modules.user_manager import UserManager
+from common.schemas.session import ConnectionInfo, SessionType
+from web.schemas.socket_event import ConnectEvents
+from web.services.database import db
+from web.services.senior_rooms import join_senior_room_if_connected, senior_room, staff_room
+from web.services.websocket import sio
+
+# 직원 ID -> 담당 어르신 ID 목록
+CARE_SENIORS: Dict[int, List[int]] = {1: [7], 2: [8]}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+async def socket_server(monkeypatch, redis_session_manager):
+    """
+    연결 이벤트(connection_event)가 등록된 실제 sio 서버를 띄웁니다.
+    JWT 인증과 담당 어르신 조회는 CARE_SENIORS로, 세션 저장은 테스트 Redis로 대신합니다.
+    """
+    pytest.importorskip("aiohttp")  # Socket.IO 클라이언트의 websocket 전송
+    session_man = SessionManager(redis_session_manager, cache=SessionCache(ttl_seconds=0))
+
+    async def get_current_user(jwt: str, session):
+        return SimpleNamespace(staff_id=int(jwt))
+
+    async def get_session():
+        yield None
+
+    async def get_care_seniors(self, staff_id: int):
+        return [SimpleNamespace(senior_id=senior_id) for senior_id in CARE_SENIORS.get(staff_id, [])]
+
+    monkeypatch.setattr(connection_event.auth_module, "get_current_user", get_current_user)
+    monkeypatch.setattr(db, "get_session", get_session)
+    monkeypatch.setattr(UserManager, "get_care_seniors", get_care_seniors)
+    monkeypatch.setattr(connection_event, "session_man", session_man)
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(socketio.ASGIApp(sio), host="127.0.0.1", port=port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    clients: List[socketio.AsyncClient] = []
+
+    async def connect_staff(staff_id: int) -> socketio.AsyncClient:
+        client = socketio.AsyncClient()
+        client.received = []
+        authenticated = asyncio.get_running_loop().create_future()
+        client.on(ConnectEvents.AUTH_SUCCESS.value, lambda *args: authenticated.set_result(True))
+        client.on("noti", lambda data: client.received.append(data))
+        await client.connect(
+            f"http://127.0.0.1:{port}", transports=["websocket"], auth={"token": str(staff_id)}
+        )
+        await asyncio.wait_for(authenticated, timeout=5)
+        clients.append(client)
+        return client
+
+    yield connect_staff
+
+    for client in clients:
+        await client.disconnect()
+    server.should_exit = True
+    await server_task
+
+
+async def settle() -> None:
+    """서버가 보낸 이벤트가 클라이언트에 도착할 시간을 줍니다."""
+    await asyncio.sleep(0.3)
+
+
+async def test_connect_joins_staff_and_care_senior_rooms(socket_server):
+    """FE 소켓은 연결 인증 직후 직원 room과 담당 어르신 room에 입장해야 합니다."""
+    client = await socket_server(1)
+
+    rooms = sio.rooms(client.get_sid())
+
+    assert senior_room(7) in rooms
+    assert staff_room(1) in rooms
+    assert senior_room(8) not in rooms
+
+
+async def test_senior_room_emit_reaches_only_care_staff(socket_server):
+    """senior_room으로 보낸 알림은 그 어르신을 담당하는 직원에게만 전달되어야 합니다."""
+    staff_1 = await socket_server(1)
+    staff_2 = await socket_server(2)
+
+    await sio.emit("noti", {"senior_id": 7}, to=senior_room(7))
+    await settle()
+
+    assert staff_1.received == [{"senior_id": 7}]
+    assert staff_2.received == []
+
+
+async def test_join_after_commit_adds_connected_staff_to_new_senior_room(socket_server, redis_session_manager):
+    """어르신을 새로 등록한 뒤 접속 중인 직원은 재접속 없이 새 어르신의 알림을 받아야 합니다."""
+    staff_2 = await socket_server(2)
+
+    await join_senior_room_if_connected(redis_session_manager, 2, 9)
+    await sio.emit("noti", {"senior_id": 9}, to=senior_room(9))
+    await settle()
+
+    assert senior_room(9) in sio.rooms(staff_2.get_sid())
+    assert staff_2.received == [{"senior_id": 9}]
+
+
+async def test_join_skips_sid_not_connected_to_this_worker(monkeypatch, redis_session_manager):
+    """단일 노드 모드에서는 이 워커에 연결되지 않은 sid를 room에 넣지 않고, 입장 실패도 예외로 올리지 않아야 합니다."""
+    entered = []
+
+    async def enter_room(sid: str, room: str, namespace=None):
+        entered.append((sid, room))
+
+    monkeypatch.setattr(sio, "enter_room", enter_room)
+    session_man = SessionManager(redis_session_manager, cache=SessionCache(ttl_seconds=0))
+    await session_man.create_session(ConnectionInfo(sid="elsewhere", session_type=SessionType.FE, staff_id=3))
+    monkeypatch.setattr(senior_rooms, "SessionManager", lambda red_sess: session_man)
+
+    await join_senior_room_if_connected(redis_session_manager, 3, 9)
+    await join_senior_room_if_connected(redis_session_manager, 4, 9)  # 접속 중이 아닌 직원
+
+    assert entered == []
+
+    async def failing_enter_room(sid: str, room: str, namespace=None):
+        raise KeyError(sid)
+
+    monkeypatch.setattr(sio, "enter_room", failing_enter_room)
+    monkeypatch.setattr(sio.manager, "is_connected", lambda sid, namespace: True)
+
+    await join_senior_room_if_connected(redis_session_manager, 3, 9)
@@ -0,0 +1,24 @@
+from common.modules.senior_roster import SeniorRoster
+from common.schemas.user import SeniorRosterEntry
+
+
+def test_apply_keeps_latest_entry():
+    """같은 어르신을 다시 반영하면 이름이 갱신되고 목록에는 한 번만 남아야 합니다."""
+    roster = SeniorRoster()
+
+    roster.apply(SeniorRosterEntry(senior_id=2, full_name="김철수"))
+    roster.apply(SeniorRosterEntry(senior_id=1, full_name="이영희"))
+    roster.apply(SeniorRosterEntry(senior_id=2, full_name="김철수2"))
+
+    assert roster.senior_ids() == [1, 2]
+    assert roster.get(2).full_name == "김철수2"
+
+
+def test_apply_message_from_pubsub():
+    """pub/sub 메시지(JSON)가 목록에 반영되고 집계되어야 합니다."""
+    roster = SeniorRoster()
+
+    roster.apply_message(SeniorRosterEntry(senior_id=7, full_name="박민수").model_dump_json())
+
+    assert roster.senior_ids() == [7]
+    assert roster.stats()["messages"] == 1
@@ -0,0 +1,103 @@
+import httpx
+from fastapi import FastAPI
+
+import web.routers.ai as ai_router
+import web.services.data_alarm as data_alarm
+from common.modules.user_manager import UserManager
+from web.schemas.ai_schmas import RiskLevelEnum, SeniorRiskAssessment
+from web.schemas.socket_event import NotifyEvents
+from web.services.database import db
+from web.services.senior_status_manager import SeniorStatusManager
+
+
+def _assessment(senior_id: int, risk_level: RiskLevelEnum) -> SeniorRiskAssessment:
+    return SeniorRiskAssessment(senior_id=senior_id, risk_level=risk_level, reason=f"reason {senior_id}")
+
+
+async def _put_risk_levels(monkeypatch, redis_session_manager, seniors_by_staff, payload):
+    """PUT /ai/seniors/risk-levels를 호출하고 응답, emit된 (이벤트, 데이터, 대상) 목록, 담당 직원 조회 목록을 반환합니다."""
+    emitted = []
+    staff_queries = []
+
+    async def fake_emit(event, data, to=None):
+        emitted.append((event, data, to))
+
+    async def fake_get_staff_ids_by_senior_ids(self, senior_ids):
+        staff_queries.append(sorted(senior_ids))
+        return {
+            staff_id: [senior_id for senior_id in senior_ids_of_staff if senior_id in senior_ids]
+            for staff_id, senior_ids_of_staff in seniors_by_staff.items()
+        }
+
+    async def fake_get_session():
+        yield None
+
+    monkeypatch.setattr(ai_router, "red", redis_session_manager)
+    monkeypatch.setattr(data_alarm.sio, "emit", fake_emit)
+    monkeypatch.setattr(UserManager, "get_staff_ids_by_senior_ids", fake_get_staff_ids_by_senior_ids)
+
+    app = FastAPI()
+    app.include_router(ai_router.router)
+    app.dependency_overrides[db.get_session] = fake_get_session
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.put("/ai/seniors/risk-levels", json=payload)
+    assert response.status_code == 200
+    return response.json(), emitted, staff_queries
+
+
+async def test_update_statuses_writes_every_senior(redis_session_manager):
+    """update_statuses는 모든 어르신의 상태를 저장하고, 저장한 상태를 입력 순서대로 반환해야 합니다."""
+    ssm = SeniorStatusManager(redis_session_manager)
+
+    statuses = await ssm.update_statuses([
+        _assessment(1, RiskLevelEnum.DANGER),
+        _assessment(2, RiskLevelEnum.SAFE),
+    ])
+
+    assert [status.senior_id for status in statuses] == [1, 2]
+    stored = await ssm.get_status(1)
+    assert stored.status == RiskLevelEnum.DANGER
+    assert stored.reason == "reason 1"
+    assert (await ssm.get_status(2)).status == RiskLevelEnum.SAFE
+    assert await ssm.update_statuses([]) == []
+
+
+async def test_update_risk_levels_notifies_each_senior_room_by_default(monkeypatch, redis_session_manager):
+    """기본(item) 방식은 현재 FE가 처리하는 어르신별 상태 변경 이벤트를 어르신 room으로 보내야 합니다."""
+    monkeypatch.setattr(data_alarm, "SENIOR_NOTIFY_MODE", "item")
+    payload = {"results": [
+        {"senior_id": 1, "risk_level": RiskLevelEnum.DANGER.value, "reason": "no motion"},
+        {"senior_id": 2, "risk_level": RiskLevelEnum.SAFE.value, "reason": "normal"},
+    ]}
+
+    body, emitted, staff_queries = await _put_risk_levels(monkeypatch, redis_session_manager, {10: [1, 2]}, payload)
+
+    assert body["updated"] == 2
+    # 어르신 room으로 보내므로 담당 직원을 조회하지 않습니다.
+    assert staff_queries == []
+    assert [(event, to) for event, _, to in emitted] == [
+        (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, "senior:1"),
+        (NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, "senior:2"),
+    ]
+    assert emitted[0][1]["status"] == RiskLevelEnum.DANGER.value
+    assert (await SeniorStatusManager(redis_session_manager).get_status(1)).reason == "no motion"
+
+
+async def test_update_risk_levels_batches_per_staff(monkeypatch, redis_session_manager):
+    """batch 방식은 직원마다 담당 어르신들의 상태만 모아 이벤트 하나로 보내야 합니다."""
+    monkeypatch.setattr(data_alarm, "SENIOR_NOTIFY_MODE", "batch")
+    payload = {"results": [
+        {"senior_id": 1, "risk_level": RiskLevelEnum.DANGER.value, "reason": "no motion"},
+        {"senior_id": 2, "risk_level": RiskLevelEnum.CAUTION.value, "reason": "late wake up"},
+    ]}
+
+    _, emitted, staff_queries = await _put_risk_levels(
+        monkeypatch, redis_session_manager, {10: [1, 2], 20: [2]}, payload
+    )
+
+    packets = {to: data for event, data, to in emitted if event == NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH}
+    assert staff_queries == [[1, 2]]
+    assert len(emitted) == 2
+    assert [status["senior_id"] for status in packets["staff:10"]] == [1, 2]
+    assert [status["senior_id"] for status in packets["staff:20"]] == [2]
@@ -0,0 +1,131 @@
+import asyncio
+import datetime
+from typing import List
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from common.models.enums import SensorTypeEnum
+from common.modules.sensor_log_queue import (
+    SensorLogFlusher,
+    SensorLogQueue,
+    SensorLogQueueFullError,
+    decode_log_rows,
+    encode_log_rows,
+)
+from common.schemas.sensor_log import SensorLogInfo
+
+
+def test_encode_decode_round_trip():
+    """Stream 엔트리로 직렬화한 로그가 INSERT용 행으로 그대로 복원되는지 테스트합니다."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    logs = [
+        SensorLogInfo(
+            timestamp=now,
+            sensor_type=SensorTypeEnum.DOOR_ENTRANCE,
+            sensor_value=True,
+            event_description="Main door opened",
+        ),
+        SensorLogInfo(
+            timestamp=now - datetime.timedelta(seconds=1),
+            sensor_type=SensorTypeEnum.POWER_TV,
+            sensor_value=False,
+        ),
+    ]
+
+    rows = decode_log_rows(7, encode_log_rows(logs))
+
+    assert len(rows) == 2
+    assert rows[0] == {
+        "senior_id": 7,
+        "timestamp": now,
+        "sensor_type": "door_entrance",
+        "sensor_value": True,
+        "event_description": "Main door opened",
+    }
+    assert rows[1]["sensor_value"] is False
+    assert rows[1]["event_description"] is None
+
+
+def test_stream_entries_accepts_resp2_and_resp3_replies():
+    """XREADGROUP 응답은 RESP2(list)와 RESP3(dict) 형식 모두에서 같은 엔트리를 꺼내야 합니다."""
+    entries = [("1-0", {"senior_id": "7", "rows": "[]"})]
+
+    assert SensorLogFlusher._stream_entries([["sensor_logs:stream", entries]]) == entries
+    assert SensorLogFlusher._stream_entries({"sensor_logs:stream": [entries]}) == entries
+    assert SensorLogFlusher._stream_entries([]) == []
+    assert SensorLogFlusher._stream_entries(None) == []
+
+
+def make_logs(count: int = 1) -> List[SensorLogInfo]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        SensorLogInfo(timestamp=now, sensor_type=SensorTypeEnum.DOOR_ENTRANCE, sensor_value=i % 2 == 0)
+        for i in range(count)
+    ]
+
+
+class RecordingFlusher(SensorLogFlusher):
+    """DB 대신 INSERT 한 행을 기록하는 flusher. failing_senior_ids의 행이 섞이면 IntegrityError를 냅니다."""
+
+    def __init__(self, redis_session_manager, failing_senior_ids=(), **kwargs):
+        super().__init__(None, redis_session_manager, stream="test:stream", group="test-group", consumer="c1", **kwargs)
+        self.failing_senior_ids = set(failing_senior_ids)
+        self.inserts: List[List[dict]] = []
+
+    async def _insert(self, rows):
+        if any(row["senior_id"] in self.failing_senior_ids for row in rows):
+            raise IntegrityError("INSERT INTO sensor_logs", {}, Exception("violates foreign key constraint"))
+        self.inserts.append(rows)
+
+
+async def test_enqueue_rejects_when_queue_is_full(redis_session_manager):
+    """큐 길이가 상한에 도달하면 SensorLogQueueFullError로 거절해야 합니다."""
+    queue = SensorLogQueue(redis_session_manager, stream="test:stream", max_entries=2)
+    await queue.enqueue(1, make_logs())
+    await queue.enqueue(2, make_logs())
+
+    with pytest.raises(SensorLogQueueFullError):
+        await queue.enqueue(3, make_logs())
+    assert queue.stats() == {"enqueued": 2, "rejected": 1}
+    assert await queue.depth() == 2
+
+
+async def test_flush_falls_back_to_entries_on_integrity_error(redis_session_manager):
+    """묶음 INSERT가 IntegrityError로 실패하면 엔트리 단위로 반영하고, 실패한 엔트리만 버려야 합니다."""
+    queue = SensorLogQueue(redis_session_manager, stream="test:stream")
+    flusher = RecordingFlusher(redis_session_manager, failing_senior_ids={99})
+    await flusher._ensure_group()
+    for senior_id in (1, 99, 2):
+        await queue.enqueue(senior_id, make_logs(2))
+
+    redis_client = await redis_session_manager.get_client()
+    response = await redis_client.xreadgroup(flusher.group, flusher.consumer, {flusher.stream: ">"}, count=10)
+    flusher._add_entries(flusher._stream_entries(response))
+    await flusher.flush()
+
+    assert [[row["senior_id"] for row in rows] for rows in flusher.inserts] == [[1, 1], [2, 2]]
+    assert flusher.stats()["entries_dropped"] == 1
+    assert flusher.stats()["buffered_entries"] == 0
+    # 버린 엔트리를 포함해 모두 확인/삭제되어 다시 읽지 않습니다.
+    assert await redis_client.xlen(flusher.stream) == 0
+    assert (await redis_client.xpending(flusher.stream, flusher.group))["pending"] == 0
+
+
+async def test_recover_pending_acks_trimmed_entries(redis_session_manager):
+    """대기 목록에 남은 엔트리가 Stream에서 삭제됐으면 확인 처리하고, 복구 루프는 끝나야 합니다."""
+    queue = SensorLogQueue(redis_session_manager, stream="test:stream")
+    flusher = RecordingFlusher(redis_session_manager)
+    await flusher._ensure_group()
+    entry_ids = [await queue.enqueue(senior_id, make_logs()) for senior_id in (1, 2, 3)]
+
+    # 이전 실행에서 읽고 확인하지 못한 엔트리 중 하나가 삭제됨 (XDEL/XTRIM MAXLEN)
+    redis_client = await redis_session_manager.get_client()
+    await redis_client.xreadgroup(flusher.group, flusher.consumer, {flusher.stream: ">"}, count=10)
+    await redis_client.xdel(flusher.stream, entry_ids[1])
+
+    await asyncio.wait_for(flusher._recover_pending(), timeout=5)
+
+    assert [rows[0]["senior_id"] for rows in flusher.inserts] == [1]
+    assert sorted(row["senior_id"] for rows in flusher.inserts for row in rows) == [1, 3]
+    assert (await redis_client.xpending(flusher.stream, flusher.group))["pending"] == 0
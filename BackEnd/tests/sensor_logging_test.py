@@ -148,3 +148,77 @@ async def test_get_all_logs_for_hub(
     assert retrieved_old_log.timestamp == pytest.approx(
         log_old.timestamp, abs=datetime.timedelta(seconds=1)
     )
+
+
+@pytest.mark.asyncio
+async def test_copy_path_matches_insert_path(
+    get_session: AsyncSession, registered_senior: SeniorInfo
+):
+    """
+    COPY 경로로 적재한 로그도 INSERT 경로와 동일하게 조회되는지 검증합니다.
+    """
+    # Arrange (준비)
+    db_session = get_session
+    sensor_log_manager = SensorLogManager(db_session)
+    senior_id = registered_senior.senior_id
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    rows = [
+        {
+            "senior_id": senior_id,
+            "timestamp": now - datetime.timedelta(seconds=i),
+            "sensor_type": SensorTypeEnum.PIR_BEDROOM.value,
+            "sensor_value": i % 2 == 0,
+            "event_description": f"event {i}",
+        }
+        for i in range(3)
+    ]
+
+    # Act (실행)
+    await sensor_log_manager.add_log_rows(rows, use_copy=True)
+    # 같은 행을 다시 적재해도 중복 저장되지 않아야 합니다.
+    await sensor_log_manager.add_log_rows(rows, use_copy=True)
+
+    # Assert (검증)
+    log_list_result = await sensor_log_manager.get_logs_by_senior_id(senior_id)
+    assert len(log_list_result.log_list) == 3
+    assert log_list_result.log_list[0].sensor_type == SensorTypeEnum.PIR_BEDROOM
+    assert log_list_result.log_list[0].event_description == "event 0"
+
+
+@pytest.mark.asyncio
+async def test_same_timestamp_from_different_seniors_is_kept(
+    get_session: AsyncSession, registered_senior: SeniorInfo
+):
+    """
+    서로 다른 어르신/센서의 로그가 같은 시각에 들어와도 모두 저장되고,
+    같은 (어르신, 센서, 시각) 로그만 중복으로 걸러지는지 검증합니다.
+    """
+    # Arrange (준비)
+    db_session = get_session
+    sensor_log_manager = SensorLogManager(db_session)
+    other_senior = await UserManager(db_session).create_senior(
+        SeniorCreate(full_name="Other Senior", address="Other Address", birth_date=datetime.date(1941, 1, 1))
+    )
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    rows = [
+        {
+            "senior_id": senior_id,
+            "timestamp": now,
+            "sensor_type": sensor_type.value,
+            "sensor_value": True,
+            "event_description": None,
+        }
+        for senior_id in (registered_senior.senior_id, other_senior.senior_id)
+        for sensor_type in (SensorTypeEnum.DOOR_ENTRANCE, SensorTypeEnum.PIR_BEDROOM)
+    ]
+
+    # Act (실행)
+    await sensor_log_manager.add_log_rows(rows)
+    await sensor_log_manager.add_log_rows(rows[:1])
+
+    # Assert (검증)
+    for senior_id in (registered_senior.senior_id, other_senior.senior_id):
+        log_list_result = await sensor_log_manager.get_logs_by_senior_id(senior_id)
+        assert len(log_list_result.log_list) == 2
@@ -0,0 +1,126 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from web.schemas.monitoring_schema import FrontendSensorItem, FrontendSensorStatusPayload
+from web.services.sensor_state_matrix import SENSOR_COLUMNS, SensorStateMatrix
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_payload(senior_id: int, values: dict, at: datetime = NOW) -> FrontendSensorStatusPayload:
+    sensors = []
+    for sensor_id, value in values.items():
+        sensor_type, _, location = sensor_id.partition("_")
+        sensors.append(
+            FrontendSensorItem(
+                sensor_id=sensor_id, sensor_type=sensor_type, location=location, value=value, last_updated=at
+            )
+        )
+    return FrontendSensorStatusPayload(senior_id=senior_id, sensors=sensors)
+
+
+def test_bitmasks_follow_column_order():
+    """여러 어르신의 비트마스크가 SENSOR_COLUMNS 순서로 한 번에 계산되어야 합니다."""
+    matrix = SensorStateMatrix(capacity=1)
+    matrix.apply(make_payload(1, {SENSOR_COLUMNS[0]: True, SENSOR_COLUMNS[2]: True}), complete=True)
+    matrix.apply(make_payload(2, {SENSOR_COLUMNS[1]: True}), complete=True)
+
+    found, rows = matrix.rows([2, 1, 3])
+
+    assert found == [2, 1]
+    assert matrix.bitmasks(rows).tolist() == [0b10, 0b101]
+    assert matrix.stats()["capacity"] == 2
+
+
+def test_partial_row_is_not_served_until_complete():
+    """변경분만 들어온 어르신은 전체 상태가 채워지기 전까지 조회되지 않아야 합니다."""
+    matrix = SensorStateMatrix()
+    matrix.apply(make_payload(1, {SENSOR_COLUMNS[0]: True}))
+
+    assert 1 not in matrix
+    assert matrix.sensor_values(1) is None
+
+
+def test_older_message_does_not_overwrite_newer_value():
+    """늦게 도착한 오래된 변경은 최신 값을 덮어쓰지 않아야 합니다."""
+    matrix = SensorStateMatrix()
+    matrix.apply(make_payload(1, {SENSOR_COLUMNS[0]: True}), complete=True)
+    old = int((NOW - timedelta(seconds=5)).timestamp())
+
+    matrix.apply_message(f"[1, [[0, 0, {old}]]]")
+
+    assert matrix.sensor_values(1)[0] == 1
+    assert matrix.frontend_payload(1).sensors[0].value is True
+
+
+def test_duplicate_cells_keep_newest_value():
+    """한 변경에 같은 센서가 여러 번 있으면 입력 순서와 관계없이 가장 최근 값이 남아야 합니다."""
+    matrix = SensorStateMatrix()
+    matrix.apply(make_payload(1, {SENSOR_COLUMNS[0]: False, SENSOR_COLUMNS[1]: False}), complete=True)
+    now = int(NOW.timestamp())
+
+    # 0번 센서: 최신 값(1)이 먼저 오고 오래된 값(0)이 뒤에 옵니다.
+    # 1번 센서: 같은 시각이면 나중 값(1)이 남습니다.
+    matrix.apply_message(f"[1, [[0, 1, {now + 10}], [1, 0, {now + 5}], [0, 0, {now + 1}], [1, 1, {now + 5}]]]")
+
+    assert matrix.sensor_values(1)[:2] == [1, 1]
+    assert matrix.stats()["updates"] == 4
+
+
+def test_dropped_message_is_recovered_after_max_age():
+    """pub/sub 메시지를 놓친 행도 max_age가 지나면 Redis의 전체 상태로 다시 채워져야 합니다."""
+    matrix = SensorStateMatrix(max_age=60)
+    matrix.apply(make_payload(1, {SENSOR_COLUMNS[0]: False}), complete=True)
+
+    # 다른 워커가 받은 변경(열림)이 Redis에는 저장됐지만 이 워커의 pub/sub 메시지는 유실됨
+    redis_state = make_payload(1, {SENSOR_COLUMNS[0]: True}, at=NOW + timedelta(seconds=3))
+    assert matrix.sensor_values(1)[0] == 0
+
+    # 채운 지 max_age가 지나면 조회 대상에서 빠지고, 호출자(AiTickDispatcher 등)가 Redis에서 다시 채웁니다.
+    matrix._complete[1] -= 61
+    assert 1 not in matrix
+    assert matrix.rows([1])[0] == []
+
+    matrix.apply(redis_state, complete=True)
+    assert 1 in matrix
+    assert matrix.sensor_values(1)[0] == 1
+
+
+def test_invalidate_drops_every_row_until_refilled():
+    """(재)구독이나 오류 뒤에는 모든 행이 조회 대상에서 빠지고, 값은 다시 채울 때까지 보관되어야 합니다."""
+    matrix = SensorStateMatrix()
+    matrix.apply(make_payload(1, {SENSOR_COLUMNS[0]: True}), complete=True)
+    matrix.apply(make_payload(2, {SENSOR_COLUMNS[1]: True}), complete=True)
+
+    matrix.invalidate()
+
+    assert len(matrix) == 0
+    assert matrix.frontend_payload(1) is None
+    matrix.apply(make_payload(1, {SENSOR_COLUMNS[0]: True}), complete=True)
+    assert matrix.rows([1, 2])[0] == [1]
+    assert matrix.stats()["invalidations"] == 1
+
+
+async def test_run_invalidates_rows_on_subscribe(redis_session_manager):
+    """구독 전에 채운 행은 구독 직후 조회 대상에서 빠지고, 구독 후의 변경 메시지는 반영되어야 합니다."""
+    matrix = SensorStateMatrix(channel="sensor:state:test")
+    publisher = SensorStateMatrix(channel="sensor:state:test")
+    matrix.apply(make_payload(1, {SENSOR_COLUMNS[0]: False}), complete=True)
+
+    task = asyncio.create_task(matrix.run(redis_session_manager))
+    for _ in range(50):
+        if matrix.invalidations:
+            break
+        await asyncio.sleep(0.02)
+    assert 1 not in matrix
+
+    matrix.apply(make_payload(1, {SENSOR_COLUMNS[0]: False}), complete=True)
+    await publisher.publish(redis_session_manager, make_payload(1, {SENSOR_COLUMNS[0]: True}, at=NOW + timedelta(seconds=1)))
+    for _ in range(50):
+        if matrix.messages:
+            break
+        await asyncio.sleep(0.02)
+    matrix.stop()
+    await task
+
+    assert matrix.sensor_values(1)[0] == 1
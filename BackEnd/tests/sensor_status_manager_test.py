@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+
+from web.schemas.monitoring_schema import FrontendSensorItem, FrontendSensorStatusPayload
+from web.services.senior_status_manager import SensorStatusManager
+
+
+def test_packed_state_round_trip():
+    """Hash 필드 값으로 압축한 센서 상태가 그대로 복원되어야 합니다."""
+    updated = datetime(2025, 1, 1, 9, 30, 15, 250000, tzinfo=timezone.utc)
+
+    packed = SensorStatusManager.pack_state(True, updated)
+    item = SensorStatusManager.unpack_state("door_bedroom", packed)
+
+    assert packed == f"1:{int(updated.timestamp() * 1000)}"
+    assert item.value is True
+    assert item.last_updated == updated
+    assert (item.sensor_type, item.location) == ("door", "bedroom")
+
+
+def make_item(sensor_id: str, value: bool, at: datetime) -> FrontendSensorItem:
+    sensor_type, _, location = sensor_id.partition("_")
+    return FrontendSensorItem(sensor_id=sensor_id, sensor_type=sensor_type, location=location, value=value, last_updated=at)
+
+
+async def test_apply_sensor_changes_reports_only_changed_sensors(redis_session_manager):
+    """처음 기록은 모든 센서를, 같은 값의 재전송은 아무것도 보고하지 않아야 합니다."""
+    manager = SensorStatusManager(redis_session_manager)
+    at = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+    first = FrontendSensorStatusPayload(senior_id=1, sensors=[
+        make_item("door_bedroom", True, at), make_item("power_tv", False, at),
+    ])
+
+    changed = await manager.apply_sensor_changes(first)
+    assert [item.sensor_id for item in changed.sensors] == ["door_bedroom", "power_tv"]
+
+    resend = FrontendSensorStatusPayload(senior_id=1, sensors=[
+        make_item("door_bedroom", True, at + timedelta(seconds=1)), make_item("power_tv", False, at + timedelta(seconds=1)),
+    ])
+    assert (await manager.apply_sensor_changes(resend)).sensors == []
+    # 값이 같으면 마지막 갱신 시각도 바꾸지 않습니다.
+    stored = await manager.get_all_sensor_statuses(1)
+    assert {item.sensor_id: item.last_updated for item in stored.sensors} == {"door_bedroom": at, "power_tv": at}
+
+    flipped = FrontendSensorStatusPayload(senior_id=1, sensors=[
+        make_item("door_bedroom", False, at + timedelta(seconds=2)), make_item("power_tv", False, at + timedelta(seconds=2)),
+    ])
+    assert [item.sensor_id for item in (await manager.apply_sensor_changes(flipped)).sensors] == ["door_bedroom"]
+
+
+async def test_apply_sensor_changes_reports_every_transition_in_one_payload(redis_session_manager):
+    """같은 센서가 한 페이로드에 열림 -> 닫힘으로 두 번 들어오면 두 변화를 모두 보고하고 마지막 값을 저장해야 합니다."""
+    manager = SensorStatusManager(redis_session_manager)
+    at = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+    await manager.apply_sensor_changes(
+        FrontendSensorStatusPayload(senior_id=1, sensors=[make_item("door_entrance", False, at)])
+    )
+
+    changed = await manager.apply_sensor_changes(FrontendSensorStatusPayload(senior_id=1, sensors=[
+        make_item("door_entrance", True, at + timedelta(seconds=1)),
+        make_item("door_entrance", False, at + timedelta(seconds=2)),
+    ]))
+
+    assert [(item.sensor_id, item.value) for item in changed.sensors] == [("door_entrance", True), ("door_entrance", False)]
+    stored = (await manager.get_all_sensor_statuses(1)).sensors[0]
+    assert (stored.value, stored.last_updated) == (False, at + timedelta(seconds=2))
@@ -0,0 +1,39 @@
+from common.modules.session_manager import SessionCache
+from common.schemas.session import ConnectionInfo, SessionType
+
+
+def test_get_returns_cached_session_until_invalidated():
+    """캐시에 넣은 세션은 무효화 전까지 그대로 조회되어야 합니다."""
+    cache = SessionCache(ttl_seconds=60, max_size=10)
+    session_info = ConnectionInfo(sid="abc", session_type=SessionType.FE, staff_id=1)
+
+    cache.set("session:staff_id:1", session_info)
+    assert cache.get("session:staff_id:1") is session_info
+
+    cache.invalidate("session:staff_id:1", "session:sid:abc")
+    assert cache.get("session:staff_id:1") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_zero_ttl_disables_cache():
+    """TTL이 0 이하이면 캐시하지 않아야 합니다."""
+    cache = SessionCache(ttl_seconds=0, max_size=10)
+
+    cache.set("session:sid:abc", ConnectionInfo(sid="abc", session_type=SessionType.FE))
+
+    assert cache.get("session:sid:abc") is None
+
+
+def test_oldest_entry_is_evicted_when_full():
+    """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 밀려나야 합니다."""
+    cache = SessionCache(ttl_seconds=60, max_size=2)
+    for sid in ("a", "b"):
+        cache.set(f"session:sid:{sid}", ConnectionInfo(sid=sid, session_type=SessionType.HUB))
+
+    cache.get("session:sid:a")
+    cache.set("session:sid:c", ConnectionInfo(sid="c", session_type=SessionType.HUB))
+
+    assert cache.get("session:sid:b") is None
+    assert cache.get("session:sid:a").sid == "a"
+    assert cache.stats()["size"] == 2
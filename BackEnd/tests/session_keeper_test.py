@@ -0,0 +1,164 @@
+import time
+from typing import List
+
+import pytest
+
+from common.modules.session_manager import SessionCache, SessionManager
+from common.schemas.session import ConnectionInfo, SessionType
+from web.services.session_keeper import SessionKeeper
+
+
+class FakeClientManager:
+    def __init__(self, sids: List[str]):
+        self.sids = sids
+
+    def get_participants(self, namespace: str, room):
+        return [(sid, f"eio-{sid}") for sid in self.sids]
+
+
+class FakeServer:
+    """이 워커에 연결된 소켓 목록만 흉내 내는 Socket.IO 서버"""
+
+    def __init__(self, sids: List[str]):
+        self.manager = FakeClientManager(sids)
+
+
+def make_session(sid: str, worker_id=None, hub_id=None, staff_id=None) -> ConnectionInfo:
+    return ConnectionInfo(
+        sid=sid,
+        session_type=SessionType.HUB if hub_id is not None else SessionType.FE,
+        hub_id=hub_id,
+        staff_id=staff_id,
+        worker_id=worker_id,
+    )
+
+
+@pytest.fixture
+def make_keeper(redis_session_manager):
+    def _make(live_sids: List[str], worker_id: str = "worker-a", ttl: int = 60, legacy_ttl: int = 3600):
+        return SessionKeeper(
+            FakeServer(live_sids),
+            redis_session_manager,
+            worker_id=worker_id,
+            heartbeat_interval=10,
+            ttl=ttl,
+            legacy_ttl=legacy_ttl,
+        )
+
+    return _make
+
+
+async def create_sessions(redis_session_manager, *sessions: ConnectionInfo, ttl: int = 60) -> None:
+    session_man = SessionManager(redis_session_manager, cache=SessionCache(ttl_seconds=0), ttl=ttl)
+    for session_info in sessions:
+        await session_man.create_session(session_info)
+
+
+async def test_heartbeat_registers_worker_and_refreshes_live_sessions(redis_session_manager, make_keeper):
+    """heartbeat는 워커를 등록하고, 연결된 소켓의 세션과 인덱스 만료 시간만 연장해야 합니다."""
+    await create_sessions(
+        redis_session_manager,
+        make_session("live", worker_id="worker-a", staff_id=1),
+        make_session("gone", worker_id="worker-a", staff_id=2),
+        ttl=5,
+    )
+    keeper = make_keeper(["live"], ttl=120)
+
+    refreshed = await keeper.heartbeat()
+
+    redis_client = await redis_session_manager.get_client()
+    assert refreshed == 1
+    assert await redis_client.zscore(keeper.key, "worker-a") is not None
+    assert await redis_client.ttl("session:sid:live") > 5
+    assert await redis_client.ttl("session:staff_id:1") > 5
+    assert await redis_client.ttl("session:sid:gone") <= 5
+    assert keeper.stats()["heartbeats"] == 1
+
+
+async def test_heartbeat_drops_workers_that_missed_heartbeats(redis_session_manager, make_keeper):
+    """heartbeat를 worker_ttl 넘게 보내지 않은 워커는 목록에서 빠져야 합니다."""
+    keeper = make_keeper([])
+    redis_client = await redis_session_manager.get_client()
+    await redis_client.zadd(keeper.key, {"worker-dead": time.time() - keeper.worker_ttl - 1})
+
+    await keeper.heartbeat()
+
+    assert await redis_client.zrange(keeper.key, 0, -1) == ["worker-a"]
+
+
+async def test_sweep_removes_dead_worker_and_own_dead_sessions(redis_session_manager, make_keeper):
+    """죽은 워커의 세션과, 이 워커의 연결이 끊긴 소켓 세션만 삭제해야 합니다."""
+    await create_sessions(
+        redis_session_manager,
+        make_session("own-live", worker_id="worker-a", staff_id=1),
+        make_session("own-dead", worker_id="worker-a", staff_id=2),
+        make_session("other-live", worker_id="worker-b", hub_id=3),
+        make_session("dead-worker", worker_id="worker-dead", hub_id=4),
+    )
+    keeper = make_keeper(["own-live"])
+    other = make_keeper(["other-live"], worker_id="worker-b")
+    await other.heartbeat()
+    await keeper.heartbeat()
+
+    swept = await keeper.sweep()
+
+    redis_client = await redis_session_manager.get_client()
+    assert swept == 2
+    assert await redis_client.exists("session:sid:own-live", "session:staff_id:1") == 2
+    assert await redis_client.exists("session:sid:other-live", "session:hub_id:3") == 2
+    assert await redis_client.exists("session:sid:own-dead", "session:staff_id:2") == 0
+    assert await redis_client.exists("session:sid:dead-worker", "session:hub_id:4") == 0
+
+
+async def test_sweep_keeps_legacy_sessions_and_lets_them_expire(redis_session_manager, make_keeper):
+    """worker_id가 없는 이전 형식 세션은 (이전 코드 워커가 아직 살아 있을 수 있으므로) 지우지 않고 만료 시간만 설정해야 합니다."""
+    await create_sessions(redis_session_manager, make_session("legacy", hub_id=5), ttl=0)
+    keeper = make_keeper([], legacy_ttl=3600)
+    await keeper.heartbeat()
+
+    assert await keeper.sweep() == 0
+
+    redis_client = await redis_session_manager.get_client()
+    assert 0 < await redis_client.ttl("session:sid:legacy") <= 3600
+    assert 0 < await redis_client.ttl("session:hub_id:5") <= 3600
+    assert keeper.stats()["legacy_expired"] == 1
+
+    # 이미 만료 시간이 설정된 세션은 다음 워커가 시작해도 연장하지 않습니다.
+    await redis_client.expire("session:sid:legacy", 100)
+    await make_keeper([], worker_id="worker-b", legacy_ttl=3600).sweep()
+    assert await redis_client.ttl("session:sid:legacy") <= 100
+
+
+async def test_start_registers_before_sweeping(redis_session_manager, make_keeper):
+    """start는 워커를 먼저 등록하므로, 연결된 소켓의 세션은 삭제되지 않아야 합니다."""
+    await create_sessions(
+        redis_session_manager,
+        make_session("own-live", worker_id="worker-a", staff_id=1),
+        make_session("own-dead", worker_id="worker-a", staff_id=2),
+    )
+    keeper = make_keeper(["own-live"])
+
+    await keeper.start()
+
+    redis_client = await redis_session_manager.get_client()
+    assert await redis_client.exists("session:sid:own-live") == 1
+    assert await redis_client.exists("session:sid:own-dead") == 0
+    assert keeper.stats()["swept"] == 1
+
+
+async def test_leave_unregisters_worker_and_deletes_its_sessions(redis_session_manager, make_keeper):
+    """종료 시 워커 목록에서 빠지고, 이 워커에 연결된 소켓의 세션만 삭제해야 합니다."""
+    await create_sessions(
+        redis_session_manager,
+        make_session("own-live", worker_id="worker-a", staff_id=1),
+        make_session("other-live", worker_id="worker-b", staff_id=2),
+    )
+    keeper = make_keeper(["own-live"])
+    await keeper.heartbeat()
+
+    await keeper.leave()
+
+    redis_client = await redis_session_manager.get_client()
+    assert await redis_client.zscore(keeper.key, "worker-a") is None
+    assert await redis_client.exists("session:sid:own-live", "session:staff_id:1") == 0
+    assert await redis_client.exists("session:sid:other-live", "session:staff_id:2") == 2
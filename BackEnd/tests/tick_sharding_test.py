@@ -0,0 +1,31 @@
+from web.services.tick_sharding import ConsistentHashRing
+
+SENIOR_IDS = range(1, 10001)
+
+
+def test_seniors_are_split_evenly():
+    """워커마다 비슷한 수의 어르신을 담당해야 합니다."""
+    ring = ConsistentHashRing(["w1", "w2", "w3", "w4"], vnodes=64)
+
+    counts = {}
+    for senior_id in SENIOR_IDS:
+        owner = ring.owner(senior_id)
+        counts[owner] = counts.get(owner, 0) + 1
+
+    assert set(counts) == {"w1", "w2", "w3", "w4"}
+    assert min(counts.values()) > len(SENIOR_IDS) / 4 * 0.7
+
+
+def test_adding_worker_moves_only_its_share():
+    """워커가 추가되면 새 워커로 가는 어르신만 담당이 바뀌어야 합니다."""
+    before = ConsistentHashRing(["w1", "w2", "w3", "w4"], vnodes=64)
+    after = ConsistentHashRing(["w1", "w2", "w3", "w4", "w5"], vnodes=64)
+
+    moved = [senior_id for senior_id in SENIOR_IDS if before.owner(senior_id) != after.owner(senior_id)]
+
+    assert all(after.owner(senior_id) == "w5" for senior_id in moved)
+    assert len(moved) < len(SENIOR_IDS) * 0.3
+
+
+def test_empty_ring_has_no_owner():
+    assert ConsistentHashRing([]).owner(1) is None
@@ -98,3 +98,58 @@ async def test_link_staff_to_senior(get_session: AsyncSession):
     assert cared_seniors is not None
     assert len(cared_seniors) == 1
     assert cared_seniors[0].senior_id == created_senior.senior_id
+
+@pytest.mark.asyncio
+async def test_senior_exists_and_staff_id_lookup(get_session: AsyncSession):
+    """Test the lightweight lookups used by the ingest path."""
+    user_manager = UserManager(get_session)
+
+    created_staff = await user_manager.create_staff(StaffCreate(
+        email="lookup_test@example.com",
+        password_hash="hashed_password",
+        full_name="Lookup Test Staff",
+    ))
+    created_senior = await user_manager.create_senior(SeniorCreate(
+        full_name="Lookup Test Senior",
+        address="1 Lookup St",
+        birth_date=date(1945, 3, 3),
+    ))
+
+    assert await user_manager.senior_exists(created_senior.senior_id)
+    assert not await user_manager.senior_exists(created_senior.senior_id + 1000)
+    assert await user_manager.get_senior_staff_id(created_senior.senior_id) is None
+
+    await user_manager.link_staff_to_senior(created_staff.staff_id, created_senior.senior_id)
+
+    assert await user_manager.get_senior_staff_id(created_senior.senior_id) == created_staff.staff_id
+
+@pytest.mark.asyncio
+async def test_get_staff_ids_by_senior_ids(get_session: AsyncSession):
+    """Test grouping seniors by their staff in a single query (risk-levels batch notification)."""
+    user_manager = UserManager(get_session)
+
+    staff_a = await user_manager.create_staff(StaffCreate(
+        email="group_a@example.com", password_hash="hashed_password", full_name="Group Staff A",
+    ))
+    staff_b = await user_manager.create_staff(StaffCreate(
+        email="group_b@example.com", password_hash="hashed_password", full_name="Group Staff B",
+    ))
+    seniors = [
+        await user_manager.create_senior(SeniorCreate(
+            full_name=f"Group Senior {i}", address=f"{i} Group St", birth_date=date(1940, 1, i + 1),
+        ))
+        for i in range(3)
+    ]
+    await user_manager.link_staff_to_senior(staff_a.staff_id, seniors[0].senior_id)
+    await user_manager.link_staff_to_senior(staff_a.staff_id, seniors[1].senior_id)
+    await user_manager.link_staff_to_senior(staff_b.staff_id, seniors[1].senior_id)
+    await user_manager.link_staff_to_senior(staff_b.staff_id, seniors[2].senior_id)
+
+    seniors_by_staff = await user_manager.get_staff_ids_by_senior_ids(
+        [seniors[0].senior_id, seniors[1].senior_id]
+    )
+
+    assert sorted(seniors_by_staff[staff_a.staff_id]) == sorted([seniors[0].senior_id, seniors[1].senior_id])
+    # 요청하지 않은 어르신(seniors[2])은 결과에 포함되지 않습니다.
+    assert seniors_by_staff[staff_b.staff_id] == [seniors[1].senior_id]
+    assert await user_manager.get_staff_ids_by_senior_ids([]) == {}
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import socket
+
+import pytest
+import socketio
+import uvicorn
+
+import web.services.websocket as websocket
+
+TEST_CHANNEL = "socketio-test"
+
+
+def test_default_manager_without_redis_manager(monkeypatch):
+    """SOCKETIO_REDIS_MANAGER가 꺼져 있으면 프로세스 내부 기본 매니저를 사용해야 합니다."""
+    monkeypatch.setattr(websocket, "SOCKETIO_REDIS_MANAGER", False)
+
+    client_manager = websocket.create_client_manager()
+    server = socketio.AsyncServer(async_mode="asgi", client_manager=client_manager)
+
+    assert client_manager is None
+    assert type(server.manager) is socketio.AsyncManager
+
+
+def test_redis_manager_when_enabled(monkeypatch):
+    """SOCKETIO_REDIS_MANAGER가 켜져 있으면 SOCKETIO_REDIS_URL/채널로 AsyncRedisManager를 만들어야 합니다."""
+    monkeypatch.setattr(websocket, "SOCKETIO_REDIS_MANAGER", True)
+    monkeypatch.setattr(websocket, "SOCKETIO_REDIS_CHANNEL", TEST_CHANNEL)
+    monkeypatch.setenv("SOCKETIO_REDIS_URL", "redis://redis-host:6380/0")
+
+    client_manager = websocket.create_client_manager()
+    server = socketio.AsyncServer(async_mode="asgi", client_manager=client_manager)
+
+    assert isinstance(server.manager, socketio.AsyncRedisManager)
+    assert server.manager.redis_url == "redis://redis-host:6380/0"
+    assert server.manager.channel == TEST_CHANNEL
+
+
+def test_redis_manager_url_from_redis_settings(monkeypatch):
+    """SOCKETIO_REDIS_URL이 없으면 REDIS_* 설정으로 URL을 만들고, 비밀번호는 인코딩해야 합니다."""
+    monkeypatch.delenv("SOCKETIO_REDIS_URL", raising=False)
+    monkeypatch.setenv("REDIS_HOST", "redis-host")
+    monkeypatch.setenv("REDIS_PORT", "6380")
+    monkeypatch.setenv("REDIS_PASSWORD", "p@ss/word")
+
+    assert websocket.redis_manager_url() == "redis://:p%40ss%2Fword@redis-host:6380/0"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def test_emit_from_other_process_reaches_connected_socket(monkeypatch, redis_session_manager):
+    """다른 프로세스(다른 노드)에서 Redis로 보낸 emit이 이 노드에 연결된 소켓에 전달되어야 합니다."""
+    pytest.importorskip("aiohttp")  # Socket.IO 클라이언트의 websocket 전송
+    redis_url = "redis://{}:{}/0".format(
+        os.getenv("TEST_REDIS_HOST", os.getenv("REDIS_HOST", "localhost")),
+        os.getenv("TEST_REDIS_PORT", os.getenv("REDIS_PORT", "6379")),
+    )
+    monkeypatch.setattr(websocket, "SOCKETIO_REDIS_MANAGER", True)
+    monkeypatch.setattr(websocket, "SOCKETIO_REDIS_CHANNEL", TEST_CHANNEL)
+    monkeypatch.setenv("SOCKETIO_REDIS_URL", redis_url)
+    monkeypatch.delenv("REDIS_PASSWORD", raising=False)
+
+    node = socketio.AsyncServer(async_mode="asgi", client_manager=websocket.create_client_manager())
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(socketio.ASGIApp(node), host="127.0.0.1", port=port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    client = socketio.AsyncClient()
+    try:
+        while not server.started:
+            await asyncio.sleep(0.05)
+
+        received = asyncio.get_running_loop().create_future()
+        client.on("noti", lambda data: received.set_result(data))
+        await client.connect(f"http://127.0.0.1:{port}", transports=["websocket"])
+        # 노드가 Redis 채널 구독을 마칠 때까지 기다립니다.
+        await asyncio.sleep(0.5)
+
+        # 소켓이 연결되어 있지 않은 다른 프로세스의 emit (write_only 매니저)
+        other_process = socketio.AsyncRedisManager(redis_url, channel=TEST_CHANNEL, write_only=True)
+        await other_process.emit("noti", {"senior_id": 1}, namespace="/", room=client.get_sid())
+
+        assert await asyncio.wait_for(received, timeout=5) == {"senior_id": 1}
+    finally:
+        await client.disconnect()
+        server.should_exit = True
+        await server_task
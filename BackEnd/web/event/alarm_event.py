@@ -3,12 +3,15 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from common.modules.iot_hub_manager import IotHubManager
-from common.modules.user_manager import UserManager
 from web.services.websocket import sio
 from web.schemas.socket_event import AlarmEvents
 from common.modules.session_manager import SessionManager
+from common.modules.log_manager import get_logger
 from web.services.database import db,red
 from web.services.safety_alarm import notify_emergency_situation, notify_safety_check_failed
+from web.services.senior_rooms import senior_room
+
+logger = get_logger(__name__)
 
 sess_man = SessionManager(red)
 
@@ -17,32 +20,27 @@ sess_man = SessionManager(red)
 @sio.on(AlarmEvents.REPORT_SENIOR_IS_SAFE)
 async def handle_report_senior_is_safe(sid, data):
     """Hub가 '어르신 안전'을 보고했을 때 처리"""
-    print(f"Hub로부터 안전 보고 수신 (sid: {sid}): {data}")
+    logger.info("Hub로부터 안전 보고 수신 (sid: %s): %s", sid, data)
 
 @sio.on(AlarmEvents.REPORT_EMERGENCY)
 async def handle_report_emergency(sid, data):
     """Hub가 '응급 상황'을 보고했을 때 처리"""
-    print(f"Hub로부터 응급 상황 보고 수신 (sid: {sid}): {data}")
+    logger.warning("Hub로부터 응급 상황 보고 수신 (sid: %s): %s", sid, data)
     sess_info = await sess_man.get_session_by_sid(sid)
-    
-    async for session in db.get_session():
-        staff_id = (await UserManager(session).get_senior_staff(sess_info.senior_id)).staff_id
-        recv_sid = (await SessionManager(red).get_session_by_staff_id(staff_id)).sid
+    if sess_info is None or sess_info.senior_id is None:
+        logger.warning("sid %s 허브에 연결된 어르신을 찾을 수 없습니다.", sid)
+        return
 
-    if recv_sid:
-        await notify_emergency_situation(recv_sid)
-    else:
-        print(f"경고: sid {recv_sid}에 연결된 FE 클라이언트를 찾을 수 없습니다.")
+    # 어르신 room의 모든 담당 직원에게 전파합니다.
+    await notify_emergency_situation(senior_room(sess_info.senior_id))
 
 @sio.on(AlarmEvents.REPORT_CHECK_FAILED)
 async def handle_report_check_failed(sid, data):
     """Hub가 '안전 점검 자체의 실패'를 보고했을 때 처리"""
-    print(f"Hub로부터 안전 점검 실패 보고 수신 (sid: {sid}): {data}")
+    logger.warning("Hub로부터 안전 점검 실패 보고 수신 (sid: %s): %s", sid, data)
     sess_info = await sess_man.get_session_by_sid(sid)
-    async for session in db.get_session():
-        staff_id = (await UserManager(session).get_senior_staff(sess_info.senior_id)).staff_id
-        recv_sid = (await SessionManager(red).get_session_by_staff_id(staff_id)).sid
-    if recv_sid:
-        await notify_safety_check_failed(recv_sid)
-    else:
-        print(f"경고: sid {recv_sid}에 연결된 FE 클라이언트를 찾을 수 없습니다.")
+    if sess_info is None or sess_info.senior_id is None:
+        logger.warning("sid %s 허브에 연결된 어르신을 찾을 수 없습니다.", sid)
+        return
+
+    await notify_safety_check_failed(senior_room(sess_info.senior_id))
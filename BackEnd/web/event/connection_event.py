@@ -5,9 +5,14 @@ from common.modules.api_key_manager import ApiKeyRepository
 from web.services.database import db,red
 
 from web.schemas.socket_event import ConnectEvents
+from web.services.senior_rooms import join_care_senior_rooms
+from web.services.session_keeper import session_keeper
 from common.modules.session_manager import SessionManager
+from common.modules.log_manager import get_logger, sampled
 from common.schemas.session import ConnectionInfo, SessionType
 
+logger = get_logger(__name__)
+
 
 session_man = SessionManager(red)
 
@@ -24,10 +29,10 @@ AuthPacket = Union[HubAuthPacket, StaffAuthPacket]
 
 @sio.on(ConnectEvents.CONNECT)
 async def connect(sid, environ, auth: AuthPacket=None):
-    print(f"✅ [연결 시도] 클라이언트 접속. sid: {sid}")
+    logger.info("[연결 시도] 클라이언트 접속. sid: %s", sid, extra=sampled())
 
     if not auth:
-        print(f"[인증 실패] 인증 정보가 없습니다. sid: {sid}")
+        logger.warning("[인증 실패] 인증 정보가 없습니다. sid: %s", sid)
         await sio.disconnect(sid)
         return
     
@@ -40,6 +45,8 @@ async def connect(sid, environ, auth: AuthPacket=None):
                 sid=sid,
                 session_type=SessionType.HUB,
                 hub_id=hub_info.hub_id,
+                senior_id=hub_info.senior_id,
+                worker_id=session_keeper.worker_id,
             )
             await session_man.create_session(con_info)
             await sio.emit(ConnectEvents.AUTH_SUCCESS, to=sid)
@@ -47,26 +54,29 @@ async def connect(sid, environ, auth: AuthPacket=None):
         jwt = auth.get('token')
         async for session in db.get_session():
             user_info = await auth_module.get_current_user(jwt, session)
+            # 담당 어르신 room에 입장하여 이후 알림을 조회 없이 room 단위로 받습니다.
+            await join_care_senior_rooms(sid, user_info.staff_id, session)
         con_info = ConnectionInfo(
             sid=sid,
             session_type=SessionType.FE,
-            staff_id=user_info.staff_id
+            staff_id=user_info.staff_id,
+            worker_id=session_keeper.worker_id,
         )
         await session_man.create_session(con_info)
         await sio.emit(ConnectEvents.AUTH_SUCCESS, to=sid)
     else:
-        print(f"[인증 실패] 유효하지 않은 인증 패킷입니다. sid: {sid}, data: {auth}")
+        logger.warning("[인증 실패] 유효하지 않은 인증 패킷입니다. sid: %s, keys: %s", sid, list(auth))
         await sio.disconnect(sid)
     #TODO: 추후 일정 시간 인증이 안되면 연결을 끊는 기능이 필요
 
 @sio.on(ConnectEvents.AUTHENTICATE)
 async def authenticate(sid, data: AuthPacket):
     """클라이언트가 보낸 토큰으로 인증하고 Redis에 세션 정보를 저장합니다."""
-    print("deprecated event")
+    logger.warning("deprecated event: authenticate (sid: %s)", sid)
 
 @sio.on(ConnectEvents.DISCONNECT)
 async def disconnect(sid):
-    """연결 종료 시 Redis에서 매핑 정보를 삭제합니다."""
+    """연결 종료 시 Redis에서 매핑 정보를 삭제합니다. (room 퇴장은 python-socketio가 자동으로 처리)"""
     await session_man.delete_session(sid)
-    print(f"👋 [연결 종료] 클라이언트 연결 끊김. sid: {sid}")
+    logger.info("[연결 종료] 클라이언트 연결 끊김. sid: %s", sid, extra=sampled())
 
@@ -1,15 +1,19 @@
 from web.services.websocket import sio
 from web.services.senior_status_manager import SeniorStatusManager, SensorStatusManager
 from common.modules.session_manager import SessionManager
+from common.modules.log_manager import get_logger
 from common.modules.user_manager import UserManager
 from web.services.database import db,red
+from web.services.sensor_state_matrix import SENSOR_STATE_MATRIX, sensor_state_matrix
 from web.schemas.socket_event import NotifyEvents
 from web.services.data_alarm import notify_senior_status_change, notify_sensor_status_log_change
 
+logger = get_logger(__name__)
+
 
 @sio.on(NotifyEvents.CLIENT_REQUEST_ALL_SENIOR_STATUS)
 async def notify_all_senior_status(sid: str):
-    print("CLIENT_REQUEST_ALL_SENIOR_STATUS 요청")
+    logger.debug("CLIENT_REQUEST_ALL_SENIOR_STATUS 요청 (sid: %s)", sid)
     async for session in db.get_session():
         sess_info = await SessionManager(red).get_session_by_sid(sid)
         senior_list = await UserManager(session).get_care_seniors(sess_info.staff_id)
@@ -18,13 +22,18 @@ async def notify_all_senior_status(sid: str):
         for senior_id in managed_senior_ids:
             senior_status= await SeniorStatusManager(red).get_status(senior_id)
             if senior_status:
-                await notify_senior_status_change(senior_id, senior_status)
+                await notify_senior_status_change(senior_id, senior_status, recv_sid=sid)
 
 @sio.on(NotifyEvents.CLIENT_REQUEST_ALL_SENSOR_STATUS)
 async def notify_all_sensor_status(sid: str, senior_id: int):
-    print("CLIENT_REQUEST_ALL_SENSOR_STATUS 요청")
-    packet= await SensorStatusManager(red).get_all_sensor_statuses(senior_id)
+    logger.debug("CLIENT_REQUEST_ALL_SENSOR_STATUS 요청 (sid: %s, 어르신 ID: %s)", sid, senior_id)
+    packet = sensor_state_matrix.frontend_payload(senior_id) if SENSOR_STATE_MATRIX else None
+    if packet is None:
+        packet= await SensorStatusManager(red).get_all_sensor_statuses(senior_id)
+        if packet and SENSOR_STATE_MATRIX:
+            sensor_state_matrix.apply(packet, complete=True)
     if packet:
-        await notify_sensor_status_log_change(packet)
+        # 요청한 클라이언트에게 바로 응답하므로 수신자 조회가 필요 없습니다.
+        await notify_sensor_status_log_change(packet, recv_sid=sid)
 
 
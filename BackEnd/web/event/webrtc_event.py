@@ -2,12 +2,15 @@
 from web.services.websocket import sio
 from web.services.database import db, red
 from common.modules.session_manager import SessionManager
+from common.modules.log_manager import get_logger, sampled
 from common.modules.webrtc_manager import WebRTCManager
-from common.modules.user_manager import UserManager
 from common.modules.iot_hub_manager import IotHubManager
 from common.schemas.session import SessionType
 
 from web.schemas.socket_event import WebRTCEvents
+from web.services.senior_rooms import senior_room
+
+logger = get_logger(__name__)
 
 
 rtc_man = WebRTCManager(red)
@@ -43,7 +46,7 @@ async def on_send_answer(sid, senior_id: int, data):
         answer = await rtc_man.consume_answer(senior_id)
         await sio.emit(WebRTCEvents.NEW_ANSWER, answer, to=recv_sid)
     else:
-        print("recv_sid not exist")
+        logger.info("recv_sid not exist (senior_id: %s)", senior_id)
 
 
 @sio.on(WebRTCEvents.CHECK_ANSWER)
@@ -61,12 +64,8 @@ async def on_send_ice_candidate(sid, senior_id: int, data):
         sess_info = await sess_man.get_session_by_sid(sid)
         async for session in db.get_session():
             if sess_info.session_type == SessionType.HUB:
-                staff_id = (
-                    await UserManager(session).get_senior_staff(senior_id)
-                ).staff_id
-                recv_sid = (
-                    await SessionManager(red).get_session_by_staff_id(staff_id)
-                ).sid
+                # 로봇 -> FE: 어르신 room의 담당 직원들에게 전달합니다.
+                recv_sid = senior_room(senior_id)
             elif sess_info.session_type == SessionType.FE:
                 hub_info = await IotHubManager(session).get_hub_by_senior_id(senior_id)
                 recv_sid = (
@@ -77,5 +76,5 @@ async def on_send_ice_candidate(sid, senior_id: int, data):
 
         if recv_sid:
             # 상대방에게 'server:new_ice_candidate' 이벤트를 보냅니다.
-            print(f"[ICE 전송] {sid} -> {recv_sid} ICE Candidate 수신")
+            logger.debug("[ICE 전송] %s -> %s ICE Candidate 수신", sid, recv_sid, extra=sampled())
             await sio.emit(WebRTCEvents.NEW_ICE_CANDIDATE, data, to=recv_sid)
@@ -1,9 +1,6 @@
 import asyncio
-from datetime import datetime, timezone
 import os
-from typing import Any, Dict
 
-import httpx
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 import redis.asyncio as redis
@@ -13,18 +10,23 @@ from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 
-from common.models.enums import SensorTypeEnum
-from common.modules.user_manager import UserManager
 from web.routers import ai
-from web.schemas.monitoring_schema import FrontendSensorStatusPayload
-from web.services.senior_status_manager import SensorStatusManager
+from common.modules.log_manager import get_logger, setup_logging
+from common.modules.senior_roster import senior_roster
+from web.services.sensor_state_matrix import SENSOR_STATE_MATRIX, sensor_state_matrix
+from web.services.session_keeper import session_keeper
+from web.services.ai_tick import AI_TICK_MODE, AI_TICK_SHARDING, ai_tick_dispatcher, get_ai_scheduler, tick_membership
+from web.services.write_behind import SENSOR_LOG_WRITE_BEHIND, sensor_log_flusher
 
 # .env 파일 로드
 load_dotenv()
+# 로그는 큐에 넣고 별도 스레드에서 출력합니다. (LOG_LEVEL, LOG_FORMAT, LOG_SAMPLE_EVERY)
+setup_logging()
+logger = get_logger(__name__)
 
 import socketio
 
-from web.routers import auth, iot, monitoring, test
+from web.routers import auth, iot, metrics, monitoring, test
 from web.services.database import db, red
 from web.services.websocket import sio
 
@@ -32,105 +34,72 @@ import web.event.connection_event
 import web.event.webrtc_event
 import web.event.noti_event
 
-def transform_payload_to_flat_format(payload: FrontendSensorStatusPayload) -> Dict[str, Any]:
-    """
-    FrontendSensorStatusPayload를 AI 서버 명세서에 맞는 형식으로 변환합니다.
-    """
-    # 'data' 필드는 센서 ID와 값(0 또는 1)만 포함합니다.
-    sensor_data_dict = {
-        member.value: 0 for member in SensorTypeEnum
-    }
-    if 'power_tv' in sensor_data_dict:
-        sensor_data_dict['tv'] = sensor_data_dict.pop('power_tv')
-    for sensor in payload.sensors:
-        key = 'tv' if sensor.sensor_id == 'power_tv' else sensor.sensor_id
-        if key in sensor_data_dict:
-            sensor_data_dict[key] = int(sensor.value)
-
-    # 가장 최근의 timestamp를 찾습니다.
-    latest_timestamp = datetime.now(timezone.utc)
-        
-    # ❗ 명세서에 맞게 timestamp를 최상위 레벨로 배치합니다.
-    result = {
-        "senior_id": payload.senior_id,
-        "timestamp": latest_timestamp.isoformat().replace("+00:00", "Z"),
-        "data": sensor_data_dict
-    }
-    
-    return result
-
-
-# --- 👇 백그라운드 작업 함수 (수정됨) ---
-
-AI_SERV = os.getenv("AI_HOST")
-
-async def my_periodic_task():
-    """10초마다 모든 어르신의 센서 상태를 AI 서버에 보내는 주기적인 작업입니다."""
-    sens_man = SensorStatusManager(red)
-    print("🚀 Background task started. Will run every 10 seconds.")
-    
-    while True:
-        try:
-            print("\n--- Running periodic task cycle ---")
-            
-            # ❗ 올바른 DB 세션 관리 방식으로 수정
-            async for session in db.get_session():
-                user_manager = UserManager(session)
-                seni_list = await user_manager.get_all_seniors()
-                if not seni_list:
-                    print("No seniors found to process.")
-                    await asyncio.sleep(10)
-                    continue
-
-                sen_id_list = [senior.senior_id for senior in seni_list]
-
-            # HTTP 클라이언트는 루프마다 새로 생성하는 것이 안전합니다.
-            async with httpx.AsyncClient() as client:
-                for sen_id in sen_id_list:
-                    print(f"Processing senior_id: {sen_id}")
-                    sen_stat = await sens_man.get_all_sensor_statuses(sen_id)
-                    
-                    # ❗ (가장 중요) sen_stat이 None이 아닌지 확인
-                    if sen_stat:
-                        transformed_data  = transform_payload_to_flat_format(sen_stat)
-                        
-                        print(f"Sending data to AI server for senior_id {sen_id}...")
-                        print(transformed_data)
-                        response = await client.post(f"{AI_SERV}/ai/tick", json=transformed_data)
-                        
-                        print(f"AI server response for senior_id {sen_id}: {response.status_code} - {response.text}")
-                    else:
-                        print(f"No sensor status found in Redis for senior_id: {sen_id}. Skipping.")
-
-        except Exception as e:
-            # ❗ 루프 전체에 예외 처리를 추가하여 작업이 중단되지 않도록 함
-            print(f"🔥🔥🔥 An error occurred in periodic task: {e}")
-            # 오류 발생 시에도 다음 주기를 위해 대기
-        
-        await asyncio.sleep(10)
-
 
 # Lifespan 컨텍스트 매니저 정의
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작과 종료 시 처리할 로직"""
-    print("--- FastAPI app startup: creating DB tables... ---")
+    logger.info("FastAPI app startup: creating DB tables...")
     await db.create_db_and_tables()
     await db.convert_to_hypertable("sensor_logs", "timestamp")
-    print("--- DB tables created successfully. ---")
-
-    task = asyncio.create_task(my_periodic_task())
-    print("--- BG task created successfully. ---")
+    logger.info("DB tables created successfully.")
+
+    if ai_tick_dispatcher.risk_engine is not None:
+        # 내장 위험도 엔진을 켤 수 없는 설정이면 tick을 시작하기 전에 서버 시작을 중단합니다.
+        ai_tick_dispatcher.risk_engine.start()
+
+    # 백그라운드 작업이 사용하는 어르신 목록 캐시를 pub/sub으로 갱신하는 작업입니다.
+    roster_task = asyncio.create_task(senior_roster.run(db, red))
+    matrix_task = None
+    if SENSOR_STATE_MATRIX:
+        # 다른 워커가 받은 센서 변경을 프로세스 내부 행렬에 반영하는 작업입니다.
+        matrix_task = asyncio.create_task(sensor_state_matrix.run(red))
+    # 어르신의 센서 상태를 AI 서버에 보내는 작업입니다.
+    # (AI_TICK_MODE=poll: 모든 어르신을 주기마다, event: 상태가 바뀐 어르신 위주로)
+    ai_scheduler = get_ai_scheduler()
+    task = asyncio.create_task(ai_scheduler.run())
+    membership_task = None
+    if AI_TICK_MODE != "event" and AI_TICK_SHARDING:
+        # 여러 워커/컨테이너가 어르신을 나눠 tick 하도록 Redis에 워커를 등록합니다.
+        membership_task = asyncio.create_task(tick_membership.run())
+    logger.info("BG task created successfully.")
+    flusher_task = None
+    if SENSOR_LOG_WRITE_BEHIND:
+        flusher_task = asyncio.create_task(sensor_log_flusher.run())
+        logger.info("Sensor log write-behind flusher created successfully.")
     # 연결 확인
     try:
         await red.ping()
-        print("Redis connect successfully")
+        logger.info("Redis connect successfully")
     except redis.exceptions.ConnectionError as e:
-        print(f"Redis connect fail: {e}")
+        logger.critical("Redis connect fail: %s", e)
         exit()
+    # 이전 실행에서 남은 세션을 정리하고, 연결된 소켓의 세션 만료 시간을 주기적으로 연장합니다.
+    await session_keeper.start()
+    session_task = asyncio.create_task(session_keeper.run())
     yield
+    session_keeper.stop()
+    session_task.cancel()
+    await session_keeper.leave()
+    ai_scheduler.stop()
     task.cancel()
-    print("--- FastAPI app shutdown. ---")
+    senior_roster.stop()
+    roster_task.cancel()
+    if matrix_task:
+        sensor_state_matrix.stop()
+        matrix_task.cancel()
+    if membership_task:
+        tick_membership.stop()
+        membership_task.cancel()
+    await ai_tick_dispatcher.close()
+    if flusher_task:
+        # 남은 로그를 반영할 시간을 준 뒤 종료합니다.
+        sensor_log_flusher.stop()
+        try:
+            await asyncio.wait_for(flusher_task, timeout=10)
+        except asyncio.TimeoutError:
+            logger.warning("Sensor log flusher did not stop in time.")
+    logger.info("FastAPI app shutdown.")
 
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(lifespan=lifespan)
@@ -141,6 +110,7 @@ app.include_router(auth.router)
 app.include_router(ai.router)
 app.include_router(iot.router)
 app.include_router(monitoring.router)
+app.include_router(metrics.router)
 
 app.include_router(test.router)
 
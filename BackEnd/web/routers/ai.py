@@ -5,7 +5,9 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from web.services.senior_status_manager import SeniorStatusManager
 from web.services.database import db, red
-from web.schemas.ai_schmas import RiskAssessmentPacket
+from web.schemas.ai_schmas import RiskAssessmentBatch, RiskAssessmentPacket
+from web.services.data_alarm import notify_senior_status_batch, senior_notify_needs_staff
+from common.modules.user_manager import UserManager
 
 
 router = APIRouter(prefix="/ai", tags=["AI"])
@@ -62,6 +64,31 @@ async def update_risk_level(senior_id: int, payload: RiskAssessmentPacket, db: A
     # 어떤 상태로 변경되었는지 응답 메시지에 포함하면 더 좋습니다.
     return {"msg": f"상태 변경 테스트:{senior_id}어르신의 상태가 '{payload.risk_level.value}'(으)로 업데이트 되었습니다."}
 
+@router.put(
+    "/seniors/risk-levels",
+    status_code=status.HTTP_200_OK,
+    summary="AI 위험도 분석 결과 일괄 업데이트",
+    tags=["AI"]
+)
+async def update_risk_levels(payload: RiskAssessmentBatch, db: AsyncSession = Depends(db.get_session)):
+    """
+    AI 실행 서버가 분석한 여러 어르신의 위험도를 한 번에 업데이트합니다.
+    상태 저장은 Redis pipeline 한 번으로 처리합니다.
+    직원 단위 알림(SENIOR_NOTIFY_MODE=batch/both)일 때만 알림 대상 직원을 DB 쿼리 한 번으로 조회하고,
+    기본(item) 방식은 어르신 room으로 보내므로 DB를 조회하지 않습니다.
+    """
+    ssm = SeniorStatusManager(red)
+    statuses = await ssm.update_statuses(payload.results)
+
+    seniors_by_staff = {}
+    if statuses and senior_notify_needs_staff():
+        seniors_by_staff = await UserManager(db).get_staff_ids_by_senior_ids(
+            list({senior_status.senior_id for senior_status in statuses})
+        )
+    await notify_senior_status_batch(statuses, seniors_by_staff)
+
+    return {"msg": f"{len(statuses)}명의 어르신 상태가 업데이트 되었습니다.", "updated": len(statuses)}
+
 # @router.post(
 #     "/logs/errors",
 #     status_code=status.HTTP_201_CREATED,
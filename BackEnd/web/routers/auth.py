@@ -5,16 +5,19 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from web.services.database import db
+from web.services.database import db, red
+from web.services.senior_rooms import join_senior_room_if_connected
 from web.services.auth_service import auth_module
 from web.schemas.auth_schema import (
     LoginRequest, LoginResponse, StaffRegister, StaffEdit,
     SeniorRegister, SeniorEdit, Hub, ApiKey
 )
 
-from common.modules.user_manager import UserManager, StaffCreate, SeniorCreate, StaffInfo, StaffUpdate, SeniorUpdate
+from common.modules.user_manager import UserManager, StaffCreate, SeniorCreate, StaffInfo, StaffUpdate, SeniorUpdate, SeniorRosterEntry
+from common.modules.senior_roster import senior_roster
 from common.modules.iot_hub_manager import IotHubManager, HubCreate, HubUpdate
 from common.modules.api_key_manager import ApiKeyManager, ApiKeyRepository
+from common.modules.hub_cache import hub_cache
 
 # jwt 토큰이 인코딩하는 정보
 class TokenInfo:
@@ -168,6 +171,13 @@ async def register_senior(
         await iot_manager.edit_hub_info(existing_hub.hub_id, update_hub_data)
 
     await db.commit()
+    if existing_hub is not None:
+        # 커밋 전에 다른 요청이 이전 허브 정보를 다시 캐시했을 수 있으므로 커밋 후 한 번 더 무효화합니다.
+        await hub_cache.invalidate_hub(existing_hub.hub_id)
+    await join_senior_room_if_connected(red, current_user.staff_id, created_senior.senior_id)
+    await senior_roster.publish(
+        red, SeniorRosterEntry(senior_id=created_senior.senior_id, full_name=created_senior.full_name)
+    )
     
     return {"message": "Senior and device registered successfully.", "senior_id": created_senior.senior_id}
 
@@ -224,6 +234,7 @@ async def edit_senior(
         await db.commit()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    await senior_roster.publish(red, SeniorRosterEntry(senior_id=senior_id, full_name=full_name))
 
     return {"message": "Staff account updated successfully."}
 
@@ -254,6 +265,9 @@ async def register_hub(
 
     await api_key_repo.update_hash_for_hub(hashed_key, created_hub.hub_id)
     await db.commit()
+    # 커밋 전에 다른 요청이 이전 키/허브 정보를 다시 캐시했을 수 있으므로 커밋 후 한 번 더 무효화합니다.
+    await hub_cache.invalidate_hub(created_hub.hub_id)
+    await hub_cache.invalidate(hashed_key)
 
     return {"api_key": api_key}
 
@@ -1,59 +1,226 @@
 # app/routers/iot.py
 """IoT 기기 연동 관련 라우터"""
 
-from fastapi import APIRouter, Depends, status, HTTPException
+import json
+import os
+from typing import AsyncIterator, Union
+
+from fastapi import APIRouter, Depends, Request, status, HTTPException
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # 프로젝트 구조에 맞게 경로를 수정해주세요.
-from web.schemas.iot_schema import SeniorIdRequest, SeniorIdResponse, SensorLogPayload
-from common.modules.sensor_log_manager import SensorLogManager
+from web.schemas.iot_schema import (
+    SeniorIdRequest, SeniorIdResponse, SensorLogPayload,
+    SensorLogBatchPayload, SensorLogBatchResponse,
+)
 from common.modules.iot_hub_manager import IotHubManager, HubCreate, HubUpdate, HubBasicInfo
 from common.modules.api_key_manager import ApiKeyRepository, ApiKeyManager
-from web.services.data_alarm import notify_sensor_status_log_change
+from common.modules.sensor_log_queue import SensorLogQueueFullError
 from web.services.database import db,red
-from web.services.hub_service import SensorDataService
-from web.services.senior_status_manager import SensorStatusManager
+from web.services.ingest_codec import MSGPACK_CONTENT_TYPES, BinarySensorLogPayload, decode_sensor_log_msgpack
+from web.services.ingest_pipeline import SeniorNotAssignedError, SensorIngestPipeline
 
 router = APIRouter(prefix="/iot", tags=["IoT"])
 
+# 배치 요청 하나에 담을 수 있는 최대 그룹(허브) 수
+MAX_BATCH_GROUPS = int(os.getenv("IOT_BATCH_MAX_GROUPS", "1000"))
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+
+
+async def parse_sensor_log_payload(request: Request) -> Union[SensorLogPayload, BinarySensorLogPayload]:
+    """
+    Content-Type에 따라 센서 로그 본문을 파싱합니다.
+    - application/json: 기존 SensorLogPayload JSON (Pydantic 검증)
+    - application/msgpack: 정수 센서 코드와 msgpack timestamp를 사용하는 바이너리 형식 (msgspec 디코딩)
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    body = await request.body()
+
+    if content_type in MSGPACK_CONTENT_TYPES:
+        try:
+            return decode_sensor_log_msgpack(body)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    try:
+        return SensorLogPayload.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
 
 @router.post(
     "/logs",
     status_code=status.HTTP_201_CREATED,
     summary="센서 이벤트 로그 전송",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": SensorLogPayload.model_json_schema()},
+                "application/msgpack": {
+                    "schema": {
+                        "type": "string",
+                        "format": "binary",
+                        "description": '{"api_key": str, "sensor_data": [[sensor_code, value, timestamp(ext -1), (description)], ...]}',
+                    }
+                },
+            },
+            "required": True,
+        }
+    },
     responses={
         401: {"description": "인증 실패 (유효하지 않은 API 키)"},
+        404: {"description": "해당 허브에 할당된 어르신을 찾을 수 없음"},
+        503: {"description": "write-behind 큐 포화 (Retry-After 후 재전송)"},
     }
 )
 async def receive_sensor_logs(
-    payload: SensorLogPayload,
+    payload: Union[SensorLogPayload, BinarySensorLogPayload] = Depends(parse_sensor_log_payload),
     db_session: AsyncSession = Depends(db.get_session)
 ):
     """
     홈 허브가 수집한 센서 데이터들을 묶어 서버로 전송하고 데이터베이스에 저장합니다..
+
+    `Content-Type: application/msgpack` 으로 보내면 센서 종류는 SENSOR_TYPE_CODES의 정수 코드,
+    시각은 msgpack timestamp 확장 타입(epoch 기준)을 사용하는 바이너리 형식으로 받습니다.
     """
-    # [권한 검증] API 키에 연결된 어르신 ID와 페이로드의 어르신 ID가 일치하는지 확인합니다.
-    # 이를 통해 허브가 다른 어르신의 로그를 잘못 전송하는 것을 방지합니다.
-    api_key_repo = ApiKeyRepository(db_session)
-    hub = await api_key_repo.get_hub_by_api_key(payload.api_key)
-    if hub is None:
+    # [권한 검증] API 키에 연결된 허브/어르신/담당 직원을 요청당 한 번만 조회하고,
+    # 이후 저장 -> 커밋 -> 캐싱/알림 단계에서 같은 컨텍스트를 재사용합니다.
+    pipeline = SensorIngestPipeline(db_session, red)
+    try:
+        ctx, accepted = await pipeline.run(payload)
+    except SensorLogQueueFullError as e:
+        # write-behind 큐가 가득 찼으면 허브가 잠시 후 재전송하도록 합니다.
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"},
+        )
+    except SeniorNotAssignedError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    if ctx is None:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
-    senior_id = hub.senior_id
+    await db_session.commit()
+    # 커밋에 실패하면 캐시/알림/평가 예약에 저장되지 않은 상태가 남지 않도록 커밋 후에 수행합니다.
+    await pipeline.publish(accepted)
+    
+    return {"message": "Logs have been successfully saved."}
+
+
+def _check_group_count(count: int) -> None:
+    if count > MAX_BATCH_GROUPS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many groups (max {MAX_BATCH_GROUPS})",
+        )
+
+
+def _parse_ndjson_line(line: bytes) -> Union[SensorLogPayload, str]:
+    try:
+        return SensorLogPayload.model_validate_json(line)
+    except ValidationError as e:
+        return str(e)
+
 
-    # SensorLogManager를 사용하여 로그를 데이터베이스에 추가합니다.
-    log_manager = SensorLogManager(db_session)
-    await log_manager.add_logs(senior_id, payload.sensor_data)
+async def _iter_ndjson_groups(request: Request) -> AsyncIterator[Union[SensorLogPayload, str]]:
+    """NDJSON 본문을 받는 대로 한 줄씩 SensorLogPayload로 파싱합니다. 실패한 줄은 오류 메시지를 반환합니다."""
+    buffer = b""
+    count = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if not line.strip():
+                continue
+            count += 1
+            _check_group_count(count)
+            yield _parse_ndjson_line(line)
+    # 마지막 줄바꿈이 없는 마지막 줄
+    if buffer.strip():
+        _check_group_count(count + 1)
+        yield _parse_ndjson_line(buffer)
 
-    packet = await SensorDataService(db_session).transform_sensor_data(payload)
-    await SensorStatusManager(red).update_all_sensor_statuses(packet)
-    print("캐싱 완료")
-    await notify_sensor_status_log_change(packet)
-    print("센서 이벤트 트리거 완료")
+
+async def _iter_json_groups(request: Request) -> AsyncIterator[Union[SensorLogPayload, str]]:
+    """SensorLogBatchPayload 형식의 JSON 본문을 그룹 단위로 검증합니다."""
+    try:
+        body = json.loads(await request.body())
+        raw_groups = body["groups"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Body must be a JSON object with a 'groups' array",
+        )
+    if not isinstance(raw_groups, list):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="'groups' must be an array",
+        )
+    _check_group_count(len(raw_groups))
+
+    for raw_group in raw_groups:
+        try:
+            yield SensorLogPayload.model_validate(raw_group)
+        except ValidationError as e:
+            yield str(e)
+
+
+@router.post(
+    "/logs/batch",
+    response_model=SensorLogBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="여러 허브의 센서 이벤트 로그 일괄 전송",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": SensorLogBatchPayload.model_json_schema()},
+                "application/x-ndjson": {"schema": {"type": "string", "description": "한 줄에 SensorLogPayload 하나"}},
+            },
+            "required": True,
+        }
+    },
+    responses={
+        413: {"description": "그룹 수 초과"},
+        503: {"description": "write-behind 큐 포화 (Retry-After 후 재전송)"},
+    }
+)
+async def receive_sensor_logs_batch(
+    request: Request,
+    db_session: AsyncSession = Depends(db.get_session)
+):
+    """
+    게이트웨이/재전송 도구가 여러 허브의 센서 로그를 한 요청으로 전송합니다.
+
+    **[주요 로직]**
+    1. `application/json` 이면 `{"groups": [SensorLogPayload, ...]}`, `application/x-ndjson` 이면
+       한 줄에 SensorLogPayload 하나씩 받으며, NDJSON은 수신하는 대로 파싱합니다.
+    2. 서로 다른 API 키마다 한 번만 인증합니다.
+    3. 인증된 모든 그룹의 로그를 하나의 트랜잭션으로 저장합니다.
+    4. 그룹별 처리 결과(ok / unauthorized / no_senior / invalid)를 요청 순서대로 반환합니다.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        groups = _iter_ndjson_groups(request)
+    else:
+        groups = _iter_json_groups(request)
+
+    pipeline = SensorIngestPipeline(db_session, red)
+    try:
+        results, accepted = await pipeline.run_batch(groups)
+    except SensorLogQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"},
+        )
 
     await db_session.commit()
-    
-    return {"message": "Logs have been successfully saved."}
+    await pipeline.publish(accepted)
+
+    return SensorLogBatchResponse(results=results)
 
 
 @router.get(
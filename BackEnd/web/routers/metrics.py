@@ -0,0 +1,60 @@
+# app/routers/metrics.py
+"""내부 성능 지표 조회 라우터"""
+
+from fastapi import APIRouter, Depends, status
+
+from common.modules.hub_cache import hub_cache
+from common.modules.senior_roster import senior_roster
+from common.modules.session_manager import session_cache
+from web.services.ai_tick import (
+    AI_TICK_MODE,
+    AI_TICK_SHARDING,
+    ai_eval_scheduler,
+    ai_tick_dispatcher,
+    ai_tick_scheduler,
+    tick_membership,
+)
+from web.services.auth_service import auth_module
+from web.services.database import red
+from web.services.session_keeper import session_keeper
+from web.services.sensor_state_matrix import SENSOR_STATE_MATRIX, sensor_state_matrix
+from web.services.write_behind import SENSOR_LOG_WRITE_BEHIND, sensor_log_flusher, sensor_log_queue
+
+
+# 캐시/연결 풀/큐 상태 등 내부 정보이므로 로그인한 직원만 조회할 수 있습니다.
+router = APIRouter(prefix="/metrics", tags=["지표"], dependencies=[Depends(auth_module.get_current_user)])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="내부 성능 지표 조회",
+    responses={401: {"description": "인증 실패"}},
+)
+async def get_metrics():
+    """캐시 적중률 등 백엔드 내부 구성 요소의 지표를 조회합니다."""
+    metrics = {
+        "redis_pool": red.stats(),
+        "hub_cache": hub_cache.stats(),
+        "senior_roster": senior_roster.stats(),
+        "session_cache": session_cache.stats(),
+        "sessions": session_keeper.stats(),
+        "ai_tick": ai_tick_dispatcher.stats(),
+        "ai_tick_schedule": {
+            "mode": AI_TICK_MODE,
+            **(ai_eval_scheduler.stats() if AI_TICK_MODE == "event" else ai_tick_scheduler.stats()),
+        },
+    }
+    if ai_tick_dispatcher.risk_engine is not None:
+        metrics["risk_engine"] = ai_tick_dispatcher.risk_engine.stats()
+    if AI_TICK_MODE != "event" and AI_TICK_SHARDING:
+        metrics["ai_tick_workers"] = tick_membership.stats()
+    if SENSOR_STATE_MATRIX:
+        metrics["sensor_state_matrix"] = sensor_state_matrix.stats()
+    if SENSOR_LOG_WRITE_BEHIND:
+        metrics["sensor_log_queue"] = {
+            "depth": await sensor_log_queue.depth(),
+            **sensor_log_queue.stats(),
+            **sensor_log_flusher.stats(),
+        }
+    return metrics
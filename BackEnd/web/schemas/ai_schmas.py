@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic import BaseModel
 from enum import Enum
 
@@ -13,4 +15,36 @@ class RiskLevelEnum(str, Enum):
 class RiskAssessmentPacket(BaseModel):
     """위험도 평가 결과를 담는 데이터 패킷 스키마"""
     risk_level: RiskLevelEnum
-    reason: str
\ No newline at end of file
+    reason: str
+
+class SeniorRiskAssessment(RiskAssessmentPacket):
+    """어르신 한 명의 위험도 평가 결과 (일괄 반영용)"""
+    senior_id: int
+
+class RiskAssessmentBatch(BaseModel):
+    """여러 어르신의 위험도 평가 결과를 한 번에 반영하는 요청 (PUT /ai/seniors/risk-levels)"""
+    results: List[SeniorRiskAssessment]
+
+class AiTickBatchRequest(BaseModel):
+    """
+    여러 어르신의 센서 스냅샷을 한 번에 보내는 /ai/tick/batch 요청 (열 기반 형식)
+
+    senior_ids[i] 어르신의 센서 상태는 bitmasks[i]에 담기며,
+    비트 j가 1이면 sensors[j] 센서가 활성(1) 상태입니다.
+    """
+    timestamp: str
+    sensors: List[str]
+    senior_ids: List[int]
+    bitmasks: List[int]
+
+
+class AiTickResult(BaseModel):
+    """어르신 한 명의 추론 결과. risk_level이 없으면 보고할 변화가 없다는 뜻입니다. (AI 서버 래치 정책)"""
+    senior_id: int
+    risk_level: Optional[RiskLevelEnum] = None
+    reason: Optional[str] = None
+
+
+class AiTickBatchResponse(BaseModel):
+    """/ai/tick/batch 응답"""
+    results: List[AiTickResult]
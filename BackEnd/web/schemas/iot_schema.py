@@ -24,6 +24,20 @@ class SensorLogPayload(BaseModel):
     api_key: str
     sensor_data: List[SensorDataItem]
 
+class SensorLogBatchPayload(BaseModel):
+    """여러 허브(어르신 댁)의 센서 로그를 한 번에 전송하는 게이트웨이/재전송 도구용 모델"""
+    groups: List[SensorLogPayload]
+
+class SensorLogGroupResult(BaseModel):
+    """배치 수신 시 그룹(허브) 하나의 처리 결과"""
+    index: int
+    status: str                  # "ok" | "unauthorized" | "no_senior" | "invalid"
+    accepted: int = 0            # 저장된 센서 로그 수
+    detail: Optional[str] = None
+
+class SensorLogBatchResponse(BaseModel):
+    results: List[SensorLogGroupResult]
+
 class SeniorIdRequest(BaseModel):
     api_key: str
 
@@ -49,6 +49,8 @@ class NotifyEvents(str, Enum):
     # --- 센서 로그 이벤트 (Sensor Log Events) ---
     # 서버 -> FE: 센서 상태 조회 요청
     SERVER_NOTIFY_SENSOR_STATUS_CHANGE = "server:notify_sensor_status_change"
+    # 서버 -> FE: 어르신 한 명의 변경된 센서 상태 전체를 한 번에 전송 (FrontendSensorStatusPayload)
+    SERVER_NOTIFY_SENSOR_STATUS_BATCH = "server:notify_sensor_status_batch"
     
     # FE -> 서버: 특정 시점의 센서 로그 조회 요청
     CLIENT_REQUEST_ALL_SENSOR_STATUS = "client:request_all_sensor_status"
@@ -56,6 +58,8 @@ class NotifyEvents(str, Enum):
     # --- 상태 전송 이벤트 (Status Transmission Events) ---
     # 서버 -> FE: 어르신 상태 변경 실시간 알림
     SERVER_NOTIFY_SENIOR_STATUS_CHANGE = "server:notify_senior_status_change"
+    # 서버 -> FE: 직원이 담당하는 여러 어르신의 상태 변경을 한 번에 전송 (SeniorStatus 목록)
+    SERVER_NOTIFY_SENIOR_STATUS_BATCH = "server:notify_senior_status_batch"
 
     # FE -> 서버: 페이지 첫 진입 시 전체 상태 데이터 요청
     CLIENT_REQUEST_ALL_SENIOR_STATUS = "client:request_all_senior_status"
\ No newline at end of file
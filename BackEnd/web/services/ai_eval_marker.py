@@ -0,0 +1,66 @@
+import os
+import time
+
+from common.modules.db_manager import RedisSessionManager
+from web.services.database import red
+
+# poll: 모든 어르신을 AI_TICK_INTERVAL마다 평가 (AiTickScheduler)
+# event: 센서 상태가 바뀐 어르신만 평가하고, 조용한 어르신은 AI_EVAL_MAX_STALENESS마다 평가 (AiEvalScheduler)
+AI_TICK_MODE = os.getenv("AI_TICK_MODE", "poll").lower()
+# event 모드에서 같은 어르신을 다시 평가하기까지의 최소 간격 (초)
+AI_EVAL_MIN_INTERVAL = float(os.getenv("AI_EVAL_MIN_INTERVAL", "5"))
+
+# 평가 예약 ZSET(senior_id -> 평가 예정 시각)과 마지막 평가 시각 HASH
+AI_EVAL_DUE_KEY = "ai:eval:due"
+AI_EVAL_LAST_KEY = "ai:eval:last"
+
+# 상태 변경 시 평가 예약: 마지막 평가 + 최소 간격 이후로 예약하며, 이미 더 이른 예약이 있으면 유지합니다. (ZADD LT, Redis 6.2+)
+# KEYS: 예약 ZSET, 마지막 평가 HASH / ARGV: senior_id, 현재 시각, 최소 간격
+_MARK_SCRIPT = """
+local due = tonumber(ARGV[2])
+local last = tonumber(redis.call('HGET', KEYS[2], ARGV[1]))
+if last then
+    due = math.max(due, last + tonumber(ARGV[3]))
+end
+redis.call('ZADD', KEYS[1], 'LT', due, ARGV[1])
+return tostring(due)
+"""
+
+
+class AiEvalMarker:
+    """
+    센서 상태가 바뀐 어르신의 AI 평가를 예약하는 클래스 (AI_TICK_MODE=event)
+
+    수신 파이프라인은 이 클래스만 사용하고, 예약을 가져가 평가하는 쪽은 ai_tick.AiEvalScheduler입니다.
+    (수신 경로가 tick 전송기/내장 엔진 모듈을 import 하지 않도록 분리했습니다.)
+    """
+
+    def __init__(
+        self,
+        redis_session_manager: RedisSessionManager,
+        min_interval: float = AI_EVAL_MIN_INTERVAL,
+        due_key: str = AI_EVAL_DUE_KEY,
+        last_key: str = AI_EVAL_LAST_KEY,
+    ):
+        self.red_sess = redis_session_manager
+        self.min_interval = min_interval
+        self.due_key = due_key
+        self.last_key = last_key
+        self._mark_script = None
+
+        self.marked = 0
+
+    async def mark_changed(self, senior_id: int) -> None:
+        """어르신의 센서 상태가 바뀌었으니 평가를 예약합니다. (최소 간격 적용, 중복 예약 없음)"""
+        redis_client = await self.red_sess.get_client()
+        if self._mark_script is None:
+            self._mark_script = redis_client.register_script(_MARK_SCRIPT)
+        await self._mark_script(
+            keys=[self.due_key, self.last_key],
+            args=[senior_id, time.time(), self.min_interval],
+        )
+        self.marked += 1
+
+
+# 수신 파이프라인과 AiEvalScheduler가 공유하는 평가 예약기
+ai_eval_marker = AiEvalMarker(red)
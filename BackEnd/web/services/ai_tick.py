@@ -0,0 +1,637 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import msgspec
+
+from common.models.enums import SensorTypeEnum
+from web.schemas.ai_schmas import AiTickBatchResponse, AiTickResult
+from web.schemas.monitoring_schema import FrontendSensorStatusPayload
+from common.modules.db_manager import RedisSessionManager
+from common.modules.log_manager import get_logger, sampled
+from common.modules.ai_weight_manager import AiWeightManager
+from common.modules.senior_roster import senior_roster
+from web.services.database import db, red
+from web.services.senior_status_manager import SeniorStatusManager, SensorStatusManager
+from web.services.sensor_state_matrix import SENSOR_STATE_MATRIX, SensorStateMatrix, sensor_state_matrix
+from web.services.ai_eval_marker import AI_EVAL_MIN_INTERVAL, AI_TICK_MODE, AiEvalMarker, ai_eval_marker
+from web.services.risk_engine import RISK_ENGINE, RISK_ENGINE_BATCH_SIZE, EmbeddedRiskEngine
+from web.services.tick_sharding import TickMembership
+
+logger = get_logger(__name__)
+
+AI_TICK_INTERVAL = float(os.getenv("AI_TICK_INTERVAL", "10"))
+# 동시에 AI 서버로 보내는 최대 요청 수
+AI_TICK_CONCURRENCY = int(os.getenv("AI_TICK_CONCURRENCY", "50"))
+# 요청 한 건의 제한 시간 (초)
+AI_TICK_REQUEST_TIMEOUT = float(os.getenv("AI_TICK_REQUEST_TIMEOUT", "2"))
+# 한 주기 전체의 제한 시간 (초). 다음 주기와 겹치지 않도록 주기보다 짧게 둡니다.
+AI_TICK_CYCLE_DEADLINE = float(os.getenv("AI_TICK_CYCLE_DEADLINE", str(AI_TICK_INTERVAL * 0.9)))
+# 한 주기를 나누는 구간 수. 어르신은 senior_id 해시로 구간에 고르게 배정되어 주기 안에 분산 전송됩니다.
+AI_TICK_SLOTS = int(os.getenv("AI_TICK_SLOTS", "10"))
+# 구간 시작이 이 시간(초) 이상 늦으면 late로 집계합니다.
+AI_TICK_LATE_TOLERANCE = float(os.getenv("AI_TICK_LATE_TOLERANCE", "0.1"))
+# event 모드에서 변화가 없어도 평가하는 최대 간격 (초, heartbeat)
+AI_EVAL_MAX_STALENESS = float(os.getenv("AI_EVAL_MAX_STALENESS", "300"))
+# event 모드에서 평가 대상을 확인하는 간격 (초)
+AI_EVAL_POLL_INTERVAL = float(os.getenv("AI_EVAL_POLL_INTERVAL", "1"))
+# event 모드에서 한 번에 가져가는 최대 평가 대상 수
+AI_EVAL_CLAIM_LIMIT = int(os.getenv("AI_EVAL_CLAIM_LIMIT", "1000"))
+# poll 모드에서 여러 워커가 어르신을 일관 해시로 나눠 tick 합니다. (false면 워커마다 모든 어르신을 tick)
+AI_TICK_SHARDING = os.getenv("AI_TICK_SHARDING", "true").lower() == "true"
+AI_TICK_HTTP2 = os.getenv("AI_TICK_HTTP2", "true").lower() == "true"
+# 0이면 어르신마다 /ai/tick 을 보내고, 0보다 크면 이 크기로 나눈 묶음을 /ai/tick/batch 로 보냅니다.
+AI_TICK_BATCH_SIZE = int(os.getenv("AI_TICK_BATCH_SIZE", "0"))
+
+# AI 서버의 센서 키 순서 (batch 형식의 비트 순서와 같습니다)
+AI_TICK_SENSOR_NAMES = [
+    'tv' if member is SensorTypeEnum.POWER_TV else member.value for member in SensorTypeEnum
+]
+_sensor_bit = {
+    member.value: 1 << index for index, member in enumerate(SensorTypeEnum)
+}
+
+
+def transform_payload_to_flat_format(payload: FrontendSensorStatusPayload) -> Dict[str, Any]:
+    """
+    FrontendSensorStatusPayload를 AI 서버 명세서에 맞는 형식으로 변환합니다.
+    """
+    # 'data' 필드는 센서 ID와 값(0 또는 1)만 포함합니다.
+    sensor_data_dict = {
+        member.value: 0 for member in SensorTypeEnum
+    }
+    if 'power_tv' in sensor_data_dict:
+        sensor_data_dict['tv'] = sensor_data_dict.pop('power_tv')
+    for sensor in payload.sensors:
+        key = 'tv' if sensor.sensor_id == 'power_tv' else sensor.sensor_id
+        if key in sensor_data_dict:
+            sensor_data_dict[key] = int(sensor.value)
+
+    # 가장 최근의 timestamp를 찾습니다.
+    latest_timestamp = datetime.now(timezone.utc)
+
+    # ❗ 명세서에 맞게 timestamp를 최상위 레벨로 배치합니다.
+    result = {
+        "senior_id": payload.senior_id,
+        "timestamp": latest_timestamp.isoformat().replace("+00:00", "Z"),
+        "data": sensor_data_dict
+    }
+
+    return result
+
+
+def flat_format_from_values(senior_id: int, values: List[int]) -> Dict[str, Any]:
+    """센서 상태 행렬의 한 행(SensorTypeEnum 순서의 0/1 값)을 /ai/tick 형식으로 변환합니다."""
+    return {
+        "senior_id": senior_id,
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "data": dict(zip(AI_TICK_SENSOR_NAMES, values)),
+    }
+
+
+def sensor_bitmask(payload: FrontendSensorStatusPayload) -> int:
+    """어르신 한 명의 센서 상태를 AI_TICK_SENSOR_NAMES 순서의 비트마스크로 변환합니다."""
+    bitmask = 0
+    for sensor in payload.sensors:
+        if sensor.value:
+            bitmask |= _sensor_bit.get(sensor.sensor_id, 0)
+    return bitmask
+
+
+def build_tick_batch(snapshots: List[FrontendSensorStatusPayload]) -> Dict[str, Any]:
+    """여러 어르신의 센서 상태를 /ai/tick/batch 요청(AiTickBatchRequest) 형식으로 변환합니다."""
+    return build_tick_batch_from_bitmasks(
+        [snapshot.senior_id for snapshot in snapshots],
+        [sensor_bitmask(snapshot) for snapshot in snapshots],
+    )
+
+
+def build_tick_batch_from_bitmasks(senior_ids: List[int], bitmasks: List[int]) -> Dict[str, Any]:
+    """어르신 ID와 비트마스크 목록을 /ai/tick/batch 요청(AiTickBatchRequest) 형식으로 묶습니다."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "sensors": AI_TICK_SENSOR_NAMES,
+        "senior_ids": senior_ids,
+        "bitmasks": bitmasks,
+    }
+
+
+async def apply_tick_result(result: AiTickResult) -> None:
+    """batch 응답의 추론 결과를 어르신 상태에 반영합니다. (PUT /ai/seniors/{id}/risk-level 과 같은 처리)"""
+    await SeniorStatusManager(red).update_status(result.senior_id, result.risk_level, result.reason or "")
+
+
+class AiTickDispatcher:
+    """
+    어르신별 센서 상태를 AI 서버의 /ai/tick 으로 보내는 주기 작업의 전송기
+
+    - keep-alive 연결을 재사용하는 httpx.AsyncClient 하나를 앱 수명 동안 유지합니다.
+      (HTTP/2는 TLS(ALPN)로 연결할 때 사용되며, http:// 주소는 HTTP/1.1 keep-alive로 동작합니다.)
+    - 세마포어로 동시 요청 수를 제한하고, 요청별/주기별 제한 시간을 둡니다.
+    - 주기 제한 시간 안에 보내지 못한 어르신은 missed로 집계합니다.
+    - batch_size > 0 이면 어르신 묶음을 열 기반 형식 하나로 /ai/tick/batch 에 보내고,
+      응답에 담긴 어르신별 결과를 on_result로 바로 반영합니다.
+    - risk_engine이 있으면 AI 서버 대신 내장 엔진으로 묶음 단위 추론하고 결과를 on_result로 반영합니다.
+    - state_matrix가 있으면 센서 상태를 Redis 대신 프로세스 내부 행렬에서 읽습니다.
+      행렬에 없는 어르신만 Redis에서 한 번 읽어 행렬에 채웁니다.
+    """
+
+    def __init__(
+        self,
+        ai_host: Optional[str],
+        sensor_status_manager: SensorStatusManager,
+        concurrency: int = AI_TICK_CONCURRENCY,
+        request_timeout: float = AI_TICK_REQUEST_TIMEOUT,
+        cycle_deadline: float = AI_TICK_CYCLE_DEADLINE,
+        http2: bool = AI_TICK_HTTP2,
+        batch_size: int = AI_TICK_BATCH_SIZE,
+        on_result: Optional[Callable[[AiTickResult], Awaitable[None]]] = None,
+        state_matrix: Optional[SensorStateMatrix] = None,
+        risk_engine: Optional[EmbeddedRiskEngine] = None,
+    ):
+        self.ai_host = ai_host
+        self.sens_man = sensor_status_manager
+        self.concurrency = concurrency
+        self.request_timeout = request_timeout
+        self.cycle_deadline = cycle_deadline
+        self.http2 = http2
+        self.batch_size = batch_size
+        self.on_result = on_result
+        self.state_matrix = state_matrix
+        self.risk_engine = risk_engine
+        self._client: Optional[httpx.AsyncClient] = None
+
+        self.cycles = 0
+        self.sent = 0
+        self.failed = 0
+        self.skipped = 0
+        self.missed = 0
+        self.last_cycle_seconds = 0.0
+        self.max_cycle_seconds = 0.0
+        self.last_cycle_missed = 0
+
+    async def start(self) -> None:
+        """AI 서버 연결 풀을 생성합니다."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.ai_host or "",
+                http2=self.http2,
+                timeout=self.request_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                ),
+            )
+
+    async def close(self) -> None:
+        """AI 서버 연결 풀(내장 엔진이면 추론 프로세스 풀)을 닫습니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self.risk_engine is not None:
+            self.risk_engine.close()
+
+    async def _fill_state_matrix(self, senior_ids: List[int]) -> None:
+        """행렬에 아직 없는 어르신의 센서 상태를 Redis에서 읽어 채웁니다."""
+        missing = [senior_id for senior_id in senior_ids if senior_id not in self.state_matrix]
+        if not missing:
+            return
+        statuses = await self.sens_man.get_many_sensor_statuses(missing)
+        for sen_stat in statuses.values():
+            if sen_stat:
+                self.state_matrix.apply(sen_stat, complete=True)
+
+    async def _build_one(self, senior_id: int) -> Optional[Dict[str, Any]]:
+        if self.state_matrix is not None:
+            await self._fill_state_matrix([senior_id])
+            values = self.state_matrix.sensor_values(senior_id)
+            return flat_format_from_values(senior_id, values) if values is not None else None
+
+        sen_stat = await self.sens_man.get_all_sensor_statuses(senior_id)
+        return transform_payload_to_flat_format(sen_stat) if sen_stat else None
+
+    async def _build_batch(self, senior_ids: List[int]) -> Optional[Dict[str, Any]]:
+        if self.state_matrix is not None:
+            await self._fill_state_matrix(senior_ids)
+            found, rows = self.state_matrix.rows(senior_ids)
+            self.skipped += len(senior_ids) - len(found)
+            if not found:
+                return None
+            return build_tick_batch_from_bitmasks(found, self.state_matrix.bitmasks(rows).tolist())
+
+        statuses = await self.sens_man.get_many_sensor_statuses(senior_ids)
+        snapshots = [sen_stat for sen_stat in statuses.values() if sen_stat]
+        self.skipped += len(senior_ids) - len(snapshots)
+        if not snapshots:
+            return None
+        return build_tick_batch(snapshots)
+
+    async def _send_one(self, senior_id: int, semaphore: asyncio.Semaphore, deadline: float) -> None:
+        async with semaphore:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.missed += 1
+                self.last_cycle_missed += 1
+                return
+
+            body = await self._build_one(senior_id)
+            if body is None:
+                self.skipped += 1
+                return
+
+            try:
+                response = await self._client.post(
+                    "/ai/tick",
+                    json=body,
+                    timeout=min(self.request_timeout, remaining),
+                )
+                response.raise_for_status()
+                self.sent += 1
+            except httpx.TimeoutException:
+                self.missed += 1
+                self.last_cycle_missed += 1
+            except httpx.HTTPError as e:
+                self.failed += 1
+                logger.warning("AI tick failed for senior_id %s: %s", senior_id, e, extra=sampled())
+
+    async def _send_batch(self, senior_ids: List[int], semaphore: asyncio.Semaphore, deadline: float) -> None:
+        async with semaphore:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.missed += len(senior_ids)
+                self.last_cycle_missed += len(senior_ids)
+                return
+
+            body = await self._build_batch(senior_ids)
+            if body is None:
+                return
+            sent = len(body["senior_ids"])
+
+            try:
+                if self.risk_engine is not None:
+                    results = await asyncio.wait_for(
+                        self.risk_engine.evaluate(body["senior_ids"], body["bitmasks"]),
+                        timeout=deadline - time.monotonic(),
+                    )
+                else:
+                    response = await self._client.post(
+                        "/ai/tick/batch",
+                        content=msgspec.json.encode(body),
+                        headers={"content-type": "application/json"},
+                        timeout=min(self.request_timeout, deadline - time.monotonic()),
+                    )
+                    response.raise_for_status()
+                    results = AiTickBatchResponse.model_validate_json(response.content).results
+                self.sent += sent
+            except (httpx.TimeoutException, asyncio.TimeoutError):
+                self.missed += sent
+                self.last_cycle_missed += sent
+                return
+            except Exception as e:
+                # HTTP 오류, 응답 형식 오류, 내장 엔진 추론 오류
+                self.failed += sent
+                logger.warning("AI tick batch failed for %d seniors: %s", sent, e)
+                return
+
+        if self.on_result is not None:
+            for result in results:
+                if result.risk_level is not None:
+                    await self.on_result(result)
+
+    async def run_cycle(self, senior_ids: List[int], deadline_seconds: Optional[float] = None) -> None:
+        """
+        어르신 목록에 대해 tick을 보냅니다.
+        제한 시간(deadline_seconds, 기본값 cycle_deadline)이 지나면 남은 요청을 취소하고 missed로 집계합니다.
+        """
+        await self.start()
+        if deadline_seconds is None:
+            deadline_seconds = self.cycle_deadline
+        started = time.monotonic()
+        deadline = started + deadline_seconds
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self.last_cycle_missed = 0
+
+        # 작업 -> 담당 어르신 수 (제한 시간 초과 시 missed 집계용)
+        tasks: Dict[asyncio.Task, int] = {}
+        # 내장 엔진은 묶음 단위로만 추론합니다.
+        batch_size = self.batch_size
+        if self.risk_engine is not None and batch_size <= 0:
+            batch_size = RISK_ENGINE_BATCH_SIZE
+        if batch_size > 0:
+            for i in range(0, len(senior_ids), batch_size):
+                shard = senior_ids[i:i + batch_size]
+                tasks[asyncio.create_task(self._send_batch(shard, semaphore, deadline))] = len(shard)
+        else:
+            for senior_id in senior_ids:
+                tasks[asyncio.create_task(self._send_one(senior_id, semaphore, deadline))] = 1
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=deadline_seconds)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                missed = sum(tasks[task] for task in pending)
+                self.missed += missed
+                self.last_cycle_missed += missed
+
+        self.cycles += 1
+        self.last_cycle_seconds = time.monotonic() - started
+        self.max_cycle_seconds = max(self.max_cycle_seconds, self.last_cycle_seconds)
+        logger.debug(
+            "AI tick cycle: %d seniors in %.2fs (missed: %d)",
+            len(senior_ids),
+            self.last_cycle_seconds,
+            self.last_cycle_missed,
+        )
+
+    def stats(self) -> dict:
+        return {
+            "cycles": self.cycles,
+            "sent": self.sent,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "missed": self.missed,
+            "last_cycle_missed": self.last_cycle_missed,
+            "last_cycle_seconds": self.last_cycle_seconds,
+            "max_cycle_seconds": self.max_cycle_seconds,
+        }
+
+
+class AiTickScheduler:
+    """
+    어르신별 tick을 고정 주기로, 주기 안에 고르게 분산해 보내는 스케줄러
+
+    - 주기(interval)를 slots개의 구간으로 나누고, 어르신은 senior_id 해시로 정해진 구간에서만 전송됩니다.
+      따라서 어르신마다 정확히 interval 간격으로 tick이 가고, AI 서버 부하가 주기 전체에 평평하게 퍼집니다.
+    - 구간 시작 시각은 시작 시점 기준 절대 시각으로 계산하므로 작업 시간만큼 주기가 밀리지 않습니다.
+    - 구간 작업은 구간 길이 안에서 끝나도록 제한하고, 앞선 작업이 늦어져 구간 하나를 통째로 놓치면
+      몰아서 보내지 않고 건너뛰어 skipped로 집계합니다. 조금 늦게 시작한 구간은 late로 집계합니다.
+    - 어르신 목록은 한 바퀴(구간 0)마다 다시 불러옵니다.
+    """
+
+    def __init__(
+        self,
+        dispatcher: AiTickDispatcher,
+        load_senior_ids: Callable[[], Awaitable[List[int]]],
+        interval: float = AI_TICK_INTERVAL,
+        slots: int = AI_TICK_SLOTS,
+        late_tolerance: float = AI_TICK_LATE_TOLERANCE,
+    ):
+        self.dispatcher = dispatcher
+        self.load_senior_ids = load_senior_ids
+        self.interval = interval
+        self.slots = max(1, slots)
+        self.late_tolerance = late_tolerance
+        self._buckets: List[List[int]] = [[] for _ in range(self.slots)]
+        self._stopped = False
+
+        self.rounds = 0
+        self.slots_run = 0
+        self.late_slots = 0
+        self.skipped_slots = 0
+        self.skipped_seniors = 0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+
+    @staticmethod
+    def phase_slot(senior_id: int, slots: int) -> int:
+        """senior_id를 곱셈 해시로 섞어 0 ~ slots-1 구간 번호로 변환합니다. (연속된 ID도 고르게 분산)"""
+        return (((senior_id * 2654435761) & 0xFFFFFFFF) * slots) >> 32
+
+    async def _refresh_buckets(self) -> None:
+        try:
+            senior_ids = await self.load_senior_ids()
+        except Exception as e:
+            # 목록을 불러오지 못하면 이전 목록으로 계속 진행합니다.
+            logger.error("Failed to load senior list for AI tick: %s", e)
+            return
+
+        buckets: List[List[int]] = [[] for _ in range(self.slots)]
+        for senior_id in senior_ids:
+            buckets[self.phase_slot(senior_id, self.slots)].append(senior_id)
+        self._buckets = buckets
+        self.rounds += 1
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    async def run(self) -> None:
+        slot_seconds = self.interval / self.slots
+        logger.info("AI tick scheduler started. interval: %ss, slots: %d", self.interval, self.slots)
+        started = time.monotonic()
+        tick = 0
+
+        while not self._stopped:
+            slot = tick % self.slots
+            if slot == 0:
+                await self._refresh_buckets()
+
+            scheduled_at = started + tick * slot_seconds
+            delay = scheduled_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tick += 1
+
+            lag = time.monotonic() - scheduled_at
+            bucket = self._buckets[slot]
+            if lag >= slot_seconds:
+                self.skipped_slots += 1
+                self.skipped_seniors += len(bucket)
+                continue
+
+            self.last_lag_seconds = lag
+            self.max_lag_seconds = max(self.max_lag_seconds, lag)
+            if lag > self.late_tolerance:
+                self.late_slots += 1
+            if not bucket:
+                continue
+
+            try:
+                await self.dispatcher.run_cycle(bucket, deadline_seconds=slot_seconds - lag)
+                self.slots_run += 1
+            except Exception as e:
+                # ❗ 예외가 나도 스케줄러가 멈추지 않도록 함
+                logger.exception("An error occurred in AI tick slot %d: %s", slot, e)
+
+    def stats(self) -> dict:
+        return {
+            "interval_seconds": self.interval,
+            "slots": self.slots,
+            "rounds": self.rounds,
+            "slots_run": self.slots_run,
+            "late_slots": self.late_slots,
+            "skipped_slots": self.skipped_slots,
+            "skipped_seniors": self.skipped_seniors,
+            "last_lag_seconds": self.last_lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+        }
+
+
+# 예약 시각이 지난 어르신을 가져가고, 다음 예약을 heartbeat 시각으로 미룹니다.
+# 여러 워커가 동시에 실행해도 한 어르신은 한 워커만 가져갑니다.
+# KEYS: 예약 ZSET, 마지막 평가 HASH / ARGV: 현재 시각, 최대 간격, 최대 개수
+_CLAIM_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[3]))
+local next_due = tonumber(ARGV[1]) + tonumber(ARGV[2])
+for _, senior_id in ipairs(ids) do
+    redis.call('ZADD', KEYS[1], next_due, senior_id)
+    redis.call('HSET', KEYS[2], senior_id, ARGV[1])
+end
+return ids
+"""
+
+
+class AiEvalScheduler:
+    """
+    센서 상태가 바뀐 어르신만 AI 평가를 요청하는 이벤트 기반 스케줄러 (AI_TICK_MODE=event)
+
+    - 수신 파이프라인이 상태 변경을 감지하면 AiEvalMarker.mark_changed()로 평가를 예약합니다.
+    - 예약은 Redis ZSET(senior_id -> 평가 예정 시각) 하나로 관리하므로 대기 중인 평가는 어르신당 하나로 합쳐지고,
+      여러 워커가 있어도 한 번만 평가됩니다.
+    - 같은 어르신은 min_interval 안에 다시 평가하지 않으며, 변화가 없어도 max_staleness마다 평가합니다.
+    """
+
+    def __init__(
+        self,
+        dispatcher: AiTickDispatcher,
+        redis_session_manager: RedisSessionManager,
+        load_senior_ids: Callable[[], Awaitable[List[int]]],
+        min_interval: float = AI_EVAL_MIN_INTERVAL,
+        max_staleness: float = AI_EVAL_MAX_STALENESS,
+        poll_interval: float = AI_EVAL_POLL_INTERVAL,
+        claim_limit: int = AI_EVAL_CLAIM_LIMIT,
+        marker: Optional[AiEvalMarker] = None,
+    ):
+        self.dispatcher = dispatcher
+        self.red_sess = redis_session_manager
+        self.load_senior_ids = load_senior_ids
+        self.marker = marker or AiEvalMarker(redis_session_manager, min_interval)
+        self.min_interval = self.marker.min_interval
+        self.max_staleness = max_staleness
+        self.poll_interval = poll_interval
+        self.claim_limit = claim_limit
+        self.due_key = self.marker.due_key
+        self.last_key = self.marker.last_key
+        self._claim_script = None
+        self._stopped = False
+
+        self.claimed = 0
+        self.rounds = 0
+
+    async def mark_changed(self, senior_id: int) -> None:
+        """어르신의 평가를 예약합니다. (AiEvalMarker.mark_changed)"""
+        await self.marker.mark_changed(senior_id)
+
+    async def _sync_roster(self) -> None:
+        """
+        어르신 목록과 예약 ZSET을 맞춥니다.
+        새 어르신은 바로 평가하도록 예약하고, 삭제된 어르신의 예약은 지웁니다.
+        """
+        senior_ids = set(await self.load_senior_ids())
+        redis_client = await self.red_sess.get_client()
+        scheduled = {int(senior_id) for senior_id in await redis_client.zrange(self.due_key, 0, -1)}
+
+        now = time.time()
+        added = senior_ids - scheduled
+        removed = scheduled - senior_ids
+        async with redis_client.pipeline() as pipe:
+            if added:
+                await pipe.zadd(self.due_key, {senior_id: now for senior_id in added}, nx=True)
+            if removed:
+                await pipe.zrem(self.due_key, *removed)
+                await pipe.hdel(self.last_key, *removed)
+            await pipe.execute()
+        self.rounds += 1
+
+    async def claim_due(self) -> List[int]:
+        """평가 예정 시각이 지난 어르신을 가져갑니다."""
+        redis_client = await self.red_sess.get_client()
+        if self._claim_script is None:
+            self._claim_script = redis_client.register_script(_CLAIM_SCRIPT)
+        senior_ids = await self._claim_script(
+            keys=[self.due_key, self.last_key],
+            args=[time.time(), self.max_staleness, self.claim_limit],
+        )
+        return [int(senior_id) for senior_id in senior_ids]
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    async def run(self) -> None:
+        logger.info(
+            "AI eval scheduler started. min interval: %ss, max staleness: %ss", self.min_interval, self.max_staleness
+        )
+        next_roster_sync = 0.0
+
+        while not self._stopped:
+            try:
+                # 어르신 목록은 heartbeat 주기마다 다시 맞춥니다.
+                if time.monotonic() >= next_roster_sync:
+                    await self._sync_roster()
+                    next_roster_sync = time.monotonic() + self.max_staleness
+
+                senior_ids = await self.claim_due()
+                if senior_ids:
+                    self.claimed += len(senior_ids)
+                    await self.dispatcher.run_cycle(senior_ids)
+            except Exception as e:
+                # ❗ 예외가 나도 스케줄러가 멈추지 않도록 함
+                logger.exception("An error occurred in AI eval scheduler: %s", e)
+
+            await asyncio.sleep(self.poll_interval)
+
+    def stats(self) -> dict:
+        return {
+            "min_interval_seconds": self.min_interval,
+            "max_staleness_seconds": self.max_staleness,
+            "marked": self.marker.marked,
+            "claimed": self.claimed,
+            "roster_syncs": self.rounds,
+        }
+
+
+async def load_all_senior_ids() -> List[int]:
+    """
+    tick 대상 어르신 ID 목록을 어르신 목록 캐시에서 가져옵니다.
+    캐시가 아직 적재되지 않았을 때만 DB를 읽습니다.
+    """
+    await senior_roster.ensure_loaded(db)
+    return senior_roster.senior_ids()
+
+
+async def load_owned_senior_ids() -> List[int]:
+    """tick 대상 어르신 중 이 워커가 담당하는 어르신 ID 목록 (AI_TICK_SHARDING)"""
+    return await tick_membership.filter_owned(await load_all_senior_ids())
+
+
+async def load_active_weight_paths() -> Dict[int, str]:
+    """내장 위험도 엔진이 사용할 어르신별 활성 가중치 경로를 DB에서 조회합니다."""
+    async for session in db.get_session():
+        return await AiWeightManager(session).get_active_weight_paths()
+
+
+ai_tick_dispatcher = AiTickDispatcher(
+    os.getenv("AI_HOST"),
+    SensorStatusManager(red),
+    on_result=apply_tick_result,
+    state_matrix=sensor_state_matrix if SENSOR_STATE_MATRIX else None,
+    risk_engine=(
+        EmbeddedRiskEngine(load_active_weight_paths, len(AI_TICK_SENSOR_NAMES))
+        if RISK_ENGINE == "embedded"
+        else None
+    ),
+)
+tick_membership = TickMembership(red)
+ai_tick_scheduler = AiTickScheduler(
+    ai_tick_dispatcher, load_owned_senior_ids if AI_TICK_SHARDING else load_all_senior_ids
+)
+ai_eval_scheduler = AiEvalScheduler(ai_tick_dispatcher, red, load_all_senior_ids, marker=ai_eval_marker)
+
+
+def get_ai_scheduler():
+    """AI_TICK_MODE에 맞는 AI 평가 스케줄러를 반환합니다."""
+    return ai_eval_scheduler if AI_TICK_MODE == "event" else ai_tick_scheduler
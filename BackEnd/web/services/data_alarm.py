@@ -1,49 +1,113 @@
-from common.modules.session_manager import SessionManager
-from common.modules.user_manager import UserManager
+import os
+from typing import Dict, List, Optional
+
+from common.modules.log_manager import get_logger, sampled
 from web.schemas.monitoring_schema import FrontendSensorItem, FrontendSensorStatusPayload, SeniorStatus
 from web.schemas.socket_event import NotifyEvents
-from web.services.database import db,red
-from web.services.hub_service import SensorDataService
+from web.services.senior_rooms import senior_room, staff_room
 from web.services.websocket import sio
-from web.schemas.iot_schema import SensorLogPayload, SensorDataItem
-from common.modules.api_key_manager import ApiKeyRepository
 
-async def notify_senior_status_change(senior_id: int, status: SeniorStatus):
+logger = get_logger(__name__)
+
+# 센서 상태 알림 방식
+# - batch: 어르신 한 명의 변경 센서를 SERVER_NOTIFY_SENSOR_STATUS_BATCH 이벤트 하나로 전송 (FE 전환 후 사용)
+# - item: 센서마다 SERVER_NOTIFY_SENSOR_STATUS_CHANGE 이벤트를 전송 (기본값, 현재 FE가 처리하는 이벤트)
+# - both: 두 이벤트를 모두 전송 (FE 전환 기간용)
+SENSOR_NOTIFY_MODE = os.getenv("SENSOR_NOTIFY_MODE", "item").lower()
+
+# 어르신 상태 일괄 알림 방식 (PUT /ai/seniors/risk-levels)
+# - batch: 직원마다 담당 어르신들의 상태를 SERVER_NOTIFY_SENIOR_STATUS_BATCH 이벤트 하나로 전송 (FE 전환 후 사용)
+# - item: 어르신마다 SERVER_NOTIFY_SENIOR_STATUS_CHANGE 이벤트를 전송 (기본값, 현재 FE가 처리하는 이벤트)
+# - both: 두 이벤트를 모두 전송 (FE 전환 기간용)
+SENIOR_NOTIFY_MODE = os.getenv("SENIOR_NOTIFY_MODE", "item").lower()
+
+
+def senior_notify_needs_staff() -> bool:
+    """notify_senior_status_batch에 담당 직원 목록(seniors_by_staff)이 필요한지 여부 (batch/both 방식)"""
+    return SENIOR_NOTIFY_MODE in ("batch", "both")
+
+
+async def notify_senior_status_change(
+    senior_id: int, status: SeniorStatus, recv_sid: Optional[str] = None
+):
     """
     어르신 상태 변경을 클라이언트에게 알립니다.
+    기본적으로 어르신 room(senior:{id})의 모든 담당 직원에게 보내며, recv_sid를 넘기면 해당 소켓에만 보냅니다.
     """
-    
-    async for session in db.get_session():
-        staff_id = (await UserManager(session).get_senior_staff(senior_id)).staff_id
-        recv_sid = (await SessionManager(red).get_session_by_staff_id(staff_id)).sid   
+    to = recv_sid or senior_room(senior_id)
     
     # Pydantic 모델을 dict로 변환하여 전송
     status_dict = status.model_dump(mode='json')
     
-    await sio.emit(NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, status_dict, to=recv_sid)
-    print(f"이벤트: {NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE}, 데이터: {status_dict}, to: {recv_sid}")
+    await sio.emit(NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, status_dict, to=to)
+    logger.debug("이벤트: %s, 어르신 ID: %s, to: %s", NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_CHANGE, status.senior_id, to, extra=sampled())
 
 
-async def notify_sensor_status_item_change(senior_id: int, status: FrontendSensorItem):
+async def notify_senior_status_batch(
+    statuses: List[SeniorStatus], seniors_by_staff: Dict[int, List[int]]
+):
+    """
+    여러 어르신의 상태 변경을 알립니다.
+    batch 방식은 직원 room(staff:{id})마다 그 직원이 담당하는 어르신들의 상태를 이벤트 하나로 보냅니다.
+
+    Args:
+        statuses: 변경된 어르신 상태 목록
+        seniors_by_staff: staff_id -> 담당 어르신 ID 목록 (UserManager.get_staff_ids_by_senior_ids).
+            item 방식에서는 사용하지 않으므로 senior_notify_needs_staff()가 False이면 빈 dict를 넘겨도 됩니다.
+    """
+    if not statuses:
+        return
+
+    if senior_notify_needs_staff():
+        status_by_senior = {status.senior_id: status.model_dump(mode='json') for status in statuses}
+        for staff_id, senior_ids in seniors_by_staff.items():
+            packet = [status_by_senior[senior_id] for senior_id in senior_ids if senior_id in status_by_senior]
+            if packet:
+                await sio.emit(NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH, packet, to=staff_room(staff_id))
+        logger.debug("이벤트: %s, 어르신 수: %d, 직원 수: %d", NotifyEvents.SERVER_NOTIFY_SENIOR_STATUS_BATCH, len(statuses), len(seniors_by_staff))
+
+    if SENIOR_NOTIFY_MODE in ("item", "both"):
+        for status in statuses:
+            await notify_senior_status_change(status.senior_id, status)
+
+
+async def notify_sensor_status_item_change(
+    senior_id: int, status: FrontendSensorItem, recv_sid: Optional[str] = None
+):
     """
     어르신 상태 변경을 클라이언트에게 알립니다.
+    기본적으로 어르신 room으로 보내며, recv_sid를 넘기면 해당 소켓에만 보냅니다.
     """
-    
-    async for session in db.get_session():
-        staff_id = (await UserManager(session).get_senior_staff(senior_id)).staff_id
-        recv_sid = (await SessionManager(red).get_session_by_staff_id(staff_id)).sid   
+    to = recv_sid or senior_room(senior_id)
     
     # Pydantic 모델을 dict로 변환하여 전송
     status.senior_id = senior_id
     status_dict = status.model_dump(mode='json')
     
-    await sio.emit(NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_CHANGE, status_dict, to=recv_sid)
-    print(f"이벤트: {NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_CHANGE}, 데이터: {status_dict}, to: {recv_sid}")
+    await sio.emit(NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_CHANGE, status_dict, to=to)
+    logger.debug("이벤트: %s, 센서: %s, to: %s", NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_CHANGE, status.sensor_id, to, extra=sampled())
 
-async def notify_sensor_status_log_change(log :FrontendSensorStatusPayload):
+async def notify_sensor_status_log_change(
+    log :FrontendSensorStatusPayload, recv_sid: Optional[str] = None
+):
     """
     어르신 상태 변경 내역들을 클라이언트에게 알립니다.
+    기본적으로 어르신 room으로 보내며, recv_sid를 넘기면 해당 소켓에만 보냅니다.
+    SENSOR_NOTIFY_MODE에 따라 변경 센서 전체를 이벤트 하나로 보내거나 센서마다 개별 이벤트로 보냅니다.
     """
+    if not log.sensors:
+        return
+
+    to = recv_sid or senior_room(log.senior_id)
+
+    if SENSOR_NOTIFY_MODE in ("batch", "both"):
+        for item in log.sensors:
+            item.senior_id = log.senior_id
+        log_dict = log.model_dump(mode='json')
+
+        await sio.emit(NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_BATCH, log_dict, to=to)
+        logger.debug("이벤트: %s, 센서 수: %d, to: %s", NotifyEvents.SERVER_NOTIFY_SENSOR_STATUS_BATCH, len(log.sensors), to, extra=sampled())
 
-    for item in log.sensors:
-        await notify_sensor_status_item_change(log.senior_id, item)
\ No newline at end of file
+    if SENSOR_NOTIFY_MODE in ("item", "both"):
+        for item in log.sensors:
+            await notify_sensor_status_item_change(log.senior_id, item, to)
@@ -1,6 +1,7 @@
 import os
 
 import common.modules.db_manager as db_manager
+from common.modules.hub_cache import hub_cache
 
 db = db_manager.PostgressqlSessionManager(
     db_user=os.getenv("DB_ROOT_USER"),
@@ -14,4 +15,8 @@ red = db_manager.RedisSessionManager(
     host=os.getenv("REDIS_HOST"),
     port=os.getenv("REDIS_PORT"),
     password=os.getenv("REDIS_PASSWORD"),
-)
\ No newline at end of file
+)
+
+# HUB_CACHE_BACKEND=redis 이면 API 키 조회 캐시를 워커 간에 Redis로 공유합니다.
+if os.getenv("HUB_CACHE_BACKEND", "memory") == "redis":
+    hub_cache.use_redis(red)
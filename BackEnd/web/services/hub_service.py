@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from common.modules.api_key_manager import ApiKeyRepository
 from common.modules.user_manager import UserManager
 from web.services.database import db
-from web.schemas.iot_schema import SensorLogPayload  # 입력 스키마
+from web.schemas.iot_schema import SensorDataItem, SensorLogPayload  # 입력 스키마
 from web.schemas.monitoring_schema import (
     FrontendSensorItem,
     FrontendSensorStatusPayload,
@@ -35,10 +35,17 @@ class SensorDataService:
         if not hub or not hub.senior_id:
             raise ValueError("Invalid API Key or Senior not linked")
 
-        senior_id = hub.senior_id
+        return self.build_frontend_payload(hub.senior_id, payload.sensor_data)
 
+    @staticmethod
+    def build_frontend_payload(
+        senior_id: int, sensor_data: List[SensorDataItem]
+    ) -> FrontendSensorStatusPayload:
+        """
+        이미 확인된 senior_id와 센서 데이터로 프론트엔드용 페이로드를 만듭니다. (DB 조회 없음)
+        """
         frontend_sensors: List[FrontendSensorItem] = []
-        for item in payload.sensor_data:
+        for item in sensor_data:
 
             # 2. SensorTypeEnum 값(예: "door_bedroom")을 파싱합니다.
             sensor_enum_value = item.sensor_type.value  # Enum 값을 문자열로 변환
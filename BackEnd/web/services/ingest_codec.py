@@ -0,0 +1,81 @@
+import enum
+from datetime import datetime
+from typing import List, Optional
+
+import msgspec
+
+from common.models.enums import SENSOR_TYPE_CODES, SensorTypeEnum
+from web.schemas.iot_schema import SensorLogPayload
+
+MSGPACK_CONTENT_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+
+# 바이너리 형식에서 사용하는 센서 정수 코드 (SENSOR_TYPE_CODES의 인덱스)
+# 정의되지 않은 코드는 msgspec 디코더가 거부합니다.
+SensorTypeCode = enum.IntEnum(
+    "SensorTypeCode", {sensor_type.name: code for code, sensor_type in enumerate(SENSOR_TYPE_CODES)}
+)
+
+
+class BinarySensorItem(msgspec.Struct, array_like=True):
+    """
+    바이너리 형식의 센서 데이터 한 건. 배열로 인코딩됩니다.
+    [sensor_code, sensor_value, timestamp] 또는 [sensor_code, sensor_value, timestamp, event_description]
+
+    timestamp는 msgpack 표준 timestamp 확장 타입(epoch 기준 초+나노초, 6~10바이트)을 사용하므로
+    디코더가 항목별 변환 없이 바로 UTC datetime으로 만듭니다.
+    SensorDataItem과 같은 속성(sensor_type, sensor_value, event_description, timestamp)을 제공하므로
+    파이프라인에서 그대로 사용할 수 있습니다.
+    """
+
+    code: SensorTypeCode
+    sensor_value: bool
+    timestamp: datetime
+    event_description: Optional[str] = None
+
+    @property
+    def sensor_type(self) -> SensorTypeEnum:
+        return SENSOR_TYPE_CODES[self.code]
+
+
+class BinarySensorLogPayload(msgspec.Struct):
+    """바이너리 형식의 센서 로그 페이로드 ({"api_key": str, "sensor_data": [BinarySensorItem, ...]})"""
+
+    api_key: str
+    sensor_data: List[BinarySensorItem]
+
+
+_decoder = msgspec.msgpack.Decoder(BinarySensorLogPayload)
+_encoder = msgspec.msgpack.Encoder()
+_sensor_code_by_type = {sensor_type: SensorTypeCode(code) for code, sensor_type in enumerate(SENSOR_TYPE_CODES)}
+
+
+def decode_sensor_log_msgpack(body: bytes) -> BinarySensorLogPayload:
+    """
+    msgpack 본문을 디코딩합니다. 구조/타입 검증은 msgspec 디코더가 수행하며,
+    Pydantic 모델을 만들지 않고 SensorLogPayload와 같은 속성을 가진 구조체를 반환합니다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 알 수 없는 센서 코드가 있을 때 발생합니다.
+    """
+    try:
+        return _decoder.decode(body)
+    except msgspec.DecodeError as e:
+        raise ValueError(f"decode_sensor_log_msgpack - invalid body: {e}") from e
+
+
+def encode_sensor_log_msgpack(payload: SensorLogPayload) -> bytes:
+    """SensorLogPayload를 허브용 msgpack 형식으로 인코딩합니다. (허브 시뮬레이터/테스트용)"""
+    return _encoder.encode(
+        BinarySensorLogPayload(
+            api_key=payload.api_key,
+            sensor_data=[
+                BinarySensorItem(
+                    code=_sensor_code_by_type[item.sensor_type],
+                    sensor_value=item.sensor_value,
+                    timestamp=item.timestamp,
+                    event_description=item.event_description,
+                )
+                for item in payload.sensor_data
+            ],
+        )
+    )
@@ -0,0 +1,192 @@
+from dataclasses import dataclass
+from typing import AsyncIterable, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.modules.api_key_manager import ApiKeyRepository
+from common.modules.db_manager import RedisSessionManager
+from common.modules.sensor_log_manager import SensorLogManager
+from common.schemas.hub_schema import HubBasicInfo
+from web.schemas.iot_schema import SensorDataItem, SensorLogGroupResult, SensorLogPayload
+from web.schemas.monitoring_schema import FrontendSensorStatusPayload
+from web.services.ai_eval_marker import AI_TICK_MODE, ai_eval_marker
+from web.services.data_alarm import notify_sensor_status_log_change
+from web.services.hub_service import SensorDataService
+from web.services.senior_status_manager import SensorStatusManager
+from web.services.sensor_state_matrix import SENSOR_STATE_MATRIX, sensor_state_matrix
+from web.services.write_behind import get_write_queue
+
+
+class SeniorNotAssignedError(Exception):
+    """API 키의 허브에 연결된 어르신이 없을 때 발생하는 예외"""
+
+
+@dataclass
+class IngestContext:
+    """센서 로그 수신 요청 한 건에서 공유하는 조회 결과 (허브 -> 어르신)"""
+
+    hub: HubBasicInfo
+    senior_id: int
+    # cache() 단계에서 채워지는 값이 바뀐 센서 목록 (이후 단계에서 재사용)
+    changed: Optional[FrontendSensorStatusPayload] = None
+
+
+class SensorIngestPipeline:
+    """
+    허브가 보낸 센서 로그를 저장 -> (호출자의 커밋) -> 캐싱 -> 알림 순서로 처리하는 파이프라인
+    run/run_batch는 저장까지만 하고, 커밋 후 publish()에서 캐싱/알림/평가 예약을 수행합니다.
+    캐싱 단계에서 값이 바뀐 센서만 골라내고, 알림은 바뀐 센서만 보냅니다.
+    AI_TICK_MODE=event 이면 센서가 바뀐 어르신의 AI 평가를 예약합니다.
+
+    허브/어르신은 resolve()에서 요청당 한 번만 조회하고,
+    이후 단계는 IngestContext를 넘겨받아 추가 조회 없이 동작합니다.
+    알림은 어르신 room(senior:{id})으로 보내므로 담당 직원/소켓을 조회하지 않습니다.
+    """
+
+    def __init__(self, session: AsyncSession, redis_session_manager: RedisSessionManager):
+        self.session = session
+        self.red_sess = redis_session_manager
+        self.apikey_repo = ApiKeyRepository(session)
+        self.log_man = SensorLogManager(session, write_queue=get_write_queue())
+        self.sensor_status_man = SensorStatusManager(redis_session_manager)
+
+    async def resolve(self, api_key: str) -> Optional[IngestContext]:
+        """
+        API 키로 허브와 어르신을 조회합니다.
+
+        Returns:
+            Optional[IngestContext]: API 키가 유효하지 않으면 None을 반환합니다.
+
+        Raises:
+            SeniorNotAssignedError: 허브에 연결된 어르신이 없을 때 발생합니다.
+        """
+        hub = await self.apikey_repo.get_hub_by_api_key(api_key)
+        if hub is None:
+            return None
+        if hub.senior_id is None:
+            raise SeniorNotAssignedError(f"resolve - No senior assigned to hub_id:{hub.hub_id}")
+
+        return IngestContext(hub=hub, senior_id=hub.senior_id)
+
+    async def persist(self, ctx: IngestContext, sensor_data: List[SensorDataItem]) -> None:
+        """
+        센서 로그를 DB에 저장합니다. 어르신 존재 여부는 허브 FK로 이미 보장됩니다.
+        write-behind 모드에서는 Redis Stream에 적재만 합니다.
+        """
+        await self.log_man.add_logs(ctx.senior_id, sensor_data, senior_verified=True)
+
+    async def cache(self, ctx: IngestContext, packet: FrontendSensorStatusPayload) -> FrontendSensorStatusPayload:
+        """
+        캐시된 센서 상태와 비교해 값이 바뀐 센서만 Redis에 저장합니다.
+        바뀐 센서 목록은 ctx.changed에 보관하고 반환합니다.
+        """
+        ctx.changed = await self.sensor_status_man.apply_sensor_changes(packet)
+        if SENSOR_STATE_MATRIX:
+            await sensor_state_matrix.publish(self.red_sess, ctx.changed)
+        return ctx.changed
+
+    async def notify(self, ctx: IngestContext, packet: FrontendSensorStatusPayload) -> None:
+        """어르신 room의 담당 직원들에게 센서 상태 변경을 알립니다. 바뀐 센서가 없으면 보내지 않습니다."""
+        await notify_sensor_status_log_change(packet)
+
+    async def schedule_evaluation(self, ctx: IngestContext) -> None:
+        """event 모드에서 센서 상태가 바뀌었으면 AI 평가를 예약합니다."""
+        if AI_TICK_MODE != "event" or ctx.changed is None or not ctx.changed.sensors:
+            return
+        await ai_eval_marker.mark_changed(ctx.senior_id)
+
+    async def run(
+        self, payload: SensorLogPayload
+    ) -> Tuple[Optional[IngestContext], List[Tuple[IngestContext, List[SensorDataItem]]]]:
+        """
+        수신한 페이로드 한 건을 저장합니다. 커밋은 호출자가 담당하며,
+        커밋 후 반환된 accepted 목록을 publish()에 넘겨 캐싱/알림을 수행합니다. (run_batch와 같은 순서)
+
+        Returns:
+            (컨텍스트, 저장된 (컨텍스트, 센서 데이터) 목록). API 키가 유효하지 않으면 컨텍스트는 None입니다.
+        """
+        ctx = await self.resolve(payload.api_key)
+        if ctx is None or not payload.sensor_data:
+            return ctx, []
+
+        accepted = [(ctx, payload.sensor_data)]
+        await self.persist(ctx, payload.sensor_data)
+        return ctx, accepted
+
+    async def run_batch(
+        self, groups: AsyncIterable[Union[SensorLogPayload, str]]
+    ) -> Tuple[List[SensorLogGroupResult], List[Tuple[IngestContext, List[SensorDataItem]]]]:
+        """
+        여러 허브의 페이로드를 받는 대로 처리하고 모든 로그를 한 번에 저장합니다.
+        API 키는 서로 다른 키마다 한 번만 조회합니다. 커밋은 호출자가 담당하며,
+        커밋 후 반환된 accepted 목록을 publish()에 넘겨 캐싱/알림을 수행합니다.
+
+        Args:
+            groups: 파싱된 페이로드, 또는 파싱에 실패한 그룹의 오류 메시지(str)
+
+        Returns:
+            (그룹별 처리 결과, 저장된 (컨텍스트, 센서 데이터) 목록)
+        """
+        contexts: Dict[str, Union[IngestContext, str, None]] = {}
+        results: List[SensorLogGroupResult] = []
+        accepted: List[Tuple[IngestContext, List[SensorDataItem]]] = []
+
+        index = 0
+        async for group in groups:
+            if isinstance(group, str):
+                results.append(SensorLogGroupResult(index=index, status="invalid", detail=group))
+                index += 1
+                continue
+
+            if group.api_key not in contexts:
+                try:
+                    contexts[group.api_key] = await self.resolve(group.api_key)
+                except SeniorNotAssignedError as e:
+                    contexts[group.api_key] = str(e)
+            ctx = contexts[group.api_key]
+
+            if ctx is None:
+                results.append(SensorLogGroupResult(index=index, status="unauthorized", detail="Invalid API key"))
+            elif isinstance(ctx, str):
+                results.append(SensorLogGroupResult(index=index, status="no_senior", detail=ctx))
+            else:
+                if group.sensor_data:
+                    accepted.append((ctx, group.sensor_data))
+                results.append(SensorLogGroupResult(index=index, status="ok", accepted=len(group.sensor_data)))
+            index += 1
+
+        await self.persist_many(accepted)
+        return results, accepted
+
+    async def persist_many(self, accepted: List[Tuple[IngestContext, List[SensorDataItem]]]) -> None:
+        """여러 어르신의 로그를 한 번의 INSERT(또는 COPY)로 저장합니다."""
+        if not accepted:
+            return
+        if self.log_man.write_queue is not None:
+            for ctx, sensor_data in accepted:
+                await self.persist(ctx, sensor_data)
+            return
+
+        rows = [
+            row
+            for ctx, sensor_data in accepted
+            for row in SensorLogManager.to_rows(ctx.senior_id, sensor_data)
+        ]
+        await self.log_man.add_log_rows(rows)
+
+    async def publish(self, accepted: List[Tuple[IngestContext, List[SensorDataItem]]]) -> None:
+        """저장된 로그를 어르신별로 묶어 센서 상태 캐싱과 알림을 수행합니다."""
+        merged: Dict[int, Tuple[IngestContext, List[SensorDataItem]]] = {}
+        for ctx, sensor_data in accepted:
+            if ctx.senior_id in merged:
+                merged[ctx.senior_id][1].extend(sensor_data)
+            else:
+                merged[ctx.senior_id] = (ctx, list(sensor_data))
+
+        for ctx, sensor_data in merged.values():
+            # 같은 센서가 여러 번 들어오면 가장 최근 값이 캐시에 남도록 시간순으로 정렬합니다.
+            sensor_data.sort(key=lambda item: item.timestamp)
+            packet = SensorDataService.build_frontend_payload(ctx.senior_id, sensor_data)
+            changed = await self.cache(ctx, packet)
+            await self.notify(ctx, changed)
+            await self.schedule_evaluation(ctx)
@@ -0,0 +1,248 @@
+"""
+AI 서버 대신 백엔드 프로세스 안에서 위험도를 추론하는 내장 엔진 (RISK_ENGINE=embedded)
+
+소규모/중규모 배포에서 AI 서버 없이 tick 추론을 처리하기 위한 선택 기능입니다.
+- 어르신별 활성 가중치(AIWeight.storage_path)를 로컬 파일 시스템(RISK_MODEL_DIR 기준)에서 joblib으로 읽습니다.
+  파일은 scikit-learn 이상치 탐지 모델(IsolationForest, OneClassSVM 등) 하나 또는 {이름: 모델} dict 입니다.
+- 추론은 ProcessPoolExecutor의 워커 프로세스에서 실행하므로 이벤트 루프를 막지 않습니다.
+  모델은 워커 프로세스마다 한 번만 읽고, 파일이 바뀌면(mtime) 다시 읽습니다.
+- 입력은 AI_TICK_SENSOR_NAMES 순서의 0/1 벡터(tick 비트마스크)이고,
+  이상 점수(-decision_function, 모델이 여러 개면 최댓값)를 임계값과 비교해 위험도를 정합니다.
+  입력 크기(n_features_in_)가 센서 수와 다른 모델을 쓰는 어르신은 결과를 내지 않습니다.
+- 결과는 이전에 보고한 위험도와 다를 때만 반환하며, tick 전송기(on_result)가
+  SeniorStatusManager.update_status로 바로 반영합니다.
+
+❗ AI 서버의 하드룰, 위험 래치(/ai/risk-clear), 특징 생성은 포함하지 않습니다.
+AI 서버가 학습한 가중치를 그대로 쓰면 HTTP 경로와 다른(덜 안전한) 위험도가 나오므로,
+tick 비트마스크로 학습한 가중치를 쓴다는 뜻으로 RISK_ENGINE_BITMASK_MODELS=true를 함께 설정해야만 켜집니다.
+그렇지 않거나 scikit-learn/joblib이 없으면 서버 시작 시 실패합니다. (pip install scikit-learn joblib)
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from web.schemas.ai_schmas import AiTickResult, RiskLevelEnum
+from common.modules.log_manager import get_logger, setup_child_logging
+
+logger = get_logger(__name__)
+
+# http: AI 서버(/ai/tick)로 보냄 (기본값), embedded: 백엔드 프로세스 안에서 추론
+RISK_ENGINE = os.getenv("RISK_ENGINE", "http").lower()
+# 추론 워커 프로세스 수
+RISK_ENGINE_WORKERS = int(os.getenv("RISK_ENGINE_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 상대 경로인 storage_path의 기준 디렉토리
+RISK_MODEL_DIR = os.getenv("RISK_MODEL_DIR", "models")
+# 한 번에 워커 프로세스로 넘기는 어르신 수 (AI_TICK_BATCH_SIZE가 0일 때)
+RISK_ENGINE_BATCH_SIZE = int(os.getenv("RISK_ENGINE_BATCH_SIZE", "1000"))
+# 어르신별 활성 가중치 목록을 다시 읽는 간격 (초)
+RISK_WEIGHTS_REFRESH = float(os.getenv("RISK_WEIGHTS_REFRESH", "60"))
+# 이상 점수 임계값 (AI 서버 기본값과 같음)
+RISK_WARN_THRESHOLD = float(os.getenv("RISK_WARN_THRESHOLD", "0.6"))
+RISK_DANGER_THRESHOLD = float(os.getenv("RISK_DANGER_THRESHOLD", "1.0"))
+# 활성 가중치가 tick 비트마스크(0/1 벡터)로 학습한 모델임을 확인했을 때만 true로 설정합니다.
+RISK_ENGINE_BITMASK_MODELS = os.getenv("RISK_ENGINE_BITMASK_MODELS", "false").lower() == "true"
+
+# --- 워커 프로세스에서 실행되는 함수 (pickle 가능하도록 모듈 최상위에 둡니다) ---
+
+# 워커 프로세스별 모델 캐시: 경로 -> (mtime, 모델 목록)
+_model_cache: Dict[str, Tuple[float, list]] = {}
+
+
+def _load_models(path: str) -> list:
+    import joblib
+
+    mtime = os.path.getmtime(path)
+    cached = _model_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    loaded = joblib.load(path)
+    models = list(loaded.values()) if isinstance(loaded, dict) else [loaded]
+    _model_cache[path] = (mtime, models)
+    return models
+
+
+def _check_feature_count(models: list, sensor_count: int) -> None:
+    """모델의 입력 크기가 센서 수와 다르면 ValueError를 발생시킵니다."""
+    for model in models:
+        n_features = getattr(model, "n_features_in_", None)
+        if n_features is not None and n_features != sensor_count:
+            raise ValueError(f"model expects {n_features} features, but tick has {sensor_count} sensors")
+
+
+def assess_score(score: float, warn: float, danger: float) -> RiskLevelEnum:
+    """이상 점수를 위험도로 변환합니다."""
+    if score >= danger:
+        return RiskLevelEnum.DANGER
+    if score >= warn:
+        return RiskLevelEnum.CAUTION
+    return RiskLevelEnum.SAFE
+
+
+def evaluate_batch(
+    items: Sequence[Tuple[int, int, str]], sensor_count: int, warn: float, danger: float
+) -> List[Tuple[int, str, str]]:
+    """
+    (senior_id, 비트마스크, 가중치 경로) 목록을 추론합니다. 같은 모델을 쓰는 어르신은 한 번에 계산합니다.
+
+    Returns:
+        List[Tuple[int, str, str]]: (senior_id, 위험도 값, 이유).
+            모델을 읽지 못했거나, 입력 크기가 맞지 않거나, 추론에 실패한 가중치를 쓰는 어르신은 빠집니다.
+            (다른 가중치의 결과는 유지)
+    """
+    import numpy as np
+
+    by_path: Dict[str, List[Tuple[int, int]]] = {}
+    for senior_id, bitmask, path in items:
+        by_path.setdefault(path, []).append((senior_id, bitmask))
+
+    bits = np.arange(sensor_count, dtype=np.int64)
+    results = []
+    for path, seniors in by_path.items():
+        try:
+            models = _load_models(path)
+            _check_feature_count(models, sensor_count)
+        except (OSError, ValueError) as e:
+            logger.warning("Risk model load failed (%s): %s", path, e)
+            continue
+
+        masks = np.array([bitmask for _, bitmask in seniors], dtype=np.int64)
+        features = ((masks[:, None] >> bits) & 1).astype(np.float64)
+        try:
+            scores = np.max([-model.decision_function(features) for model in models], axis=0)
+        except Exception as e:
+            # 입력 크기가 맞지 않는 모델, decision_function이 없는 객체 등
+            logger.warning("Risk model scoring failed (%s): %s", path, e)
+            continue
+        for (senior_id, _), score in zip(seniors, scores):
+            level = assess_score(float(score), warn, danger)
+            results.append((senior_id, level.value, f"embedded anomaly score: {score:.3f}"))
+    return results
+
+
+# --- 백엔드 프로세스 쪽 ---
+
+
+class EmbeddedRiskEngine:
+    """
+    tick 비트마스크를 프로세스 풀에서 추론하는 내장 위험도 엔진
+    AiTickDispatcher에 risk_engine으로 넘기면 /ai/tick 대신 이 엔진을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        load_weight_paths: Callable[[], Awaitable[Dict[int, str]]],
+        sensor_count: int,
+        workers: int = RISK_ENGINE_WORKERS,
+        model_dir: str = RISK_MODEL_DIR,
+        weights_refresh: float = RISK_WEIGHTS_REFRESH,
+        warn_threshold: float = RISK_WARN_THRESHOLD,
+        danger_threshold: float = RISK_DANGER_THRESHOLD,
+        bitmask_models: bool = RISK_ENGINE_BITMASK_MODELS,
+    ):
+        self.load_weight_paths = load_weight_paths
+        self.sensor_count = sensor_count
+        self.workers = workers
+        self.model_dir = model_dir
+        self.weights_refresh = weights_refresh
+        self.warn_threshold = warn_threshold
+        self.danger_threshold = danger_threshold
+        self.bitmask_models = bitmask_models
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._weight_paths: Dict[int, str] = {}
+        self._weights_loaded_at = 0.0
+        # 어르신별 마지막으로 보고한 위험도 (바뀔 때만 보고)
+        self._last_levels: Dict[int, RiskLevelEnum] = {}
+
+        self.evaluated = 0
+        self.no_weights = 0
+        self.reported = 0
+
+    def start(self) -> None:
+        """
+        추론 워커 프로세스 풀을 생성합니다. (서버 시작 시 호출)
+        비트마스크 학습 가중치임을 확인하지 않았거나 scikit-learn/joblib이 없으면 바로 실패합니다.
+        """
+        if self._pool is None:
+            if not self.bitmask_models:
+                raise RuntimeError(
+                    "RISK_ENGINE=embedded does not apply the AI server's hard rules, risk latch and features; "
+                    "set RISK_ENGINE_BITMASK_MODELS=true only if the active weights were trained on tick bitmasks"
+                )
+            try:
+                import joblib  # noqa: F401
+                import sklearn  # noqa: F401
+            except ImportError as e:
+                raise RuntimeError("RISK_ENGINE=embedded requires scikit-learn and joblib") from e
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=setup_child_logging)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _resolve_path(self, storage_path: str) -> Optional[str]:
+        if "://" in storage_path:
+            return None  # Object Storage 경로는 지원하지 않습니다. (로컬 파일만)
+        return storage_path if os.path.isabs(storage_path) else os.path.join(self.model_dir, storage_path)
+
+    async def _refresh_weights(self) -> None:
+        if self._weights_loaded_at and time.monotonic() - self._weights_loaded_at < self.weights_refresh:
+            return
+        paths = await self.load_weight_paths()
+        self._weight_paths = {
+            senior_id: resolved
+            for senior_id, storage_path in paths.items()
+            if (resolved := self._resolve_path(storage_path)) is not None
+        }
+        self._weights_loaded_at = time.monotonic()
+
+    async def evaluate(self, senior_ids: List[int], bitmasks: List[int]) -> List[AiTickResult]:
+        """
+        어르신들의 센서 비트마스크를 추론해, 위험도가 바뀐 어르신의 결과만 반환합니다.
+        활성 가중치가 없는 어르신은 건너뜁니다.
+        """
+        self.start()
+        await self._refresh_weights()
+
+        items = []
+        for senior_id, bitmask in zip(senior_ids, bitmasks):
+            path = self._weight_paths.get(senior_id)
+            if path is None:
+                self.no_weights += 1
+                continue
+            items.append((senior_id, bitmask, path))
+        if not items:
+            return []
+
+        loop = asyncio.get_running_loop()
+        raw_results = await loop.run_in_executor(
+            self._pool,
+            evaluate_batch,
+            items,
+            self.sensor_count,
+            self.warn_threshold,
+            self.danger_threshold,
+        )
+        self.evaluated += len(raw_results)
+
+        results = []
+        for senior_id, level_value, reason in raw_results:
+            level = RiskLevelEnum(level_value)
+            if self._last_levels.get(senior_id) == level:
+                continue
+            self._last_levels[senior_id] = level
+            results.append(AiTickResult(senior_id=senior_id, risk_level=level, reason=reason))
+        self.reported += len(results)
+        return results
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "seniors_with_weights": len(self._weight_paths),
+            "evaluated": self.evaluated,
+            "no_weights": self.no_weights,
+            "reported": self.reported,
+        }
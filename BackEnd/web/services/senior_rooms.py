@@ -0,0 +1,60 @@
+from typing import List
+
+from socketio.async_pubsub_manager import AsyncPubSubManager
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.modules.db_manager import RedisSessionManager
+from common.modules.log_manager import get_logger
+from common.modules.session_manager import SessionManager
+from common.modules.user_manager import UserManager
+from web.services.websocket import sio
+
+logger = get_logger(__name__)
+
+
+def senior_room(senior_id: int) -> str:
+    """어르신 한 명을 담당하는 직원(FE) 소켓들이 모이는 room 이름"""
+    return f"senior:{senior_id}"
+
+
+def staff_room(staff_id: int) -> str:
+    """직원 한 명의 FE 소켓들이 모이는 room 이름 (직원 단위로 묶은 알림용)"""
+    return f"staff:{staff_id}"
+
+
+async def join_care_senior_rooms(sid: str, staff_id: int, session: AsyncSession) -> List[int]:
+    """
+    FE 소켓을 직원 room과 직원이 담당하는 모든 어르신의 room에 입장시킵니다. (연결 인증 직후 호출)
+    연결이 끊기면 python-socketio가 모든 room에서 자동으로 퇴장시킵니다.
+
+    Returns:
+        List[int]: 입장한 어르신 ID 목록
+    """
+    senior_list = await UserManager(session).get_care_seniors(staff_id)
+    senior_ids = [senior.senior_id for senior in senior_list]
+    await sio.enter_room(sid, staff_room(staff_id))
+    for senior_id in senior_ids:
+        await sio.enter_room(sid, senior_room(senior_id))
+    return senior_ids
+
+
+async def join_senior_room_if_connected(
+    redis_session_manager: RedisSessionManager, staff_id: int, senior_id: int
+) -> None:
+    """
+    직원-어르신 연결이 커밋된 뒤, 직원이 접속 중이면 새 어르신의 room에 입장시킵니다.
+    접속 중이 아니면 다음 연결 시 join_care_senior_rooms에서 입장합니다.
+    다른 워커 프로세스에 연결된 소켓은 다중 노드 모드(SOCKETIO_REDIS_MANAGER)에서만 입장시킬 수 있고,
+    단일 노드 모드에서는 다음 연결 시 입장합니다. 입장에 실패해도 예외를 올리지 않습니다.
+    """
+    con_info = await SessionManager(redis_session_manager).get_session_by_staff_id(staff_id)
+    if con_info is None:
+        return
+    # 단일 노드 모드에서 이 워커에 없는(다른 워커 또는 이미 끊긴) sid는 입장시킬 수 없습니다.
+    if not isinstance(sio.manager, AsyncPubSubManager) and not sio.manager.is_connected(con_info.sid, "/"):
+        return
+    try:
+        await sio.enter_room(con_info.sid, senior_room(senior_id))
+    except (KeyError, ValueError) as e:
+        logger.warning("Failed to join senior room. staff_id: %s, senior_id: %s, sid: %s (%r)",
+                       staff_id, senior_id, con_info.sid, e)
@@ -1,12 +1,16 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
 from web.schemas.monitoring_schema import FrontendSensorItem, FrontendSensorStatusPayload, RiskLevel, SeniorStatus
 from common.modules.db_manager import RedisSessionManager
+from common.modules.log_manager import get_logger, sampled
+from web.schemas.ai_schmas import SeniorRiskAssessment
 from web.services.data_alarm import notify_senior_status_change
 
+logger = get_logger(__name__)
+
 
 class SeniorStatusManager:
     """어르신 상태를 관찰하고 Redis에 저장하는 클래스"""
@@ -45,7 +49,39 @@ class SeniorStatusManager:
 
         await notify_senior_status_change(senior_id, new_status)
 
-        print(f"✅ [상태 갱신] 어르신 ID: {senior_id}, 상태: {status.value}, 이유: {reason}")
+        logger.info("[상태 갱신] 어르신 ID: %s, 상태: %s, 이유: %s", senior_id, status.value, reason)
+
+    async def update_statuses(self, assessments: List[SeniorRiskAssessment]) -> List[SeniorStatus]:
+        """
+        여러 어르신의 현재 상태(위험도)를 Redis pipeline 한 번으로 갱신합니다.
+        알림은 보내지 않으므로 호출자가 notify_senior_status_batch로 보냅니다.
+
+        Returns:
+            List[SeniorStatus]: 저장한 어르신 상태 목록
+        """
+        if not assessments:
+            return []
+        redis_client = await self.red_sess.get_client()
+
+        korea_time = timezone(datetime.now().astimezone().utcoffset())
+        update_time = datetime.now(korea_time)
+
+        statuses = [
+            SeniorStatus(
+                senior_id=assessment.senior_id,
+                status=assessment.risk_level,
+                reason=assessment.reason,
+                last_updated=update_time,
+            )
+            for assessment in assessments
+        ]
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for new_status in statuses:
+                await pipe.hset(f"senior:{new_status.senior_id}:status", mapping=new_status.model_dump(mode='json'))
+            await pipe.execute()
+
+        logger.info("[상태 일괄 갱신] 어르신 수: %d", len(statuses))
+        return statuses
 
     async def get_status(self, senior_id: int) -> Optional[SeniorStatus]:
         """
@@ -78,77 +114,133 @@ class SeniorStatusManager:
         return SeniorStatus(**decoded_data)
     
 
+# 센서별 캐시 값과 비교해 값이 바뀐 센서만 기록하고, 바뀐 항목의 인덱스(0부터)를 반환합니다.
+# KEYS[1]: 어르신의 센서 상태 Hash / ARGV: 센서마다 sensor_id, 압축 값("값:epoch ms") 2개씩
+# 같은 센서가 한 페이로드에 여러 번 들어오면 순서대로 비교하므로 열림 -> 닫힘 같은 변화도 모두 반영됩니다.
+_APPLY_CHANGES_SCRIPT = """
+local changed = {}
+for i = 1, #ARGV, 2 do
+    local packed = ARGV[i + 1]
+    local current = redis.call('HGET', KEYS[1], ARGV[i])
+    if not current or string.sub(current, 1, 1) ~= string.sub(packed, 1, 1) then
+        redis.call('HSET', KEYS[1], ARGV[i], packed)
+        changed[#changed + 1] = (i - 1) / 2
+    end
+end
+return changed
+"""
+
+
 class SensorStatusManager:
-    """센서 상태를 Redis에 저장하고 관리하는 클래스"""
+    """
+    센서 상태를 Redis에 저장하고 관리하는 클래스
+
+    어르신 한 명의 센서 상태는 Hash 하나(sensor:state:{senior_id})에 센서별 필드로 저장합니다.
+    필드 값은 "값(0/1):마지막 갱신 epoch ms" 형식이며, sensor_type/location은 sensor_id에서 만듭니다.
+    따라서 조회는 키 스캔 없이 HGETALL 한 번으로 끝납니다.
+    (이전 sensor:status:{senior_id}:{sensor_id} 형식은 migrations.sensor_status_single_hash 로 옮깁니다.)
+    """
 
     def __init__(self, redis_session_manager:RedisSessionManager):
         self.red_sess = redis_session_manager
-        self.key_prefix = "sensor:status"
+        self.key_prefix = "sensor:state"
+        self._apply_changes_script = None
+
+    def _get_key(self, senior_id: int) -> str:
+        return f"{self.key_prefix}:{senior_id}"
+
+    @staticmethod
+    def pack_state(value: bool, last_updated: datetime) -> str:
+        """센서 값과 갱신 시각을 Hash 필드 값 하나로 압축합니다."""
+        return f"{1 if value else 0}:{int(last_updated.timestamp() * 1000)}"
+
+    @staticmethod
+    def unpack_state(sensor_id: str, packed: str) -> FrontendSensorItem:
+        """Hash 필드(sensor_id, 압축 값)를 FrontendSensorItem으로 복원합니다."""
+        value, _, epoch_ms = packed.partition(":")
+        sensor_type, _, location = sensor_id.partition("_")
+        return FrontendSensorItem(
+            sensor_id=sensor_id,
+            sensor_type=sensor_type,
+            location=location or "unknown",
+            value=value == "1",
+            last_updated=datetime.fromtimestamp(int(epoch_ms) / 1000, tz=timezone.utc),
+        )
 
-    def _get_key(self, senior_id: int, sensor_id: str) -> str:
-        return f"{self.key_prefix}:{senior_id}:{sensor_id}"
+    def _to_payload(self, senior_id: int, fields: Dict[str, str]) -> Optional[FrontendSensorStatusPayload]:
+        if not fields:
+            return None # 해당 어르신의 센서 데이터가 없음
+
+        sensor_items: List[FrontendSensorItem] = []
+        for sensor_id, packed in fields.items():
+            try:
+                sensor_items.append(self.unpack_state(sensor_id, packed))
+            except ValueError as e:
+                logger.warning("Error parsing sensor state %s:%s: %s", senior_id, sensor_id, e)
+        return FrontendSensorStatusPayload(senior_id=senior_id, sensors=sensor_items)
 
     async def update_all_sensor_statuses(self, payload: FrontendSensorStatusPayload):
         """
         [WRITE] FrontendSensorStatusPayload 전체를 받아 Redis에 모든 센서 상태를 저장/업데이트합니다.
         """
+        if not payload.sensors:
+            return
         red = await self.red_sess.get_client()
-        async with red.pipeline() as pipe:
-            for sensor_item in payload.sensors:
-                redis_key = self._get_key(payload.senior_id, sensor_item.sensor_id)
-                
-                data_to_store = {
-                    "sensor_type": sensor_item.sensor_type,
-                    "location": sensor_item.location,
-                    "value": "1" if sensor_item.value else "0",
-                    "last_updated": sensor_item.last_updated.isoformat()
-                }
-                await pipe.hset(redis_key, mapping=data_to_store)
-            
-            await pipe.execute()
-        
-        print(f"✅ Wrote {len(payload.sensors)} sensor statuses for senior_id: {payload.senior_id}")
+        await red.hset(
+            self._get_key(payload.senior_id),
+            mapping={
+                sensor_item.sensor_id: self.pack_state(sensor_item.value, sensor_item.last_updated)
+                for sensor_item in payload.sensors
+            },
+        )
+        logger.debug("Wrote %d sensor statuses for senior_id: %s", len(payload.sensors), payload.senior_id, extra=sampled())
 
-    async def get_all_sensor_statuses(self, senior_id: int) -> Optional[FrontendSensorStatusPayload]:
+    async def apply_sensor_changes(self, payload: FrontendSensorStatusPayload) -> FrontendSensorStatusPayload:
         """
-        [READ] senior_id에 해당하는 모든 센서 상태를 Redis에서 읽어
-        FrontendSensorStatusPayload 객체로 재구성하여 반환합니다.
+        [WRITE] 캐시된 센서 상태와 비교해 값이 바뀐 센서만 Redis에 저장합니다.
+        비교와 저장은 Lua 스크립트 한 번으로 원자적으로 수행됩니다.
+
+        Returns:
+            FrontendSensorStatusPayload: 값이 바뀐 센서만 담은 페이로드 (바뀐 센서가 없으면 sensors가 비어 있음)
         """
+        if not payload.sensors:
+            return payload
+
         red = await self.red_sess.get_client()
-        # 1. SCAN 명령어로 senior_id에 해당하는 모든 센서 키를 찾습니다.
-        #    KEYS 명령어보다 안전하고 효율적입니다.
-        key_pattern = f"{self.key_prefix}:{senior_id}:*"
-        sensor_keys = [key async for key in red.scan_iter(match=key_pattern)]
+        if self._apply_changes_script is None:
+            self._apply_changes_script = red.register_script(_APPLY_CHANGES_SCRIPT)
 
-        if not sensor_keys:
-            return None # 해당 어르신의 센서 데이터가 없음
+        args = []
+        for sensor_item in payload.sensors:
+            args.extend([sensor_item.sensor_id, self.pack_state(sensor_item.value, sensor_item.last_updated)])
 
-        # 2. Pipeline을 사용해 모든 키의 Hash 데이터를 한 번에 가져옵니다.
-        async with red.pipeline() as pipe:
-            for key in sensor_keys:
-                await pipe.hgetall(key)
-            results = await pipe.execute()
+        changed_indexes = await self._apply_changes_script(keys=[self._get_key(payload.senior_id)], args=args)
+        return FrontendSensorStatusPayload(
+            senior_id=payload.senior_id,
+            sensors=[payload.sensors[int(i)] for i in changed_indexes],
+        )
 
-        # 3. 가져온 데이터를 FrontendSensorItem 객체 리스트로 재구성합니다.
-        sensor_items: List[FrontendSensorItem] = []
-        for key, data in zip(sensor_keys, results):
-            if not data: continue
+    async def get_all_sensor_statuses(self, senior_id: int) -> Optional[FrontendSensorStatusPayload]:
+        """
+        [READ] senior_id에 해당하는 모든 센서 상태를 HGETALL 한 번으로 읽어
+        FrontendSensorStatusPayload 객체로 재구성하여 반환합니다.
+        """
+        red = await self.red_sess.get_client()
+        return self._to_payload(senior_id, await red.hgetall(self._get_key(senior_id)))
 
-            # 4. Redis 문자열 데이터를 파이썬 타입으로 역직렬화(Deserialization)합니다.
-            try:
-                sensor_id = key.split(':')[-1] # 키에서 sensor_id 추출
-                
-                sensor_item = FrontendSensorItem(
-                    sensor_id=sensor_id,
-                    sensor_type=data.get('sensor_type', 'unknown'),
-                    location=data.get('location', 'unknown'),
-                    value=data.get('value') == '1',
-                    last_updated=datetime.fromisoformat(data['last_updated'])
-                )
-                sensor_items.append(sensor_item)
-            except (KeyError, ValueError) as e:
-                print(f"⚠️ Error parsing data for key {key}: {e}")
-                continue
-        
-        # 5. 최종 페이로드 객체를 만들어 반환합니다.
-        return FrontendSensorStatusPayload(senior_id=senior_id, sensors=sensor_items)
\ No newline at end of file
+    async def get_many_sensor_statuses(
+        self, senior_ids: List[int]
+    ) -> Dict[int, Optional[FrontendSensorStatusPayload]]:
+        """
+        [READ] 여러 어르신의 센서 상태를 pipeline 한 번(어르신당 HGETALL)으로 읽습니다.
+        센서 데이터가 없는 어르신은 None입니다.
+        """
+        red = await self.red_sess.get_client()
+        async with red.pipeline(transaction=False) as pipe:
+            for senior_id in senior_ids:
+                await pipe.hgetall(self._get_key(senior_id))
+            results = await pipe.execute()
+        return {
+            senior_id: self._to_payload(senior_id, fields)
+            for senior_id, fields in zip(senior_ids, results)
+        }
@@ -0,0 +1,221 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import msgspec
+import numpy as np
+
+from common.models.enums import SensorTypeEnum
+from common.modules.db_manager import RedisSessionManager
+from common.modules.log_manager import get_logger
+from web.schemas.monitoring_schema import FrontendSensorItem, FrontendSensorStatusPayload
+
+logger = get_logger(__name__)
+
+# true 이면 센서 상태를 프로세스 내부 행렬에도 보관하고, AI tick/대시보드 조회가 Redis 대신 행렬을 읽습니다.
+SENSOR_STATE_MATRIX = os.getenv("SENSOR_STATE_MATRIX", "false").lower() == "true"
+SENSOR_STATE_CHANNEL = "sensor:state"
+# 전체 상태로 채운 행을 조회에 사용하는 최대 시간 (초). 지나면 Redis에서 다시 읽습니다. 0이면 다시 읽지 않습니다.
+# (pub/sub 메시지는 연결이 끊기면 유실될 수 있으므로, 유실된 변경도 이 시간 안에는 Redis 값으로 복구됩니다.)
+SENSOR_STATE_MATRIX_MAX_AGE = float(os.getenv("SENSOR_STATE_MATRIX_MAX_AGE", "60"))
+
+# 행렬의 열 순서 (SensorTypeEnum 정의 순서, AI tick 비트마스크의 비트 순서와 같습니다)
+SENSOR_COLUMNS: List[str] = [member.value for member in SensorTypeEnum]
+_column_index: Dict[str, int] = {sensor_id: index for index, sensor_id in enumerate(SENSOR_COLUMNS)}
+_column_bits = (np.uint32(1) << np.arange(len(SENSOR_COLUMNS), dtype=np.uint32)).astype(np.uint32)
+
+# 변경 메시지: [senior_id, [[열 번호, 값, epoch 초], ...]]
+_ChangeMessage = Tuple[int, List[Tuple[int, int, int]]]
+_message_decoder = msgspec.json.Decoder(_ChangeMessage)
+
+
+class SensorStateMatrix:
+    """
+    어르신 x 센서 상태를 보관하는 프로세스 내부 행렬
+
+    - values: uint8 (0/1), timestamps: uint32 (마지막 갱신 epoch 초, 0이면 값 없음)
+      센서 한 칸에 5바이트만 사용합니다.
+    - 행은 어르신이 처음 들어올 때 할당하고, 부족하면 두 배로 늘립니다.
+    - 변경분만 들어온 행은 다른 센서 값을 모르므로, Redis의 전체 상태로 한 번 채운(complete) 행만 조회에 사용합니다.
+      채운 지 max_age가 지난 행과, pub/sub을 (다시) 구독하거나 오류가 난 뒤의 모든 행은 조회 대상에서 빠지고
+      호출자가 Redis에서 다시 읽어 채웁니다. (유실된 pub/sub 메시지 복구)
+    - 여러 어르신의 상태(비트마스크 등)는 행 인덱스로 한 번에 잘라 계산합니다.
+    - 수신 파이프라인이 바뀐 센서를 publish()로 반영하고, 다른 워커가 받은 변경은 run()이 pub/sub으로 반영합니다.
+      늦게 도착한 오래된 값이 새 값을 덮어쓰지 않도록 timestamp가 같거나 최신일 때만 반영합니다.
+    """
+
+    def __init__(
+        self, capacity: int = 1024, channel: str = SENSOR_STATE_CHANNEL, max_age: float = SENSOR_STATE_MATRIX_MAX_AGE
+    ):
+        self.channel = channel
+        self.max_age = max_age
+        self.values = np.zeros((capacity, len(SENSOR_COLUMNS)), dtype=np.uint8)
+        self.timestamps = np.zeros((capacity, len(SENSOR_COLUMNS)), dtype=np.uint32)
+        self._row_by_senior: Dict[int, int] = {}
+        # 어르신 ID -> 전체 상태로 채운 시각 (monotonic)
+        self._complete: Dict[int, float] = {}
+        self._stopped = False
+
+        self.updates = 0
+        self.messages = 0
+        self.invalidations = 0
+
+    def _is_fresh(self, senior_id: int, now: float) -> bool:
+        filled_at = self._complete.get(senior_id)
+        return filled_at is not None and (self.max_age <= 0 or now - filled_at < self.max_age)
+
+    def __contains__(self, senior_id: int) -> bool:
+        """전체 상태가 채워져 있고 max_age가 지나지 않은 어르신인지 여부"""
+        return self._is_fresh(senior_id, time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._complete)
+
+    def _row(self, senior_id: int) -> int:
+        row = self._row_by_senior.get(senior_id)
+        if row is None:
+            row = len(self._row_by_senior)
+            if row >= self.values.shape[0]:
+                self.values = np.concatenate([self.values, np.zeros_like(self.values)])
+                self.timestamps = np.concatenate([self.timestamps, np.zeros_like(self.timestamps)])
+            self._row_by_senior[senior_id] = row
+        return row
+
+    def _apply_cells(self, senior_id: int, cells: Iterable[Tuple[int, int, int]]) -> None:
+        # 같은 센서가 여러 번 들어오면 가장 최근 값 하나만 남깁니다. (시각이 같으면 나중 값)
+        # NumPy 인덱스 대입은 중복 인덱스 중 어느 값이 남을지 보장하지 않기 때문입니다.
+        newest: Dict[int, Tuple[int, int]] = {}
+        for column, value, timestamp in cells:
+            if column not in newest or timestamp >= newest[column][1]:
+                newest[column] = (value, timestamp)
+        if not newest:
+            return
+        row = self._row(senior_id)
+        columns = np.fromiter(newest.keys(), dtype=np.intp, count=len(newest))
+        values, timestamps = (np.array(col) for col in zip(*newest.values()))
+        newer = timestamps >= self.timestamps[row, columns]
+        self.values[row, columns[newer]] = values[newer]
+        self.timestamps[row, columns[newer]] = timestamps[newer]
+        self.updates += int(newer.sum())
+
+    @staticmethod
+    def _to_cells(payload: FrontendSensorStatusPayload) -> List[Tuple[int, int, int]]:
+        return [
+            (_column_index[sensor.sensor_id], int(sensor.value), int(sensor.last_updated.timestamp()))
+            for sensor in payload.sensors
+            if sensor.sensor_id in _column_index
+        ]
+
+    def apply(self, payload: FrontendSensorStatusPayload, complete: bool = False) -> None:
+        """
+        센서 상태 페이로드를 행렬에 반영합니다.
+        complete=True 이면 어르신의 전체 상태(Redis 조회 결과)로 보고 조회 대상에 포함합니다.
+        """
+        self._apply_cells(payload.senior_id, self._to_cells(payload))
+        if complete:
+            self._row(payload.senior_id)
+            self._complete[payload.senior_id] = time.monotonic()
+
+    def invalidate(self) -> None:
+        """
+        모든 행을 조회 대상에서 뺍니다. 값은 그대로 두고, 다음 조회 때 Redis의 전체 상태로 다시 채웁니다.
+        (pub/sub을 구독하기 전이나 연결이 끊긴 동안의 변경은 메시지로 받을 수 없기 때문입니다.)
+        """
+        self._complete.clear()
+        self.invalidations += 1
+
+    def apply_message(self, data: str) -> None:
+        """pub/sub 변경 메시지를 반영합니다."""
+        senior_id, cells = _message_decoder.decode(data)
+        self._apply_cells(senior_id, cells)
+        self.messages += 1
+
+    def rows(self, senior_ids: Iterable[int]) -> Tuple[List[int], np.ndarray]:
+        """전체 상태가 채워진 어르신만 골라 (어르신 ID 목록, 행 인덱스 배열)을 반환합니다."""
+        now = time.monotonic()
+        found = [senior_id for senior_id in senior_ids if self._is_fresh(senior_id, now)]
+        return found, np.fromiter((self._row_by_senior[senior_id] for senior_id in found), dtype=np.intp, count=len(found))
+
+    def bitmasks(self, rows: np.ndarray) -> np.ndarray:
+        """행마다 켜진 센서를 SENSOR_COLUMNS 순서의 비트마스크(uint32)로 계산합니다."""
+        return (self.values[rows].astype(np.uint32) * _column_bits).sum(axis=1, dtype=np.uint32)
+
+    def sensor_values(self, senior_id: int) -> Optional[List[int]]:
+        """어르신 한 명의 센서 값 (SENSOR_COLUMNS 순서). 전체 상태가 채워지지 않았으면 None"""
+        if senior_id not in self:
+            return None
+        return self.values[self._row_by_senior[senior_id]].tolist()
+
+    def frontend_payload(self, senior_id: int) -> Optional[FrontendSensorStatusPayload]:
+        """대시보드용 센서 상태 페이로드를 만듭니다. 값이 들어온 적 있는 센서만 포함합니다."""
+        if senior_id not in self:
+            return None
+        row = self._row_by_senior[senior_id]
+        sensors = []
+        for column in np.flatnonzero(self.timestamps[row]):
+            sensor_id = SENSOR_COLUMNS[column]
+            sensor_type, _, location = sensor_id.partition("_")
+            sensors.append(
+                FrontendSensorItem(
+                    sensor_id=sensor_id,
+                    sensor_type=sensor_type,
+                    location=location or "unknown",
+                    value=bool(self.values[row, column]),
+                    last_updated=datetime.fromtimestamp(int(self.timestamps[row, column]), tz=timezone.utc),
+                )
+            )
+        return FrontendSensorStatusPayload(senior_id=senior_id, sensors=sensors)
+
+    async def publish(self, redis_session_manager: RedisSessionManager, payload: FrontendSensorStatusPayload) -> None:
+        """바뀐 센서를 현재 프로세스 행렬에 반영하고, 다른 워커에도 알립니다."""
+        cells = self._to_cells(payload)
+        if not cells:
+            return
+        self._apply_cells(payload.senior_id, cells)
+        redis_client = await redis_session_manager.get_client()
+        await redis_client.publish(self.channel, msgspec.json.encode([payload.senior_id, cells]))
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    async def run(self, redis_session_manager: RedisSessionManager) -> None:
+        """다른 워커가 받은 센서 변경을 pub/sub으로 반영합니다."""
+        redis_client = await redis_session_manager.get_client()
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        # 구독 전에 채운 행은 그 사이의 변경을 놓쳤을 수 있습니다.
+        self.invalidate()
+        logger.info("Sensor state matrix started. channel: %s", self.channel)
+        try:
+            while not self._stopped:
+                try:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        self.apply_message(message["data"])
+                except Exception as e:
+                    # ❗ 예외가 나도 갱신 작업이 멈추지 않도록 함
+                    logger.exception("An error occurred in sensor state matrix: %s", e)
+                    # 연결이 끊긴 동안의 메시지는 유실되므로 (재구독 후) 모든 행을 Redis에서 다시 읽습니다.
+                    self.invalidate()
+                    await asyncio.sleep(1)
+        finally:
+            await pubsub.unsubscribe(self.channel)
+            await pubsub.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "seniors": len(self._row_by_senior),
+            "complete_seniors": len(self._complete),
+            "capacity": self.values.shape[0],
+            "bytes": self.values.nbytes + self.timestamps.nbytes,
+            "updates": self.updates,
+            "messages": self.messages,
+            "invalidations": self.invalidations,
+            "max_age": self.max_age,
+        }
+
+
+# 프로세스 전체가 공유하는 센서 상태 행렬
+sensor_state_matrix = SensorStateMatrix()
@@ -0,0 +1,151 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import List, Optional
+
+import socketio
+
+from common.modules.db_manager import RedisSessionManager
+from common.modules.log_manager import get_logger
+from common.modules.session_manager import SESSION_TTL, SessionManager
+from web.services.database import red
+from web.services.websocket import sio
+
+logger = get_logger(__name__)
+
+# 연결된 소켓의 세션 만료 시간을 연장하는 간격 (초, Socket.IO 기본 ping 간격과 같음)
+SESSION_HEARTBEAT_INTERVAL = float(os.getenv("SESSION_HEARTBEAT_INTERVAL", "25"))
+# worker_id가 없는 이전 형식 세션에 설정할 만료 시간 (초). 롤링 배포 중 이전 코드 워커의 세션은 지우지 않고 만료되게 둡니다.
+SESSION_LEGACY_TTL = int(os.getenv("SESSION_LEGACY_TTL", "86400"))
+
+
+class SessionKeeper:
+    """
+    이 워커에 연결된 Socket.IO 소켓의 Redis 세션을 살아 있게 유지하고, 죽은 세션을 정리하는 클래스
+
+    - heartbeat: engine.io ping에 응답하지 않는 소켓은 python-socketio가 연결을 끊고 목록에서 빼므로,
+      목록에 남아 있는(살아 있는) 소켓의 세션만 주기적으로 만료 시간을 연장합니다.
+      연장되지 않은 세션(연결 종료 이벤트를 놓친 세션)은 SESSION_TTL 후 Redis에서 사라집니다.
+    - 워커 목록: 각 워커는 ZSET(worker_id -> 마지막 heartbeat 시각)에 자신을 등록합니다.
+    - sweep: 서버 시작 시 Redis의 세션을 살아 있는 워커/소켓과 맞춰 보고, 주인이 없는 세션을 바로 삭제합니다.
+      (재배포/비정상 종료 직후 TTL을 기다리지 않고 죽은 소켓으로 emit 하지 않도록)
+      worker_id가 없는 세션은 아직 이전 코드로 실행 중인 워커의 세션일 수 있으므로 삭제하지 않고,
+      만료 시간이 없을 때만 SESSION_LEGACY_TTL을 설정해 나중에 사라지게 합니다.
+    """
+
+    def __init__(
+        self,
+        server: socketio.AsyncServer,
+        redis_session_manager: RedisSessionManager,
+        worker_id: Optional[str] = None,
+        heartbeat_interval: float = SESSION_HEARTBEAT_INTERVAL,
+        ttl: int = SESSION_TTL,
+        legacy_ttl: int = SESSION_LEGACY_TTL,
+    ):
+        self.server = server
+        self.red_sess = redis_session_manager
+        self.session_man = SessionManager(redis_session_manager, ttl=ttl)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.heartbeat_interval = heartbeat_interval
+        self.ttl = ttl
+        self.legacy_ttl = legacy_ttl
+        # heartbeat를 세 번 연속 놓친 워커는 죽은 것으로 봅니다.
+        self.worker_ttl = heartbeat_interval * 3
+        self.key = "session:workers"
+        self._stopped = False
+
+        self.heartbeats = 0
+        self.refreshed = 0
+        self.swept = 0
+        self.legacy_expired = 0
+
+    def live_sids(self) -> List[str]:
+        """이 워커에 지금 연결되어 있는 소켓 sid 목록"""
+        return [sid for sid, _ in self.server.manager.get_participants("/", None)]
+
+    async def heartbeat(self) -> int:
+        """워커를 등록하고, 연결된 소켓들의 세션 만료 시간을 연장합니다."""
+        now = time.time()
+        redis_client = await self.red_sess.get_client()
+        async with redis_client.pipeline() as pipe:
+            await pipe.zadd(self.key, {self.worker_id: now})
+            await pipe.zremrangebyscore(self.key, "-inf", now - self.worker_ttl)
+            await pipe.execute()
+
+        refreshed = await self.session_man.refresh_sessions(self.live_sids())
+        self.heartbeats += 1
+        self.refreshed += refreshed
+        return refreshed
+
+    async def sweep(self) -> int:
+        """
+        살아 있는 워커/소켓이 없는 세션을 삭제합니다.
+
+        - 목록에 없는(heartbeat가 끊긴) 워커의 세션
+        - 이 워커의 세션이지만 지금 연결되어 있지 않은 소켓의 세션
+
+        worker_id가 없는 이전 형식 세션은 삭제하지 않고 만료 시간만 설정합니다.
+
+        Returns:
+            int: 삭제한 세션 수
+        """
+        redis_client = await self.red_sess.get_client()
+        live_workers = set(await redis_client.zrangebyscore(self.key, time.time() - self.worker_ttl, "+inf"))
+        live_sids = set(self.live_sids())
+
+        stale_sids = []
+        legacy_sids = []
+        async for session_info in self.session_man.scan_sessions():
+            if session_info.worker_id is None:
+                legacy_sids.append(session_info.sid)
+            elif session_info.worker_id not in live_workers or (
+                session_info.worker_id == self.worker_id and session_info.sid not in live_sids
+            ):
+                stale_sids.append(session_info.sid)
+
+        for sid in stale_sids:
+            await self.session_man.delete_session(sid)
+        self.swept += len(stale_sids)
+        self.legacy_expired += await self.session_man.expire_persistent_sessions(legacy_sids, self.legacy_ttl)
+        return len(stale_sids)
+
+    async def start(self) -> None:
+        """서버 시작 시 한 번 호출합니다. 워커를 먼저 등록해 다른 워커의 sweep에서 세션이 지워지지 않도록 합니다."""
+        await self.heartbeat()
+        swept = await self.sweep()
+        logger.info("Session sweep finished. removed %d stale session(s). worker: %s", swept, self.worker_id)
+
+    async def leave(self) -> None:
+        """종료 시 워커 목록에서 빠지고, 이 워커에 연결되어 있던 세션을 삭제합니다."""
+        redis_client = await self.red_sess.get_client()
+        await redis_client.zrem(self.key, self.worker_id)
+        for sid in self.live_sids():
+            await self.session_man.delete_session(sid)
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    async def run(self) -> None:
+        logger.info("Session keeper started. heartbeat: %ss, ttl: %ss", self.heartbeat_interval, self.ttl)
+        while not self._stopped:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.heartbeat()
+            except Exception as e:
+                # ❗ 예외가 나도 heartbeat가 멈추지 않도록 함
+                logger.exception("An error occurred in session keeper: %s", e)
+
+    def stats(self) -> dict:
+        return {
+            "worker_id": self.worker_id,
+            "live_sockets": len(self.live_sids()),
+            "heartbeats": self.heartbeats,
+            "refreshed": self.refreshed,
+            "swept": self.swept,
+            "legacy_expired": self.legacy_expired,
+        }
+
+
+session_keeper = SessionKeeper(sio, red)
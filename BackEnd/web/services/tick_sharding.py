@@ -0,0 +1,136 @@
+import asyncio
+import bisect
+import hashlib
+import os
+import socket
+import time
+import uuid
+from typing import Iterable, List, Optional, Sequence
+
+from common.modules.db_manager import RedisSessionManager
+from common.modules.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+# 워커 heartbeat 간격 (초)
+AI_TICK_WORKER_HEARTBEAT = float(os.getenv("AI_TICK_WORKER_HEARTBEAT", "5"))
+# 마지막 heartbeat 이후 이 시간이 지나면 죽은 워커로 보고 제외합니다. (초)
+AI_TICK_WORKER_TTL = float(os.getenv("AI_TICK_WORKER_TTL", "15"))
+# 워커당 해시 링 가상 노드 수 (많을수록 어르신이 고르게 나뉩니다)
+AI_TICK_VNODES = int(os.getenv("AI_TICK_VNODES", "64"))
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+
+class ConsistentHashRing:
+    """
+    워커 목록으로 만든 일관 해시 링
+    워커가 하나 추가/제거되면 약 1/N의 어르신만 담당 워커가 바뀝니다.
+    """
+
+    def __init__(self, members: Iterable[str], vnodes: int = AI_TICK_VNODES):
+        self.members = sorted(set(members))
+        self.vnodes = vnodes
+        points = sorted(
+            (_hash(f"{member}#{i}"), member) for member in self.members for i in range(vnodes)
+        )
+        self._points = [point for point, _ in points]
+        self._owners = [member for _, member in points]
+
+    def owner(self, senior_id: int) -> Optional[str]:
+        """어르신을 담당하는 워커 (링이 비어 있으면 None)"""
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, _hash(f"senior:{senior_id}")) % len(self._points)
+        return self._owners[index]
+
+
+class TickMembership:
+    """
+    AI tick을 실행하는 워커(프로세스/컨테이너)의 Redis 멤버십
+
+    각 워커는 ZSET(worker_id -> 마지막 heartbeat 시각)에 주기적으로 자신을 등록하고,
+    살아 있는 워커 목록으로 일관 해시 링을 만들어 자신이 담당하는 어르신만 tick 합니다.
+    워커가 종료되면 목록에서 빠지고, 비정상 종료된 워커는 ttl이 지나면 제외됩니다.
+    """
+
+    def __init__(
+        self,
+        redis_session_manager: RedisSessionManager,
+        worker_id: Optional[str] = None,
+        heartbeat_interval: float = AI_TICK_WORKER_HEARTBEAT,
+        ttl: float = AI_TICK_WORKER_TTL,
+        vnodes: int = AI_TICK_VNODES,
+    ):
+        self.red_sess = redis_session_manager
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.heartbeat_interval = heartbeat_interval
+        self.ttl = ttl
+        self.vnodes = vnodes
+        self.key = "ai:tick:workers"
+        self.ring = ConsistentHashRing([], vnodes)
+        self._stopped = False
+
+        self.heartbeats = 0
+        self.membership_changes = 0
+
+    async def heartbeat(self) -> None:
+        """자신을 등록하고, 만료된 워커를 지운 뒤 해시 링을 갱신합니다."""
+        now = time.time()
+        redis_client = await self.red_sess.get_client()
+        async with redis_client.pipeline() as pipe:
+            await pipe.zadd(self.key, {self.worker_id: now})
+            await pipe.zremrangebyscore(self.key, "-inf", now - self.ttl)
+            await pipe.zrange(self.key, 0, -1)
+            *_, members = await pipe.execute()
+        self.heartbeats += 1
+        self._update_ring(members)
+
+    def _update_ring(self, members: Sequence[str]) -> None:
+        if sorted(set(members)) != self.ring.members:
+            self.ring = ConsistentHashRing(members, self.vnodes)
+            self.membership_changes += 1
+            logger.info("AI tick workers changed: %d worker(s)", len(self.ring.members))
+
+    def owns(self, senior_id: int) -> bool:
+        return self.ring.owner(senior_id) == self.worker_id
+
+    async def filter_owned(self, senior_ids: Iterable[int]) -> List[int]:
+        """이 워커가 담당하는 어르신만 남깁니다. 아직 등록 전이면 먼저 등록합니다."""
+        if self.worker_id not in self.ring.members:
+            await self.heartbeat()
+        return [senior_id for senior_id in senior_ids if self.owns(senior_id)]
+
+    async def leave(self) -> None:
+        """종료 시 목록에서 빠져 다른 워커가 바로 담당을 넘겨받도록 합니다."""
+        redis_client = await self.red_sess.get_client()
+        await redis_client.zrem(self.key, self.worker_id)
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    async def run(self) -> None:
+        logger.info("AI tick membership started. worker: %s", self.worker_id)
+        try:
+            while not self._stopped:
+                try:
+                    await self.heartbeat()
+                except Exception as e:
+                    # ❗ 예외가 나도 heartbeat가 멈추지 않도록 함
+                    logger.exception("An error occurred in AI tick membership: %s", e)
+                await asyncio.sleep(self.heartbeat_interval)
+        finally:
+            try:
+                await self.leave()
+            except Exception as e:
+                logger.error("AI tick membership leave failed: %s", e)
+
+    def stats(self) -> dict:
+        return {
+            "worker_id": self.worker_id,
+            "workers": len(self.ring.members),
+            "heartbeats": self.heartbeats,
+            "membership_changes": self.membership_changes,
+        }
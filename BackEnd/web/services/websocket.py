@@ -1,4 +1,34 @@
+import os
+from typing import Optional
+from urllib.parse import quote
+
 import socketio
 
+# true 이면 여러 워커/컨테이너가 Redis pub/sub으로 emit과 room 입장을 주고받습니다. (다중 노드 모드)
+# 어느 노드에서 emit 하든 다른 노드에 연결된 소켓까지 전달됩니다.
+# long-polling 연결은 같은 노드로 계속 가야 하므로 로드밸런서에 sticky session 설정이 필요합니다.
+# (exec/BackEnd_PORTING_MANUAL.md 참고)
+SOCKETIO_REDIS_MANAGER = os.getenv("SOCKETIO_REDIS_MANAGER", "false").lower() == "true"
+SOCKETIO_REDIS_CHANNEL = os.getenv("SOCKETIO_REDIS_CHANNEL", "socketio")
+
+
+def redis_manager_url() -> str:
+    """REDIS_* 설정으로 Socket.IO Redis 매니저 접속 URL을 만듭니다. (SOCKETIO_REDIS_URL이 있으면 우선)"""
+    url = os.getenv("SOCKETIO_REDIS_URL")
+    if url:
+        return url
+    password = os.getenv("REDIS_PASSWORD")
+    auth = f":{quote(password, safe='')}@" if password else ""
+    return f"redis://{auth}{os.getenv('REDIS_HOST', 'localhost')}:{os.getenv('REDIS_PORT', '6379')}/0"
+
+
+def create_client_manager() -> Optional[socketio.AsyncRedisManager]:
+    if not SOCKETIO_REDIS_MANAGER:
+        return None
+    return socketio.AsyncRedisManager(redis_manager_url(), channel=SOCKETIO_REDIS_CHANNEL)
+
+
 # Socket.IO 서버 인스턴스를 여기서 생성합니다.
-sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins='*')
\ No newline at end of file
+sio = socketio.AsyncServer(
+    async_mode='asgi', cors_allowed_origins='*', client_manager=create_client_manager()
+)
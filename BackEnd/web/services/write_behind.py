@@ -0,0 +1,16 @@
+import os
+
+from common.modules.sensor_log_queue import SensorLogFlusher, SensorLogQueue
+from web.services.database import db, red
+
+# SENSOR_LOG_WRITE_BEHIND=true 이면 /iot/logs 는 로그를 Redis Stream에 적재만 하고 바로 응답하며,
+# 실제 INSERT는 백그라운드 flusher가 여러 허브의 로그를 모아 수행합니다.
+SENSOR_LOG_WRITE_BEHIND = os.getenv("SENSOR_LOG_WRITE_BEHIND", "false").lower() == "true"
+
+sensor_log_queue = SensorLogQueue(red)
+sensor_log_flusher = SensorLogFlusher(db, red)
+
+
+def get_write_queue():
+    """write-behind 모드일 때만 SensorLogManager에 넘길 큐를 반환합니다."""
+    return sensor_log_queue if SENSOR_LOG_WRITE_BEHIND else None